@@ -0,0 +1,29 @@
+"""add composite lookup index for access token revocations
+
+Revision ID: 20260301_0007
+Revises: 20260214_0006
+Create Date: 2026-03-01 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260301_0007"
+down_revision = "20260214_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_access_revocations_user_jti_expires",
+        "auth_access_token_revocations",
+        ["user_id", "jti", "expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_access_revocations_user_jti_expires", table_name="auth_access_token_revocations")
@@ -0,0 +1,32 @@
+"""add covering partial index for active refresh token lookups
+
+Revision ID: 20260302_0008
+Revises: 20260301_0007
+Create Date: 2026-03-02 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260302_0008"
+down_revision = "20260301_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_refresh_tokens_active_user_jti",
+        "auth_refresh_tokens",
+        ["user_id", "jti"],
+        unique=False,
+        postgresql_include=["token_hash"],
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_active_user_jti", table_name="auth_refresh_tokens")
@@ -0,0 +1,42 @@
+"""add materialized view of 30-day listing price medians
+
+Revision ID: 20260305_0009
+Revises: 20260302_0008
+Create Date: 2026-03-05 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260305_0009"
+down_revision = "20260302_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_complex_price_baseline AS
+        SELECT
+            complex_no,
+            trade_type_name,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY deal_price_manwon) AS median_price_manwon,
+            count(*) AS listing_count
+        FROM listing_snapshots
+        WHERE observed_at >= now() - interval '30 days'
+          AND deal_price_manwon IS NOT NULL
+          AND trade_type_name IS NOT NULL
+        GROUP BY complex_no, trade_type_name
+        """
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index on the view.
+    op.execute(
+        "CREATE UNIQUE INDEX ux_mv_complex_price_baseline ON mv_complex_price_baseline (complex_no, trade_type_name)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_complex_price_baseline")
@@ -0,0 +1,31 @@
+"""add covering index for enabled watch lookups per user
+
+Revision ID: 20260306_0010
+Revises: 20260305_0009
+Create Date: 2026-03-06 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260306_0010"
+down_revision = "20260305_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_watch_user_enabled_created",
+        "user_watch_complexes",
+        ["user_id", "enabled", sa.text("created_at DESC")],
+        unique=False,
+        postgresql_include=["complex_no", "complex_name"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_watch_user_enabled_created", table_name="user_watch_complexes")
@@ -0,0 +1,30 @@
+"""add composite index for latest crawl run lookups
+
+Revision ID: 20260308_0011
+Revises: 20260306_0010
+Create Date: 2026-03-08 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260308_0011"
+down_revision = "20260306_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_crawl_runs_complex_status_started",
+        "crawl_runs",
+        ["complex_no", "status", sa.text("started_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_crawl_runs_complex_status_started", table_name="crawl_runs")
@@ -0,0 +1,39 @@
+"""store refresh token jti as uuid and token hash as raw bytes
+
+Revision ID: 20260310_0012
+Revises: 20260308_0011
+Create Date: 2026-03-10 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260310_0012"
+down_revision = "20260308_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing jti values are uuid4 strings and token hashes are hex SHA-256 digests, so both cast losslessly.
+    op.execute(
+        """
+        ALTER TABLE auth_refresh_tokens
+            ALTER COLUMN jti TYPE uuid USING jti::uuid,
+            ALTER COLUMN replaced_by_jti TYPE uuid USING replaced_by_jti::uuid,
+            ALTER COLUMN token_hash TYPE bytea USING decode(token_hash, 'hex')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE auth_refresh_tokens
+            ALTER COLUMN jti TYPE varchar(64) USING jti::text,
+            ALTER COLUMN replaced_by_jti TYPE varchar(64) USING replaced_by_jti::text,
+            ALTER COLUMN token_hash TYPE varchar(128) USING encode(token_hash, 'hex')
+        """
+    )
@@ -0,0 +1,30 @@
+"""add covering index for listings of a run filtered by trade type
+
+Revision ID: 20260312_0013
+Revises: 20260310_0012
+Create Date: 2026-03-12 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260312_0013"
+down_revision = "20260310_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_listing_run_trade",
+        "listing_snapshots",
+        ["crawl_run_id", "trade_type_name"],
+        unique=False,
+        postgresql_include=["deal_price_manwon", "rent_price_manwon", "article_no"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_listing_run_trade", table_name="listing_snapshots")
@@ -0,0 +1,31 @@
+"""add partial index for sale listing price range scans
+
+Revision ID: 20260314_0014
+Revises: 20260312_0013
+Create Date: 2026-03-14 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260314_0014"
+down_revision = "20260312_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_listing_deal_price_sale",
+        "listing_snapshots",
+        ["complex_no", "observed_at", "deal_price_manwon"],
+        unique=False,
+        postgresql_where=sa.text("trade_type_name = '매매' AND deal_price_manwon IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_listing_deal_price_sale", table_name="listing_snapshots")
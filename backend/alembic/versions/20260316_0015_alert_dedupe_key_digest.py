@@ -0,0 +1,30 @@
+"""store alert dedupe keys as 16-byte md5 digests
+
+Revision ID: 20260316_0015
+Revises: 20260314_0014
+Create Date: 2026-03-16 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260316_0015"
+down_revision = "20260314_0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same digest as alerts._dedupe_digest, so already-sent alerts keep deduplicating after the upgrade.
+    op.execute(
+        "ALTER TABLE alert_dispatch_logs ALTER COLUMN dedupe_key TYPE bytea USING decode(md5(dedupe_key), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    # Digests cannot be reversed; keep them as hex so the column is text again.
+    op.execute(
+        "ALTER TABLE alert_dispatch_logs ALTER COLUMN dedupe_key TYPE varchar(200) USING encode(dedupe_key, 'hex')"
+    )
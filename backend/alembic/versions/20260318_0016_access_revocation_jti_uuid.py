@@ -0,0 +1,34 @@
+"""store access revocation jti as uuid and drop duplicate jti indexes
+
+Revision ID: 20260318_0016
+Revises: 20260316_0015
+Create Date: 2026-03-18 00:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260318_0016"
+down_revision = "20260316_0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The uq_*_jti unique constraints already index jti; the plain indexes only doubled write cost.
+    op.drop_index("ix_auth_access_token_revocations_jti", table_name="auth_access_token_revocations")
+    op.drop_index("ix_auth_refresh_tokens_jti", table_name="auth_refresh_tokens")
+    op.execute("ALTER TABLE auth_access_token_revocations ALTER COLUMN jti TYPE uuid USING jti::uuid")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE auth_access_token_revocations ALTER COLUMN jti TYPE varchar(64) USING jti::text")
+    op.create_index("ix_auth_refresh_tokens_jti", "auth_refresh_tokens", ["jti"], unique=False)
+    op.create_index(
+        "ix_auth_access_token_revocations_jti",
+        "auth_access_token_revocations",
+        ["jti"],
+        unique=False,
+    )
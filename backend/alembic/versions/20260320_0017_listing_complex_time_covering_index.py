@@ -0,0 +1,36 @@
+"""add covering index for per-complex listing time range scans
+
+Revision ID: 20260320_0017
+Revises: 20260318_0016
+Create Date: 2026-03-20 00:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260320_0017"
+down_revision = "20260318_0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trend and baseline queries filter (complex_no, observed_at) and only read price/trade type columns,
+    # so including them lets Postgres answer those scans index-only.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_snap_complex_time_cover",
+            "listing_snapshots",
+            ["complex_no", sa.text("observed_at DESC")],
+            unique=False,
+            postgresql_include=["deal_price_manwon", "rent_price_manwon", "trade_type_name"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_snap_complex_time_cover", table_name="listing_snapshots", postgresql_concurrently=True)
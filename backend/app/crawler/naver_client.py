@@ -1,14 +1,29 @@
 import json
 import random
+import threading
 import time
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+from cachetools import TTLCache
+
 from app.settings import Settings
 
+# Short-lived, process-wide cache so concurrent viewers of one complex share a single upstream call.
+_ARTICLES_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_ARTICLES_CACHE_LOCK = threading.Lock()
+_ARTICLES_KEY_LOCKS: dict[tuple[int, int], threading.Lock] = {}
+
+
+def clear_articles_cache() -> None:
+    with _ARTICLES_CACHE_LOCK:
+        _ARTICLES_CACHE.clear()
+        _ARTICLES_KEY_LOCKS.clear()
+
 
 @dataclass(slots=True)
 class NaverLandClient:
@@ -72,6 +87,30 @@ class NaverLandClient:
         headers = self._default_headers(referer=referer)
         return self._request_json(url=url, headers=headers)
 
+    def fetch_complex_articles_cached(self, complex_no: int, page: int = 1) -> dict[str, Any]:
+        key = (complex_no, page)
+        with _ARTICLES_CACHE_LOCK:
+            cached = _ARTICLES_CACHE.get(key)
+            if cached is not None:
+                return cached
+            key_lock = _ARTICLES_KEY_LOCKS.setdefault(key, threading.Lock())
+
+        # Single-flight: only one thread per key hits upstream, the rest wait and reuse its result.
+        with key_lock:
+            with _ARTICLES_CACHE_LOCK:
+                cached = _ARTICLES_CACHE.get(key)
+            if cached is not None:
+                return cached
+            try:
+                payload = self.fetch_complex_articles(complex_no=complex_no, page=page)
+                with _ARTICLES_CACHE_LOCK:
+                    _ARTICLES_CACHE[key] = payload
+            finally:
+                # Drop the key lock on failure too, so errored keys do not accumulate.
+                with _ARTICLES_CACHE_LOCK:
+                    _ARTICLES_KEY_LOCKS.pop(key, None)
+            return payload
+
     def search_complexes(self, keyword: str, limit: int = 10) -> list[dict[str, Any]]:
         normalized_keyword = keyword.strip()
         if len(normalized_keyword) < 2:
@@ -195,21 +234,20 @@ class NaverLandClient:
         return normalized
 
     @staticmethod
-    def summarize_articles(payload: dict[str, Any]) -> list[dict[str, Any]]:
-        articles = payload.get("articleList", [])
-        summary: list[dict[str, Any]] = []
-        for item in articles:
-            summary.append(
-                {
-                    "article_no": item.get("articleNo"),
-                    "article_name": item.get("articleName"),
-                    "trade_type": item.get("tradeTypeName"),
-                    "price": item.get("dealOrWarrantPrc"),
-                    "rent_price": item.get("rentPrc"),
-                    "floor_info": item.get("floorInfo"),
-                    "area_m2": item.get("area1"),
-                    "direction": item.get("direction"),
-                    "confirmed_at": item.get("articleConfirmYmd"),
-                }
-            )
-        return summary
+    def summarize_articles(payload: dict[str, Any], limit: int | None = None) -> list[dict[str, Any]]:
+        # The payload is cached and shared, so the limit only bounds how many summaries are built.
+        articles = islice(payload.get("articleList", []), limit)
+        return [
+            {
+                "article_no": item.get("articleNo"),
+                "article_name": item.get("articleName"),
+                "trade_type": item.get("tradeTypeName"),
+                "price": item.get("dealOrWarrantPrc"),
+                "rent_price": item.get("rentPrc"),
+                "floor_info": item.get("floorInfo"),
+                "area_m2": item.get("area1"),
+                "direction": item.get("direction"),
+                "confirmed_at": item.get("articleConfirmYmd"),
+            }
+            for item in articles
+        ]
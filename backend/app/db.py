@@ -1,5 +1,8 @@
 from collections.abc import Generator
+from typing import Any
 
+import orjson
+from fastapi import Depends
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
@@ -12,28 +15,74 @@ class Base(DeclarativeBase):
 
 
 engine: Engine | None = None
+read_engine: Engine | None = None
 SessionLocal = sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False)
+ReadSessionLocal = sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+def _json_serializer(value: Any) -> str:
+    # JSONB binds (listing_meta, alert payloads) go through orjson instead of stdlib json.dumps;
+    # OPT_NON_STR_KEYS keeps json.dumps' handling of int keys.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
 
 def get_engine() -> Engine:
     global engine
     if engine is None:
         settings = get_settings()
-        engine = create_engine(settings.database_url, pool_pre_ping=True)
+        # Sized to cover FastAPI's worker threadpool so sync handlers do not queue on pool checkout.
+        engine = create_engine(
+            settings.database_url,
+            pool_pre_ping=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+        )
     return engine
 
 
+def get_read_engine() -> Engine | None:
+    global read_engine
+    settings = get_settings()
+    if settings.database_read_url is None:
+        return None
+    if read_engine is None:
+        read_engine = create_engine(
+            settings.database_read_url,
+            pool_pre_ping=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            execution_options={"postgresql_readonly": True},
+        )
+    return read_engine
+
+
 def get_session_factory() -> sessionmaker:
     SessionLocal.configure(bind=get_engine())
     return SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
-    db = get_session_factory()()
-    try:
+    with get_session_factory()() as db:
+        yield db
+
+
+def get_read_db(db: Session = Depends(get_db)) -> Generator[Session, None, None]:
+    # Without a replica, reuse the request's primary session rather than checking out a second connection.
+    replica = get_read_engine()
+    if replica is None:
         yield db
-    finally:
-        db.close()
+        return
+    ReadSessionLocal.configure(bind=replica)
+    with ReadSessionLocal() as read_db:
+        yield read_db
 
 
 def init_db() -> None:
@@ -1,19 +1,35 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import re
 import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeVar
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request, status
-from fastapi.responses import HTMLResponse
+import anyio
+import orjson
+from cachetools import TTLCache
+from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import func, select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased
 
 from app.crawler.naver_client import NaverLandClient
-from app.db import get_db, init_db
+from app.db import get_db, get_read_db, get_session_factory, init_db
 from app.models import (
     AuthAccessTokenRevocation,
     AuthEmailVerificationToken,
@@ -24,14 +40,19 @@ from app.models import (
     User,
     UserNotificationSetting,
     UserPreset,
+    UserSubscription,
     UserWatchComplex,
+    uuid7,
 )
+from app.responses import ORJSONResponse
 from app.services.alerts import dispatch_user_bargain_alerts
 from app.services.analytics import (
     detect_bargains,
+    detect_bargains_bulk,
     fetch_compare_trend,
     fetch_complex_trend,
     normalize_trade_type_name,
+    refresh_price_baseline_view_after_ingest,
 )
 from app.services.auth import (
     create_access_token,
@@ -40,11 +61,21 @@ from app.services.auth import (
     decode_refresh_token,
     hash_password,
     hash_token,
-    maybe_rehash_password,
+    hash_token_digest,
+    password_needs_rehash,
     verify_password,
 )
+from app.services.auth_cache import (
+    AccessClaims,
+    get_cached_access_claims,
+    is_access_jti_revoked,
+    remember_access_claims,
+    remember_access_jti_revoked,
+)
 from app.services.billing import (
     BillingError,
+    build_entitlements,
+    build_free_subscription,
     complete_dummy_checkout_session,
     create_dummy_checkout_session,
     enforce_compare_limit,
@@ -52,49 +83,104 @@ from app.services.billing import (
     enforce_preset_limit,
     enforce_watch_complex_limit,
     ensure_user_subscription,
+    get_cached_user_entitlements,
     get_user_entitlements,
+    remember_user_entitlements,
 )
 from app.services.ingest import ingest_complex_snapshot
 from app.services.notifier import send_email_message
 from app.settings import get_settings
 
 settings = get_settings()
-REGISTER_ATTEMPTS: dict[str, list[datetime]] = {}
+# Auth settings are immutable after startup; bind them once for the per-request token paths.
+_AUTH_SECRET_KEY = settings.auth_secret_key
+_AUTH_JWT_ALGORITHM = settings.auth_jwt_algorithm
+_AUTH_JWT_ALGORITHMS = [settings.auth_jwt_algorithm]
+_AUTH_JWT_ISSUER = settings.auth_jwt_issuer
+_AUTH_ACCESS_TOKEN_TTL_MINUTES = settings.auth_access_token_ttl_minutes
+_AUTH_REFRESH_TOKEN_TTL_DAYS = settings.auth_refresh_token_ttl_days
+# Per-process sliding window; with several API workers each enforces its own share of the limit.
+REGISTER_ATTEMPTS: dict[str, deque[float]] = {}
+REGISTER_ATTEMPTS_LOCK = threading.Lock()
+REGISTER_ATTEMPTS_MAX_KEYS = 10_000
+_EXPECTED_INVITE_CODE = (settings.auth_register_invite_code or "").strip().encode("utf-8") or None
+_TIME_RE = re.compile(r"([01][0-9]|2[0-3]):[0-5][0-9]")
+# Scheduler config is read on every collection-status poll but only changes via PUT /scheduler/config;
+# other workers pick up a change within the TTL.
+_SCHEDULER_SNAPSHOT_CACHE: TTLCache = TTLCache(maxsize=1, ttl=30)
+_SCHEDULER_SNAPSHOT_LOCK = threading.Lock()
+_PASSWORD_HASH_LIMITER: anyio.CapacityLimiter | None = None
+_UPSTREAM_FETCH_LIMITER: anyio.CapacityLimiter | None = None
+T = TypeVar("T")
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
+    default_response_class=ORJSONResponse,
 )
 web_dir = Path(__file__).parent / "web"
 app.mount("/web", StaticFiles(directory=web_dir), name="web")
 
 
+def _token_from_header(authorization: str | None) -> str | None:
+    # HTTP servers already trim surrounding whitespace from header values.
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    return authorization.removeprefix("Bearer ")
+
+
 def _extract_bearer_token(authorization: str | None) -> str:
     if not authorization:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authorization header is required")
-    if not authorization.startswith("Bearer "):
+    token = _token_from_header(authorization)
+    if token is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Bearer token is required")
-    return authorization.split(" ", 1)[1].strip()
+    return token
 
 
-def _decode_access_token_claims(token: str) -> tuple[UUID, str, int] | None:
+def _decode_access_token_claims(token: str) -> AccessClaims | None:
+    cached = get_cached_access_claims(token)
+    if cached is not None:
+        return cached
+
     payload = decode_token(
         token=token,
-        secret_key=settings.auth_secret_key,
-        algorithms=[settings.auth_jwt_algorithm],
-        issuer=settings.auth_jwt_issuer,
+        secret_key=_AUTH_SECRET_KEY,
+        algorithms=_AUTH_JWT_ALGORITHMS,
+        issuer=_AUTH_JWT_ISSUER,
     )
     if payload is None or payload.get("type") != "access":
         return None
     try:
         user_id = UUID(str(payload.get("sub")))
-        jti = str(payload.get("jti"))
+        jti = UUID(str(payload.get("jti")))
         exp_ts = int(payload.get("exp"))
     except (TypeError, ValueError):
         return None
-    if not jti:
-        return None
-    return user_id, jti, exp_ts
+    claims = AccessClaims(user_id=user_id, jti=jti, exp_ts=exp_ts)
+    remember_access_claims(token, claims)
+    return claims
+
+
+def _load_user_for_token(db: Session, claims: AccessClaims) -> tuple[User | None, bool]:
+    """Return (user, revoked) for verified claims, consulting the in-process revocation cache first."""
+    cached_revoked = is_access_jti_revoked(claims.jti)
+    if cached_revoked:
+        return None, True
+    if cached_revoked is False:
+        return db.get(User, claims.user_id), False
+
+    # One round-trip: the user row plus whether this jti has been revoked. Revocation rows cascade with
+    # their user, so a missing user cannot hide a revocation.
+    revoked = exists().where(
+        AuthAccessTokenRevocation.user_id == claims.user_id,
+        AuthAccessTokenRevocation.jti == claims.jti,
+        AuthAccessTokenRevocation.expires_at >= func.now(),
+    )
+    row = db.execute(select(User, revoked.label("revoked")).where(User.id == claims.user_id)).one_or_none()
+    user, is_revoked = (row[0], bool(row[1])) if row is not None else (None, False)
+    remember_access_jti_revoked(claims.jti, revoked=is_revoked)
+    return user, is_revoked
 
 
 def get_current_user(
@@ -102,46 +188,85 @@ def get_current_user(
     db: Session = Depends(get_db),
 ) -> User:
     token = _extract_bearer_token(authorization)
-    decoded = _decode_access_token_claims(token)
-    if decoded is None:
+    claims = _decode_access_token_claims(token)
+    if claims is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
-    user_id, jti, _exp_ts = decoded
 
-    revoked = db.scalar(
-        select(AuthAccessTokenRevocation.id).where(
-            AuthAccessTokenRevocation.user_id == user_id,
-            AuthAccessTokenRevocation.jti == jti,
-            AuthAccessTokenRevocation.expires_at >= datetime.now(UTC),
-        )
-    )
-    if revoked is not None:
+    user, revoked = _load_user_for_token(db=db, claims=claims)
+    if revoked:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
-
-    user = db.get(User, user_id)
     if user is None or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
     return user
 
 
-def _issue_auth_tokens(db: Session, user_id: Any) -> tuple[dict[str, str | int], str]:
+@dataclass(slots=True, frozen=True)
+class RequestContext:
+    notification_setting: UserNotificationSetting | None
+    entitlements: dict[str, object]
+
+
+def load_request_context(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> RequestContext:
+    cached = getattr(request.state, "request_context", None)
+    if cached is not None:
+        return cached
+
+    setting, subscription = db.execute(
+        select(UserNotificationSetting, UserSubscription)
+        .select_from(User)
+        .outerjoin(UserNotificationSetting, UserNotificationSetting.user_id == User.id)
+        .outerjoin(UserSubscription, UserSubscription.user_id == User.id)
+        .where(User.id == current_user.id)
+    ).one()
+    if subscription is None:
+        subscription = ensure_user_subscription(db=db, user_id=current_user.id)
+
+    context = RequestContext(notification_setting=setting, entitlements=build_entitlements(subscription))
+    remember_user_entitlements(user_id=current_user.id, entitlements=context.entitlements)
+    request.state.request_context = context
+    return context
+
+
+def load_entitlements(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> dict[str, object]:
+    context = getattr(request.state, "request_context", None)
+    if context is not None:
+        return context.entitlements
+    cached = getattr(request.state, "entitlements", None)
+    if cached is not None:
+        return cached
+
+    entitlements = get_cached_user_entitlements(db=db, user_id=current_user.id)
+    request.state.entitlements = entitlements
+    return entitlements
+
+
+def _issue_auth_tokens(db: Session, user_id: Any) -> tuple[dict[str, str | int], UUID]:
     access_token, access_exp_ts = create_access_token(
         user_id=user_id,
-        secret_key=settings.auth_secret_key,
-        algorithm=settings.auth_jwt_algorithm,
-        issuer=settings.auth_jwt_issuer,
-        ttl_minutes=settings.auth_access_token_ttl_minutes,
+        secret_key=_AUTH_SECRET_KEY,
+        algorithm=_AUTH_JWT_ALGORITHM,
+        issuer=_AUTH_JWT_ISSUER,
+        ttl_minutes=_AUTH_ACCESS_TOKEN_TTL_MINUTES,
     )
     refresh_token, refresh_jti, refresh_exp_ts = create_refresh_token(
         user_id=user_id,
-        secret_key=settings.auth_secret_key,
-        algorithm=settings.auth_jwt_algorithm,
-        issuer=settings.auth_jwt_issuer,
-        ttl_days=settings.auth_refresh_token_ttl_days,
+        secret_key=_AUTH_SECRET_KEY,
+        algorithm=_AUTH_JWT_ALGORITHM,
+        issuer=_AUTH_JWT_ISSUER,
+        ttl_days=_AUTH_REFRESH_TOKEN_TTL_DAYS,
     )
     refresh_record = AuthRefreshToken(
         user_id=user_id,
         jti=refresh_jti,
-        token_hash=hash_token(refresh_token),
+        token_hash=hash_token_digest(refresh_token),
         expires_at=datetime.fromtimestamp(refresh_exp_ts, tz=UTC),
     )
     db.add(refresh_record)
@@ -189,6 +314,12 @@ def _parse_csv_ints(raw: str) -> list[int]:
     return result
 
 
+def _normalize_email(email: str) -> str:
+    # Stored emails are already normalized this way, so lookups hit the plain unique index on users.email.
+    # lower() rather than casefold() keeps existing non-ASCII addresses matching their stored form.
+    return email.strip().lower()
+
+
 def _resolve_client_key(request: Request, x_forwarded_for: str | None) -> str:
     if x_forwarded_for:
         first = x_forwarded_for.split(",")[0].strip()
@@ -199,40 +330,42 @@ def _resolve_client_key(request: Request, x_forwarded_for: str | None) -> str:
     return "unknown"
 
 
+def _evict_stale_register_attempts(cutoff_ts: float) -> None:
+    stale_keys = [key for key, attempts in REGISTER_ATTEMPTS.items() if not attempts or attempts[-1] < cutoff_ts]
+    for key in stale_keys:
+        del REGISTER_ATTEMPTS[key]
+
+
 def _enforce_registration_rate_limit(client_key: str) -> None:
     limit = settings.auth_register_rate_limit_per_window
-    window = timedelta(minutes=settings.auth_register_rate_limit_window_minutes)
-    now = datetime.now(UTC)
-    attempts = REGISTER_ATTEMPTS.setdefault(client_key, [])
-    cutoff = now - window
-    attempts[:] = [ts for ts in attempts if ts >= cutoff]
-    if len(attempts) >= limit:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="회원가입 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
-        )
-    attempts.append(now)
+    window_seconds = settings.auth_register_rate_limit_window_minutes * 60
+    now_ts = time.time()
+    cutoff_ts = now_ts - window_seconds
+    with REGISTER_ATTEMPTS_LOCK:
+        attempts = REGISTER_ATTEMPTS.get(client_key)
+        if attempts is None:
+            if len(REGISTER_ATTEMPTS) >= REGISTER_ATTEMPTS_MAX_KEYS:
+                _evict_stale_register_attempts(cutoff_ts)
+            attempts = REGISTER_ATTEMPTS.setdefault(client_key, deque())
+        while attempts and attempts[0] < cutoff_ts:
+            attempts.popleft()
+        if len(attempts) >= limit:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="회원가입 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            )
+        attempts.append(now_ts)
 
 
 def _resolve_optional_current_user(authorization: str | None, db: Session) -> User | None:
-    if not authorization or not authorization.startswith("Bearer "):
-        return None
-    token = authorization.split(" ", 1)[1].strip()
-    decoded = _decode_access_token_claims(token)
-    if decoded is None:
+    token = _token_from_header(authorization)
+    if token is None:
         return None
-    user_id, jti, _exp_ts = decoded
-    revoked = db.scalar(
-        select(AuthAccessTokenRevocation.id).where(
-            AuthAccessTokenRevocation.user_id == user_id,
-            AuthAccessTokenRevocation.jti == jti,
-            AuthAccessTokenRevocation.expires_at >= datetime.now(UTC),
-        )
-    )
-    if revoked is not None:
+    claims = _decode_access_token_claims(token)
+    if claims is None:
         return None
-    user = db.get(User, user_id)
-    if user is None or not user.is_active:
+    user, revoked = _load_user_for_token(db=db, claims=claims)
+    if revoked or user is None or not user.is_active:
         return None
     return user
 
@@ -265,12 +398,15 @@ def _resolve_trade_type_and_conversion(
     requested_trade_type_name: str | None,
     requested_monthly_conversion_rate_pct: float | None,
     user: User | None,
+    context: "RequestContext | None" = None,
 ) -> tuple[str, float]:
     resolved_trade_type_name = normalize_trade_type_name(requested_trade_type_name)
     resolved_monthly_conversion_rate_pct = settings.jeonse_monthly_conversion_rate_default
 
     setting: UserNotificationSetting | None = None
-    if user is not None:
+    if context is not None:
+        setting = context.notification_setting
+    elif user is not None:
         setting = db.get(UserNotificationSetting, user.id)
 
     if resolved_trade_type_name is None and setting is not None:
@@ -305,51 +441,55 @@ def _collect_user_bargains_with_preferences(
     requested_trade_type_name: str | None,
     requested_monthly_conversion_rate_pct: float | None,
     only_complex_no: int | None = None,
+    context: "RequestContext | None" = None,
 ) -> tuple[list[dict[str, Any]], str, float]:
     resolved_trade_type_name, resolved_monthly_conversion_rate_pct = _resolve_trade_type_and_conversion(
         db=db,
         requested_trade_type_name=requested_trade_type_name,
         requested_monthly_conversion_rate_pct=requested_monthly_conversion_rate_pct,
         user=user,
+        context=context,
     )
 
-    stmt = select(UserWatchComplex).where(
+    stmt = select(UserWatchComplex.complex_no, UserWatchComplex.complex_name).where(
         UserWatchComplex.user_id == user.id,
         UserWatchComplex.enabled.is_(True),
     )
     if only_complex_no is not None:
         stmt = stmt.where(UserWatchComplex.complex_no == only_complex_no)
-    watches = db.scalars(stmt).all()
+    watches = db.execute(stmt).all()
 
+    bargains_by_complex = detect_bargains_bulk(
+        db=db,
+        complex_nos=[watch.complex_no for watch in watches],
+        lookback_days=lookback_days,
+        discount_threshold=discount_threshold,
+        trade_type_name=resolved_trade_type_name,
+        monthly_conversion_rate_pct=resolved_monthly_conversion_rate_pct,
+    )
     alerts: list[dict[str, Any]] = []
     for watch in watches:
-        rows = detect_bargains(
-            db=db,
-            complex_no=watch.complex_no,
-            lookback_days=lookback_days,
-            discount_threshold=discount_threshold,
-            trade_type_name=resolved_trade_type_name,
-            monthly_conversion_rate_pct=resolved_monthly_conversion_rate_pct,
-        )
-        for row in rows:
+        for row in bargains_by_complex.get(watch.complex_no, []):
             row["complex_no"] = watch.complex_no
             row["complex_name"] = watch.complex_name
             alerts.append(row)
 
-    alerts.sort(key=lambda row: float(row.get("discount_rate") or 0.0), reverse=True)
+    alerts.sort(key=itemgetter("discount_rate"), reverse=True)
     return alerts, resolved_trade_type_name, resolved_monthly_conversion_rate_pct
 
 
+@lru_cache(maxsize=1024)
+def _parse_scheduler_times_cached(raw: str) -> tuple[str, ...]:
+    return tuple(sorted({value for value in (token.strip() for token in raw.split(",")) if _TIME_RE.fullmatch(value)}))
+
+
 def _parse_scheduler_times(raw: str) -> list[str]:
-    result: list[str] = []
-    for token in raw.split(","):
-        value = token.strip()
-        if len(value) == 5 and value[2] == ":" and value[:2].isdigit() and value[3:].isdigit():
-            hour = int(value[:2])
-            minute = int(value[3:])
-            if 0 <= hour <= 23 and 0 <= minute <= 59:
-                result.append(f"{hour:02d}:{minute:02d}")
-    return sorted(set(result))
+    return list(_parse_scheduler_times_cached(raw))
+
+
+@lru_cache(maxsize=512)
+def _validate_timezone(timezone_name: str) -> ZoneInfo:
+    return ZoneInfo(timezone_name)
 
 
 def _serialize_scheduler_config(config: SchedulerConfig, configured_complex_count: int) -> dict[str, Any]:
@@ -384,6 +524,49 @@ def _get_or_create_scheduler_config(db: Session) -> SchedulerConfig:
     return config
 
 
+@dataclass(slots=True, frozen=True)
+class SchedulerSnapshot:
+    enabled: bool
+    timezone: str
+    times: tuple[str, ...]
+    poll_seconds: int
+    reuse_bucket_hours: int
+
+
+def _load_scheduler_snapshot(db: Session) -> SchedulerSnapshot:
+    with _SCHEDULER_SNAPSHOT_LOCK:
+        cached = _SCHEDULER_SNAPSHOT_CACHE.get(1)
+    if cached is not None:
+        return cached
+
+    # Read-only: may run against a replica, so a missing row falls back to the defaults it would be seeded with.
+    config = db.get(SchedulerConfig, 1)
+    if config is None:
+        snapshot = SchedulerSnapshot(
+            enabled=settings.scheduler_enabled,
+            timezone=settings.scheduler_timezone,
+            times=_parse_scheduler_times_cached(settings.scheduler_times_csv),
+            poll_seconds=settings.scheduler_poll_seconds,
+            reuse_bucket_hours=settings.crawler_reuse_window_hours,
+        )
+    else:
+        snapshot = SchedulerSnapshot(
+            enabled=config.enabled,
+            timezone=config.timezone,
+            times=_parse_scheduler_times_cached(config.times_csv),
+            poll_seconds=config.poll_seconds,
+            reuse_bucket_hours=config.reuse_bucket_hours,
+        )
+    with _SCHEDULER_SNAPSHOT_LOCK:
+        _SCHEDULER_SNAPSHOT_CACHE[1] = snapshot
+    return snapshot
+
+
+def _clear_scheduler_snapshot_cache() -> None:
+    with _SCHEDULER_SNAPSHOT_LOCK:
+        _SCHEDULER_SNAPSHOT_CACHE.clear()
+
+
 def _build_email_verification_link(token: str) -> str:
     base = settings.auth_email_verification_base_url.rstrip("/")
     return f"{base}/auth/verify-email?token={token}"
@@ -402,24 +585,58 @@ def _issue_email_verification_token(db: Session, user_id: UUID) -> tuple[str, da
     return raw_token, expires_at
 
 
+def get_naver_client(request: Request) -> NaverLandClient:
+    # The client is stateless (urllib opens a connection per call), so one shared instance is safe across threads.
+    client = getattr(request.app.state, "naver_client", None)
+    if client is None:
+        client = NaverLandClient(settings=settings)
+        request.app.state.naver_client = client
+    return client
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
+    _load_index_html()
+    app.state.naver_client = NaverLandClient(settings=settings)
     if settings.auto_create_tables and settings.app_env == "dev":
         init_db()
 
 
 @app.get("/health")
-def health() -> dict[str, str]:
+async def health(response: Response) -> dict[str, str]:
+    # Liveness probes must reach the process, never a cached answer.
+    response.headers["Cache-Control"] = "no-store"
     return {"status": "ok", "env": settings.app_env}
 
 
+def _load_index_html() -> None:
+    index_path = web_dir / "index.html"
+    # Stat before reading so a concurrent edit is picked up again on the next mtime check.
+    mtime_ns = index_path.stat().st_mtime_ns
+    if getattr(app.state, "index_mtime_ns", None) == mtime_ns:
+        return
+    index_html = index_path.read_bytes()
+    app.state.index_html = index_html
+    app.state.index_etag = f'"{hashlib.sha1(index_html).hexdigest()}"'
+    app.state.index_mtime_ns = mtime_ns
+
+
 @app.get("/", response_class=HTMLResponse)
-def home() -> str:
-    return (web_dir / "index.html").read_text(encoding="utf-8")
+async def home(request: Request) -> Response:
+    # dev keeps picking up edits to index.html without a restart: the file is re-read off the event loop
+    # when its mtime changes, and no-cache makes the browser revalidate the ETag on every load.
+    if settings.app_env == "dev" or not hasattr(app.state, "index_html"):
+        await anyio.to_thread.run_sync(_load_index_html)
+    cache_control = "no-cache" if settings.app_env == "dev" else "public, max-age=60"
+    headers = {"ETag": app.state.index_etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == app.state.index_etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=app.state.index_html, media_type="text/html", headers=headers)
 
 
 @app.get("/meta")
-def meta() -> dict[str, str | int]:
+async def meta(response: Response) -> dict[str, str | int]:
+    response.headers["Cache-Control"] = "public, max-age=30"
     return {
         "app": settings.app_name,
         "version": settings.app_version,
@@ -458,7 +675,7 @@ def scheduler_config_update(
 ) -> dict[str, Any]:
     normalized_timezone = timezone.strip()
     try:
-        ZoneInfo(normalized_timezone)
+        _validate_timezone(normalized_timezone)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid timezone") from exc
 
@@ -490,6 +707,7 @@ def scheduler_config_update(
     config.reuse_bucket_hours = reuse_bucket_hours
     config.updated_by_user_id = current_user.id
     db.commit()
+    _clear_scheduler_snapshot_cache()
     db.refresh(config)
 
     configured_complex_count = int(
@@ -502,10 +720,13 @@ def scheduler_config_update(
 
 
 @app.get("/crawler/articles/{complex_no}")
-def crawler_articles(complex_no: int, page: int = 1) -> dict[str, object]:
-    client = NaverLandClient(settings=settings)
+def crawler_articles(
+    complex_no: int,
+    page: int = 1,
+    client: NaverLandClient = Depends(get_naver_client),
+) -> dict[str, object]:
     try:
-        payload = client.fetch_complex_articles(complex_no=complex_no, page=page)
+        payload = client.fetch_complex_articles_cached(complex_no=complex_no, page=page)
     except RuntimeError as exc:
         raise _map_crawler_runtime_error(exc) from exc
     items = client.summarize_articles(payload)
@@ -521,6 +742,7 @@ def crawler_articles(complex_no: int, page: int = 1) -> dict[str, object]:
 def crawler_search_complexes(
     keyword: str = Query(..., min_length=2),
     limit: int = 10,
+    client: NaverLandClient = Depends(get_naver_client),
 ) -> dict[str, object]:
     normalized_keyword = keyword.strip()
     if len(normalized_keyword) < 2:
@@ -528,7 +750,6 @@ def crawler_search_complexes(
     if limit < 1 or limit > 20:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="limit must be between 1 and 20")
 
-    client = NaverLandClient(settings=settings)
     try:
         items = client.search_complexes(keyword=normalized_keyword, limit=limit)
     except RuntimeError as exc:
@@ -555,7 +776,7 @@ def crawler_ingest(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="max_pages must be between 1 and 20")
 
     try:
-        return ingest_complex_snapshot(
+        result = ingest_complex_snapshot(
             db=db,
             settings=settings,
             complex_no=complex_no,
@@ -565,6 +786,9 @@ def crawler_ingest(
         )
     except RuntimeError as exc:
         raise _map_crawler_runtime_error(exc) from exc
+    if not result["reused"]:
+        refresh_price_baseline_view_after_ingest(db=db)
+    return result
 
 
 @app.get("/analytics/trend/{complex_no}")
@@ -606,10 +830,16 @@ def analytics_compare(
     trade_type_name: str | None = None,
     monthly_conversion_rate_pct: float | None = None,
     current_user: User = Depends(get_current_user),
+    request_context: RequestContext = Depends(load_request_context),
     db: Session = Depends(get_db),
 ) -> dict[str, object]:
     try:
-        enforce_compare_limit(db=db, user_id=current_user.id, requested_complex_count=len(complex_nos))
+        enforce_compare_limit(
+            db=db,
+            user_id=current_user.id,
+            requested_complex_count=len(complex_nos),
+            entitlements=request_context.entitlements,
+        )
     except BillingError as exc:
         raise _map_billing_error(exc) from exc
 
@@ -618,6 +848,7 @@ def analytics_compare(
         requested_trade_type_name=trade_type_name,
         requested_monthly_conversion_rate_pct=monthly_conversion_rate_pct,
         user=current_user,
+        context=request_context,
     )
 
     return {
@@ -671,47 +902,39 @@ def analytics_bargains(
     }
 
 
-@app.post("/auth/register")
-def auth_register(
-    request: Request,
-    email: str = Body(..., embed=True),
-    password: str = Body(..., embed=True, min_length=8),
-    invite_code: str | None = Body(None, embed=True),
-    x_forwarded_for: Annotated[str | None, Header()] = None,
-    db: Session = Depends(get_db),
-) -> dict[str, Any]:
-    client_key = _resolve_client_key(request=request, x_forwarded_for=x_forwarded_for)
-    _enforce_registration_rate_limit(client_key=client_key)
+def _password_hash_limiter() -> anyio.CapacityLimiter:
+    # Created lazily so it binds to the running event loop; sized to CPU cores because hashing is CPU-bound.
+    global _PASSWORD_HASH_LIMITER
+    if _PASSWORD_HASH_LIMITER is None:
+        _PASSWORD_HASH_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 1)
+    return _PASSWORD_HASH_LIMITER
 
-    expected_invite_code = (settings.auth_register_invite_code or "").strip()
-    if expected_invite_code:
-        if (invite_code or "").strip() != expected_invite_code:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="가입 승인 코드가 올바르지 않습니다.",
-            )
 
-    normalized_email = email.strip().lower()
-    existing_user = db.scalar(select(User).where(User.email == normalized_email))
-    if existing_user is not None:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
+async def _run_password_work(func: Callable[..., T], *args: Any) -> T:
+    return await anyio.to_thread.run_sync(func, *args, limiter=_password_hash_limiter())
+
 
+def _complete_registration(db: Session, normalized_email: str, password_hash: str) -> dict[str, Any]:
     verification_required = settings.auth_email_verification_required
+    # Assign the id up front so dependent rows are queued without an intermediate flush;
+    # the unit of work inserts them after the user in a single commit.
     user = User(
+        id=uuid7(),
         email=normalized_email,
-        password_hash=hash_password(password),
+        password_hash=password_hash,
         email_verified=not verification_required,
     )
-    db.add(user)
-    db.flush()
-    db.add(
-        UserNotificationSetting(
-            user_id=user.id,
-            email_enabled=True,
-            email_address=user.email,
-        )
+    db.add_all(
+        [
+            user,
+            UserNotificationSetting(
+                user_id=user.id,
+                email_enabled=True,
+                email_address=user.email,
+            ),
+            build_free_subscription(user_id=user.id),
+        ]
     )
-    ensure_user_subscription(db=db, user_id=user.id)
 
     verification_sent = False
     verification_message = "verification not required"
@@ -734,7 +957,6 @@ def auth_register(
         )
 
     db.commit()
-    db.refresh(user)
 
     response: dict[str, Any] = {
         "user_id": str(user.id),
@@ -750,28 +972,70 @@ def auth_register(
     return response
 
 
+@app.post("/auth/register")
+async def auth_register(
+    request: Request,
+    email: str = Body(..., embed=True),
+    password: str = Body(..., embed=True, min_length=8),
+    invite_code: str | None = Body(None, embed=True),
+    x_forwarded_for: Annotated[str | None, Header()] = None,
+    db: Session = Depends(get_db),
+) -> dict[str, Any]:
+    client_key = _resolve_client_key(request=request, x_forwarded_for=x_forwarded_for)
+    _enforce_registration_rate_limit(client_key=client_key)
+
+    if _EXPECTED_INVITE_CODE is not None:
+        if not hmac.compare_digest((invite_code or "").strip().encode("utf-8"), _EXPECTED_INVITE_CODE):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="가입 승인 코드가 올바르지 않습니다.",
+            )
+
+    # Blocking DB work goes to the default threadpool; password hashing gets its own CPU-sized limiter.
+    normalized_email = _normalize_email(email)
+    existing_user_id = await anyio.to_thread.run_sync(
+        db.scalar,
+        select(User.id).where(User.email == normalized_email),
+    )
+    if existing_user_id is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
+
+    password_hash = await _run_password_work(hash_password, password)
+    return await anyio.to_thread.run_sync(_complete_registration, db, normalized_email, password_hash)
+
+
+def _complete_login(db: Session, user: User, new_password_hash: str | None) -> dict[str, str | int]:
+    if new_password_hash:
+        user.password_hash = new_password_hash
+
+    payload, _refresh_jti = _issue_auth_tokens(db=db, user_id=user.id)
+    db.commit()
+    return payload
+
+
 @app.post("/auth/login")
-def auth_login(
+async def auth_login(
     email: str = Body(..., embed=True),
     password: str = Body(..., embed=True),
     db: Session = Depends(get_db),
 ) -> dict[str, str | int]:
-    normalized_email = email.strip().lower()
-    user = db.scalar(select(User).where(User.email == normalized_email))
-    if user is None or not verify_password(password, user.password_hash):
+    normalized_email = _normalize_email(email)
+    user = await anyio.to_thread.run_sync(db.scalar, select(User).where(User.email == normalized_email))
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    verified = await _run_password_work(verify_password, password, user.password_hash)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
     if not user.email_verified:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Email verification required")
 
-    new_hash = maybe_rehash_password(password, user.password_hash)
-    if new_hash:
-        user.password_hash = new_hash
-
-    payload, _refresh_jti = _issue_auth_tokens(db=db, user_id=user.id)
-    db.commit()
-    return payload
+    # Rehash only for logins that will succeed, so rejected accounts never pay for argon2 or the write.
+    new_hash = None
+    if password_needs_rehash(user.password_hash):
+        new_hash = await _run_password_work(hash_password, password)
+    return await anyio.to_thread.run_sync(_complete_login, db, user, new_hash)
 
 
 @app.get("/auth/verify-email", response_class=HTMLResponse)
@@ -813,29 +1077,41 @@ def auth_refresh(
 ) -> dict[str, str | int]:
     parsed = decode_refresh_token(
         token=refresh_token,
-        secret_key=settings.auth_secret_key,
-        algorithm=settings.auth_jwt_algorithm,
-        issuer=settings.auth_jwt_issuer,
+        secret_key=_AUTH_SECRET_KEY,
+        algorithm=_AUTH_JWT_ALGORITHM,
+        issuer=_AUTH_JWT_ISSUER,
     )
     if parsed is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
     user_id, jti, _exp_ts = parsed
 
+    now = datetime.now(UTC)
+    # The stored row's own expiry is checked in SQL; a concurrent rotation holding the row lock is skipped, not awaited.
     token_row = db.scalar(
         select(AuthRefreshToken)
         .where(
             AuthRefreshToken.user_id == user_id,
             AuthRefreshToken.jti == jti,
+            AuthRefreshToken.revoked_at.is_(None),
+            AuthRefreshToken.expires_at > now,
         )
-        .with_for_update()
+        .with_for_update(skip_locked=True)
     )
     if token_row is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token not found")
-    if token_row.revoked_at is not None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
-    if token_row.expires_at < datetime.now(UTC):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired")
-    if token_row.token_hash != hash_token(refresh_token):
+        state = db.execute(
+            select(AuthRefreshToken.revoked_at, AuthRefreshToken.expires_at).where(
+                AuthRefreshToken.user_id == user_id,
+                AuthRefreshToken.jti == jti,
+            )
+        ).one_or_none()
+        if state is not None and state.revoked_at is not None:
+            detail = "Refresh token revoked"
+        elif state is not None and state.expires_at <= now:
+            detail = "Refresh token expired"
+        else:
+            detail = "Invalid refresh token"
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
+    if not hmac.compare_digest(token_row.token_hash, hash_token_digest(refresh_token)):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
     user = db.get(User, user_id)
@@ -843,7 +1119,7 @@ def auth_refresh(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
 
     payload, new_refresh_jti = _issue_auth_tokens(db=db, user_id=user.id)
-    token_row.revoked_at = datetime.now(UTC)
+    token_row.revoked_at = now
     token_row.replaced_by_jti = new_refresh_jti
     db.commit()
     return payload
@@ -856,46 +1132,54 @@ def auth_logout(
     db: Session = Depends(get_db),
 ) -> dict[str, bool]:
     changed = False
-
-    if authorization and authorization.startswith("Bearer "):
-        access_token = authorization.split(" ", 1)[1].strip()
-        decoded = _decode_access_token_claims(access_token)
-        if decoded is not None:
-            user_id, jti, exp_ts = decoded
-            already_revoked = db.scalar(
-                select(AuthAccessTokenRevocation.id).where(AuthAccessTokenRevocation.jti == jti)
-            )
-            if already_revoked is None:
-                db.add(
-                    AuthAccessTokenRevocation(
-                        user_id=user_id,
-                        jti=jti,
-                        expires_at=datetime.fromtimestamp(exp_ts, tz=UTC),
-                        revoked_at=datetime.now(UTC),
-                    )
+    revoked_access_jti: UUID | None = None
+
+    access_token = _token_from_header(authorization)
+    if access_token is not None:
+        claims = _decode_access_token_claims(access_token)
+        if claims is not None and not is_access_jti_revoked(claims.jti):
+            # ON CONFLICT makes the "already revoked?" check and the insert one round trip.
+            inserted_id = db.execute(
+                pg_insert(AuthAccessTokenRevocation)
+                .values(
+                    user_id=claims.user_id,
+                    jti=claims.jti,
+                    expires_at=datetime.fromtimestamp(claims.exp_ts, tz=UTC),
+                    revoked_at=datetime.now(UTC),
                 )
-                changed = True
+                .on_conflict_do_nothing(index_elements=[AuthAccessTokenRevocation.jti])
+                .returning(AuthAccessTokenRevocation.id)
+            ).scalar()
+            changed = inserted_id is not None
+            revoked_access_jti = claims.jti
 
     parsed = decode_refresh_token(
         token=refresh_token,
-        secret_key=settings.auth_secret_key,
-        algorithm=settings.auth_jwt_algorithm,
-        issuer=settings.auth_jwt_issuer,
+        secret_key=_AUTH_SECRET_KEY,
+        algorithm=_AUTH_JWT_ALGORITHM,
+        issuer=_AUTH_JWT_ISSUER,
     )
     if parsed is not None:
         user_id, jti, _exp_ts = parsed
-        token_row = db.scalar(
-            select(AuthRefreshToken).where(
+        token_row = db.execute(
+            select(AuthRefreshToken.id, AuthRefreshToken.token_hash).where(
                 AuthRefreshToken.user_id == user_id,
                 AuthRefreshToken.jti == jti,
+                AuthRefreshToken.revoked_at.is_(None),
+            )
+        ).first()
+        if token_row is not None and hmac.compare_digest(token_row.token_hash, hash_token_digest(refresh_token)):
+            db.execute(
+                update(AuthRefreshToken)
+                .where(AuthRefreshToken.id == token_row.id, AuthRefreshToken.revoked_at.is_(None))
+                .values(revoked_at=datetime.now(UTC))
             )
-        )
-        if token_row is not None and token_row.revoked_at is None and token_row.token_hash == hash_token(refresh_token):
-            token_row.revoked_at = datetime.now(UTC)
             changed = True
 
     if changed:
         db.commit()
+    if revoked_access_jti is not None:
+        remember_access_jti_revoked(revoked_access_jti, revoked=True)
     return {"ok": True}
 
 
@@ -947,7 +1231,7 @@ def billing_complete_checkout_session(
     db: Session = Depends(get_db),
 ) -> dict[str, object]:
     try:
-        checkout_session, _subscription, changed = complete_dummy_checkout_session(
+        checkout_session, _subscription, changed, entitlements = complete_dummy_checkout_session(
             db=db,
             user_id=current_user.id,
             checkout_token=checkout_token,
@@ -956,7 +1240,7 @@ def billing_complete_checkout_session(
         raise _map_billing_error(exc) from exc
 
     db.commit()
-    entitlements = get_user_entitlements(db=db, user_id=current_user.id)
+    remember_user_entitlements(user_id=current_user.id, entitlements=entitlements)
     return {
         "ok": True,
         "changed": changed,
@@ -970,68 +1254,32 @@ def billing_complete_checkout_session(
 @app.get("/me/watch-complexes")
 def me_watch_complexes(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> dict[str, list[dict[str, Any]]]:
-    rows = db.scalars(
-        select(UserWatchComplex)
+    db: Session = Depends(get_read_db),
+) -> ORJSONResponse:
+    rows = db.execute(
+        select(
+            UserWatchComplex.id,
+            UserWatchComplex.complex_no,
+            UserWatchComplex.complex_name,
+            UserWatchComplex.sido_name,
+            UserWatchComplex.gugun_name,
+            UserWatchComplex.dong_name,
+            UserWatchComplex.enabled,
+            UserWatchComplex.created_at,
+        )
         .where(UserWatchComplex.user_id == current_user.id)
         .order_by(UserWatchComplex.created_at.desc())
-    ).all()
-    return {
-        "items": [
-            {
-                "id": item.id,
-                "complex_no": item.complex_no,
-                "complex_name": item.complex_name,
-                "sido_name": item.sido_name,
-                "gugun_name": item.gugun_name,
-                "dong_name": item.dong_name,
-                "enabled": item.enabled,
-                "created_at": item.created_at.isoformat() if item.created_at else None,
-            }
-            for item in rows
-        ]
-    }
+    ).mappings().all()
+    return ORJSONResponse({"items": rows})
 
 
-@app.get("/me/watch-complexes/collection-status")
-def me_watch_complexes_collection_status(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> dict[str, Any]:
-    scheduler_config = _get_or_create_scheduler_config(db=db)
-    active_watch_complex_nos = set(
-        db.scalars(
-            select(UserWatchComplex.complex_no)
-            .where(UserWatchComplex.enabled.is_(True))
-            .distinct()
-        ).all()
-    )
-    scheduler_times = _parse_scheduler_times(scheduler_config.times_csv)
+# Matches the column order _fetch_collection_status_rows returns for complexes that have never been crawled.
+_EMPTY_COLLECTION_STATUS: tuple[None, ...] = (None,) * 6
 
-    watches = db.scalars(
-        select(UserWatchComplex)
-        .where(UserWatchComplex.user_id == current_user.id)
-        .order_by(UserWatchComplex.created_at.desc())
-    ).all()
-    complex_nos = list({item.complex_no for item in watches})
-
-    if not complex_nos:
-        return {
-            "count": 0,
-            "auto_collect": {
-                "enabled": scheduler_config.enabled,
-                "timezone": scheduler_config.timezone,
-                "times": scheduler_times,
-                "poll_seconds": scheduler_config.poll_seconds,
-                "reuse_bucket_hours": scheduler_config.reuse_bucket_hours,
-                "configured_complex_count": len(active_watch_complex_nos),
-                "note": "자동수집 주기/재사용 버킷은 서버 전역 설정이며, 수집 대상은 전체 계정의 활성 관심단지입니다.",
-            },
-            "items": [],
-        }
 
-    latest_success_rows = db.execute(
+def _fetch_collection_status_rows(db: Session, complex_nos: list[int]) -> dict[int, tuple[Any, ...]]:
+    # One round-trip: latest success, latest attempt, last-run status and latest listing count per complex.
+    latest_success = (
         select(
             CrawlRun.complex_no,
             func.max(CrawlRun.completed_at).label("latest_collected_at"),
@@ -1039,16 +1287,9 @@ def me_watch_complexes_collection_status(
         )
         .where(CrawlRun.complex_no.in_(complex_nos), CrawlRun.status == "SUCCESS")
         .group_by(CrawlRun.complex_no)
-    ).all()
-    latest_success_map = {
-        int(row.complex_no): {
-            "latest_collected_at": row.latest_collected_at,
-            "latest_success_run_id": int(row.latest_success_run_id) if row.latest_success_run_id is not None else None,
-        }
-        for row in latest_success_rows
-    }
-
-    latest_attempt_rows = db.execute(
+        .cte("latest_success")
+    )
+    latest_attempt = (
         select(
             CrawlRun.complex_no,
             func.max(CrawlRun.started_at).label("last_attempt_at"),
@@ -1056,98 +1297,186 @@ def me_watch_complexes_collection_status(
         )
         .where(CrawlRun.complex_no.in_(complex_nos))
         .group_by(CrawlRun.complex_no)
+        .cte("latest_attempt")
+    )
+    listing_counts = (
+        select(
+            ListingSnapshot.crawl_run_id,
+            func.count(ListingSnapshot.id).label("listing_count"),
+        )
+        .where(ListingSnapshot.crawl_run_id.in_(select(latest_success.c.latest_success_run_id)))
+        .group_by(ListingSnapshot.crawl_run_id)
+        .cte("listing_counts")
+    )
+    last_run = aliased(CrawlRun)
+
+    # Every successful run is also an attempt, so latest_attempt covers all complexes with any run.
+    rows = db.execute(
+        select(
+            latest_attempt.c.complex_no,
+            latest_attempt.c.last_attempt_at,
+            last_run.status.label("last_run_status"),
+            last_run.error_message.label("last_run_error"),
+            latest_success.c.latest_collected_at,
+            latest_success.c.latest_success_run_id,
+            listing_counts.c.listing_count,
+        )
+        .select_from(latest_attempt)
+        .outerjoin(latest_success, latest_success.c.complex_no == latest_attempt.c.complex_no)
+        .outerjoin(last_run, last_run.id == latest_attempt.c.last_run_id)
+        .outerjoin(listing_counts, listing_counts.c.crawl_run_id == latest_success.c.latest_success_run_id)
     ).all()
-    last_run_id_by_complex = {
-        int(row.complex_no): int(row.last_run_id) if row.last_run_id is not None else None
-        for row in latest_attempt_rows
-    }
-    last_attempt_at_by_complex = {int(row.complex_no): row.last_attempt_at for row in latest_attempt_rows}
+    return {int(row.complex_no): tuple(row[1:]) for row in rows}
 
-    all_run_ids = {
-        run_id
-        for run_id in [
-            *(item.get("latest_success_run_id") for item in latest_success_map.values()),
-            *last_run_id_by_complex.values(),
-        ]
-        if run_id is not None
+
+@app.get("/me/watch-complexes/collection-status")
+def me_watch_complexes_collection_status(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+) -> ORJSONResponse:
+    scheduler_config = _load_scheduler_snapshot(db=db)
+    configured_complex_count = int(
+        db.scalar(
+            select(func.count(func.distinct(UserWatchComplex.complex_no))).where(UserWatchComplex.enabled.is_(True))
+        )
+        or 0
+    )
+    auto_collect = {
+        "enabled": scheduler_config.enabled,
+        "timezone": scheduler_config.timezone,
+        "times": list(scheduler_config.times),
+        "poll_seconds": scheduler_config.poll_seconds,
+        "reuse_bucket_hours": scheduler_config.reuse_bucket_hours,
+        "configured_complex_count": configured_complex_count,
+        "note": "자동수집 주기/재사용 버킷은 서버 전역 설정이며, 수집 대상은 전체 계정의 활성 관심단지입니다.",
     }
 
-    run_meta_map: dict[int, dict[str, Any]] = {}
-    if all_run_ids:
-        run_rows = db.execute(
-            select(CrawlRun.id, CrawlRun.status, CrawlRun.error_message).where(CrawlRun.id.in_(all_run_ids))
-        ).all()
-        run_meta_map = {
-            int(row.id): {
-                "status": row.status,
-                "error_message": row.error_message,
-            }
-            for row in run_rows
-        }
+    watches = db.execute(
+        select(
+            UserWatchComplex.id,
+            UserWatchComplex.complex_no,
+            UserWatchComplex.complex_name,
+            UserWatchComplex.enabled,
+            UserWatchComplex.created_at,
+        )
+        .where(UserWatchComplex.user_id == current_user.id)
+        .order_by(UserWatchComplex.created_at.desc())
+    ).all()
+    complex_nos = list({watch.complex_no for watch in watches})
 
-    latest_success_run_ids = [
-        item["latest_success_run_id"]
-        for item in latest_success_map.values()
-        if item.get("latest_success_run_id") is not None
-    ]
-    listing_count_by_run_id: dict[int, int] = {}
-    if latest_success_run_ids:
-        listing_count_rows = db.execute(
-            select(ListingSnapshot.crawl_run_id, func.count(ListingSnapshot.id))
-            .where(ListingSnapshot.crawl_run_id.in_(latest_success_run_ids))
-            .group_by(ListingSnapshot.crawl_run_id)
-        ).all()
-        listing_count_by_run_id = {
-            int(run_id): int(count)
-            for run_id, count in listing_count_rows
-        }
+    if not complex_nos:
+        return ORJSONResponse({"count": 0, "auto_collect": auto_collect, "items": []})
+
+    status_by_complex = _fetch_collection_status_rows(db=db, complex_nos=complex_nos)
+    # Only this user's complexes matter for auto_collect_target, so probe those instead of every active one.
+    active_watch_complex_nos: set[int] = set()
+    if scheduler_config.enabled:
+        active_watch_complex_nos = set(
+            db.scalars(
+                select(UserWatchComplex.complex_no)
+                .where(UserWatchComplex.enabled.is_(True), UserWatchComplex.complex_no.in_(complex_nos))
+                .distinct()
+            ).all()
+        )
 
+    # Datetimes are left as-is; returning the response directly skips jsonable_encoder and lets orjson
+    # emit them as ISO 8601.
     items: list[dict[str, Any]] = []
-    for watch in watches:
-        latest_success = latest_success_map.get(watch.complex_no, {})
-        latest_success_run_id = latest_success.get("latest_success_run_id")
-        last_run_id = last_run_id_by_complex.get(watch.complex_no)
-        last_run_meta = run_meta_map.get(last_run_id) if last_run_id else None
+    for watch_id, complex_no, complex_name, enabled, created_at in watches:
+        (
+            last_attempt_at,
+            last_run_status,
+            last_run_error,
+            latest_collected_at,
+            latest_success_run_id,
+            listing_count,
+        ) = status_by_complex.get(complex_no, _EMPTY_COLLECTION_STATUS)
         items.append(
             {
-                "watch_id": watch.id,
-                "complex_no": watch.complex_no,
-                "complex_name": watch.complex_name,
-                "enabled": watch.enabled,
-                "created_at": watch.created_at.isoformat() if watch.created_at else None,
-                "latest_collected_at": (
-                    latest_success.get("latest_collected_at").isoformat()
-                    if latest_success.get("latest_collected_at")
-                    else None
-                ),
+                "watch_id": watch_id,
+                "complex_no": complex_no,
+                "complex_name": complex_name,
+                "enabled": enabled,
+                "created_at": created_at,
+                "latest_collected_at": latest_collected_at,
                 "latest_success_run_id": latest_success_run_id,
-                "latest_listing_count": (
-                    listing_count_by_run_id.get(latest_success_run_id) if latest_success_run_id is not None else None
-                ),
-                "last_attempt_at": (
-                    last_attempt_at_by_complex.get(watch.complex_no).isoformat()
-                    if last_attempt_at_by_complex.get(watch.complex_no)
-                    else None
-                ),
-                "last_run_status": last_run_meta.get("status") if last_run_meta else None,
-                "last_run_error": last_run_meta.get("error_message") if last_run_meta else None,
-                "auto_collect_target": scheduler_config.enabled and watch.complex_no in active_watch_complex_nos,
+                "latest_listing_count": listing_count,
+                "last_attempt_at": last_attempt_at,
+                "last_run_status": last_run_status,
+                "last_run_error": last_run_error,
+                "auto_collect_target": complex_no in active_watch_complex_nos,
             }
         )
 
-    return {
-        "count": len(items),
-        "auto_collect": {
-            "enabled": scheduler_config.enabled,
-            "timezone": scheduler_config.timezone,
-            "times": scheduler_times,
-            "poll_seconds": scheduler_config.poll_seconds,
-            "reuse_bucket_hours": scheduler_config.reuse_bucket_hours,
-            "configured_complex_count": len(active_watch_complex_nos),
-            "note": "자동수집 주기/재사용 버킷은 서버 전역 설정이며, 수집 대상은 전체 계정의 활성 관심단지입니다.",
-        },
-        "items": items,
-    }
+    return ORJSONResponse({"count": len(items), "auto_collect": auto_collect, "items": items})
+
+
+def _fetch_live_watch_item(
+    client: NaverLandClient,
+    complex_no: int,
+    complex_name: str | None,
+    page: int,
+    max_per_complex: int,
+) -> dict[str, Any]:
+    try:
+        payload = client.fetch_complex_articles_cached(complex_no=complex_no, page=page)
+        summaries = client.summarize_articles(payload, limit=max_per_complex)
+        return {
+            "complex_no": complex_no,
+            "complex_name": complex_name,
+            "article_count": len(summaries),
+            "articles": summaries,
+        }
+    except Exception as exc:  # pragma: no cover - external API/network branch
+        return {
+            "complex_no": complex_no,
+            "complex_name": complex_name,
+            "article_count": 0,
+            "articles": [],
+            "error": str(exc),
+        }
+
+
+def _upstream_fetch_limiter() -> anyio.CapacityLimiter:
+    # Shared by every live stream so concurrent requests cannot pile blocking upstream calls onto
+    # the default thread pool that sync endpoints and DB work also depend on.
+    global _UPSTREAM_FETCH_LIMITER
+    if _UPSTREAM_FETCH_LIMITER is None:
+        _UPSTREAM_FETCH_LIMITER = anyio.CapacityLimiter(settings.crawler_upstream_thread_limit)
+    return _UPSTREAM_FETCH_LIMITER
+
+
+async def _stream_live_watch_items(
+    client: NaverLandClient,
+    targets: list[tuple[int, str | None]],
+    page: int,
+    max_per_complex: int,
+) -> AsyncIterator[bytes]:
+    # Each upstream call is blocking urllib I/O; fan out to worker threads and emit lines in completion order.
+    # The semaphore caps simultaneous requests per stream to stay polite to the upstream API;
+    # the shared limiter bounds the total across all streams.
+    semaphore = asyncio.Semaphore(settings.crawler_live_concurrency)
+
+    async def fetch_one(complex_no: int, complex_name: str | None) -> dict[str, Any]:
+        async with semaphore:
+            return await anyio.to_thread.run_sync(
+                _fetch_live_watch_item,
+                client,
+                complex_no,
+                complex_name,
+                page,
+                max_per_complex,
+                limiter=_upstream_fetch_limiter(),
+            )
+
+    tasks = [asyncio.create_task(fetch_one(complex_no, complex_name)) for complex_no, complex_name in targets]
+    try:
+        for next_item in asyncio.as_completed(tasks):
+            item = await next_item
+            yield orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
 @app.get("/me/watch-complexes/live")
@@ -1156,59 +1485,34 @@ def me_watch_complexes_live(
     max_per_complex: int = 10,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> dict[str, Any]:
+    client: NaverLandClient = Depends(get_naver_client),
+) -> StreamingResponse:
     if page < 1:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="page must be >= 1")
     if max_per_complex < 1 or max_per_complex > 30:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="max_per_complex must be between 1 and 30")
 
-    watches = db.scalars(
-        select(UserWatchComplex)
+    watches = db.execute(
+        select(UserWatchComplex.complex_no, UserWatchComplex.complex_name)
         .where(
             UserWatchComplex.user_id == current_user.id,
             UserWatchComplex.enabled.is_(True),
         )
         .order_by(UserWatchComplex.created_at.desc())
     ).all()
-    if not watches:
-        return {
-            "count": 0,
-            "page": page,
-            "max_per_complex": max_per_complex,
-            "items": [],
-        }
-
-    client = NaverLandClient(settings=settings)
-    items: list[dict[str, Any]] = []
-    for watch in watches:
-        try:
-            payload = client.fetch_complex_articles(complex_no=watch.complex_no, page=page)
-            summaries = client.summarize_articles(payload)[:max_per_complex]
-            items.append(
-                {
-                    "complex_no": watch.complex_no,
-                    "complex_name": watch.complex_name,
-                    "article_count": len(summaries),
-                    "articles": summaries,
-                }
-            )
-        except Exception as exc:  # pragma: no cover - external API/network branch
-            items.append(
-                {
-                    "complex_no": watch.complex_no,
-                    "complex_name": watch.complex_name,
-                    "article_count": 0,
-                    "articles": [],
-                    "error": str(exc),
-                }
-            )
-
-    return {
-        "count": len(items),
-        "page": page,
-        "max_per_complex": max_per_complex,
-        "items": items,
-    }
+    targets = [(complex_no, complex_name) for complex_no, complex_name in watches]
+    # Return the connection now; the dependency's own cleanup only runs after the stream finishes.
+    db.close()
+
+    return StreamingResponse(
+        _stream_live_watch_items(
+            client=client,
+            targets=targets,
+            page=page,
+            max_per_complex=max_per_complex,
+        ),
+        media_type="application/x-ndjson",
+    )
 
 
 @app.post("/me/watch-complexes")
@@ -1219,36 +1523,38 @@ def me_add_watch_complex(
     gugun_name: str | None = Body(None, embed=True),
     dong_name: str | None = Body(None, embed=True),
     current_user: User = Depends(get_current_user),
+    entitlements: dict[str, object] = Depends(load_entitlements),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     try:
-        enforce_watch_complex_limit(db=db, user_id=current_user.id)
+        enforce_watch_complex_limit(db=db, user_id=current_user.id, entitlements=entitlements)
     except BillingError as exc:
         raise _map_billing_error(exc) from exc
 
-    watch = UserWatchComplex(
-        user_id=current_user.id,
-        complex_no=complex_no,
-        complex_name=complex_name,
-        sido_name=sido_name,
-        gugun_name=gugun_name,
-        dong_name=dong_name,
-        enabled=True,
-    )
-    db.add(watch)
-    try:
-        db.commit()
-    except IntegrityError:
-        db.rollback()
+    # ON CONFLICT keeps the duplicate case to the same single round trip, with no rollback.
+    row = db.execute(
+        pg_insert(UserWatchComplex)
+        .values(
+            user_id=current_user.id,
+            complex_no=complex_no,
+            complex_name=complex_name,
+            sido_name=sido_name,
+            gugun_name=gugun_name,
+            dong_name=dong_name,
+            enabled=True,
+        )
+        .on_conflict_do_nothing(index_elements=[UserWatchComplex.user_id, UserWatchComplex.complex_no])
+        .returning(
+            UserWatchComplex.id,
+            UserWatchComplex.complex_no,
+            UserWatchComplex.complex_name,
+            UserWatchComplex.enabled,
+        )
+    ).mappings().first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Complex already in watch list")
-
-    db.refresh(watch)
-    return {
-        "id": watch.id,
-        "complex_no": watch.complex_no,
-        "complex_name": watch.complex_name,
-        "enabled": watch.enabled,
-    }
+    db.commit()
+    return dict(row)
 
 
 @app.post("/me/watch-complexes/ingest")
@@ -1264,8 +1570,8 @@ def me_ingest_watch_complexes(
     if max_pages < 1 or max_pages > 20:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="max_pages must be between 1 and 20")
 
-    watches = db.scalars(
-        select(UserWatchComplex)
+    watches = db.execute(
+        select(UserWatchComplex.complex_no, UserWatchComplex.complex_name)
         .where(
             UserWatchComplex.user_id == current_user.id,
             UserWatchComplex.enabled.is_(True),
@@ -1287,9 +1593,8 @@ def me_ingest_watch_complexes(
         }
 
     by_complex_name: dict[int, str | None] = {}
-    for watch in watches:
-        if watch.complex_no not in by_complex_name:
-            by_complex_name[watch.complex_no] = watch.complex_name
+    for complex_no, complex_name in watches:
+        by_complex_name.setdefault(complex_no, complex_name)
 
     results: list[dict[str, Any]] = []
     success_count = 0
@@ -1297,40 +1602,58 @@ def me_ingest_watch_complexes(
     reused_count = 0
     total_listing_count = 0
 
-    for complex_no in sorted(by_complex_name.keys()):
-        try:
-            ingest_result = ingest_complex_snapshot(
-                db=db,
+    reuse_window_hours = 0 if force else settings.crawler_reuse_window_hours
+    session_factory = get_session_factory()
+    # Workers use their own sessions; don't hold this connection idle for the whole crawl.
+    db.close()
+
+    def _ingest_one(complex_no: int) -> dict[str, Any]:
+        # Sessions are not thread-safe, so each worker commits through its own.
+        with session_factory() as task_db:
+            return ingest_complex_snapshot(
+                db=task_db,
                 settings=settings,
                 complex_no=complex_no,
                 page=page,
                 max_pages=max_pages,
-                reuse_window_hours=0 if force else settings.crawler_reuse_window_hours,
-            )
-            success_count += 1
-            reused_count += int(ingest_result.get("reused") or 0)
-            total_listing_count += int(ingest_result.get("listing_count") or 0)
-            results.append(
-                {
-                    "complex_no": complex_no,
-                    "complex_name": by_complex_name.get(complex_no),
-                    "ok": True,
-                    **ingest_result,
-                }
-            )
-        except RuntimeError as exc:
-            failure_count += 1
-            mapped = _map_crawler_runtime_error(exc)
-            results.append(
-                {
-                    "complex_no": complex_no,
-                    "complex_name": by_complex_name.get(complex_no),
-                    "ok": False,
-                    "status_code": mapped.status_code,
-                    "error": mapped.detail,
-                }
+                reuse_window_hours=reuse_window_hours,
             )
 
+    complex_nos = sorted(by_complex_name.keys())
+    with ThreadPoolExecutor(max_workers=min(settings.ingest_parallelism, len(complex_nos))) as executor:
+        futures = {executor.submit(_ingest_one, complex_no): complex_no for complex_no in complex_nos}
+        for future in as_completed(futures):
+            complex_no = futures[future]
+            try:
+                ingest_result = future.result()
+                success_count += 1
+                reused_count += int(ingest_result.get("reused") or 0)
+                total_listing_count += int(ingest_result.get("listing_count") or 0)
+                results.append(
+                    {
+                        "complex_no": complex_no,
+                        "complex_name": by_complex_name.get(complex_no),
+                        "ok": True,
+                        **ingest_result,
+                    }
+                )
+            except RuntimeError as exc:
+                failure_count += 1
+                mapped = _map_crawler_runtime_error(exc)
+                results.append(
+                    {
+                        "complex_no": complex_no,
+                        "complex_name": by_complex_name.get(complex_no),
+                        "ok": False,
+                        "status_code": mapped.status_code,
+                        "error": mapped.detail,
+                    }
+                )
+    results.sort(key=itemgetter("complex_no"))
+    if settings.analytics_baseline_view_enabled and success_count > reused_count:
+        with session_factory() as refresh_db:
+            refresh_price_baseline_view_after_ingest(db=refresh_db)
+
     return {
         "requested_complex_count": len(by_complex_name),
         "processed_complex_count": len(results),
@@ -1368,25 +1691,22 @@ def me_delete_watch_complex(
 @app.get("/me/presets")
 def me_presets(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> dict[str, list[dict[str, Any]]]:
-    rows = db.scalars(
-        select(UserPreset).where(UserPreset.user_id == current_user.id).order_by(UserPreset.created_at.desc())
-    ).all()
-    return {
-        "items": [
-            {
-                "id": str(item.id),
-                "name": item.name,
-                "target_type": item.target_type,
-                "filter_payload": item.filter_payload,
-                "chart_payload": item.chart_payload,
-                "created_at": item.created_at.isoformat() if item.created_at else None,
-                "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-            }
-            for item in rows
-        ]
-    }
+    db: Session = Depends(get_read_db),
+) -> ORJSONResponse:
+    rows = db.execute(
+        select(
+            UserPreset.id,
+            UserPreset.name,
+            UserPreset.target_type,
+            UserPreset.filter_payload,
+            UserPreset.chart_payload,
+            UserPreset.created_at,
+            UserPreset.updated_at,
+        )
+        .where(UserPreset.user_id == current_user.id)
+        .order_by(UserPreset.created_at.desc())
+    ).mappings().all()
+    return ORJSONResponse({"items": rows})
 
 
 @app.post("/me/presets")
@@ -1396,34 +1716,41 @@ def me_add_preset(
     filter_payload: dict[str, Any] = Body(default_factory=dict, embed=True),
     chart_payload: dict[str, Any] = Body(default_factory=dict, embed=True),
     current_user: User = Depends(get_current_user),
+    entitlements: dict[str, object] = Depends(load_entitlements),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     try:
-        enforce_preset_limit(db=db, user_id=current_user.id)
+        enforce_preset_limit(db=db, user_id=current_user.id, entitlements=entitlements)
     except BillingError as exc:
         raise _map_billing_error(exc) from exc
 
-    preset = UserPreset(
-        user_id=current_user.id,
-        name=name.strip(),
-        target_type=target_type.strip().lower(),
-        filter_payload=filter_payload,
-        chart_payload=chart_payload,
-    )
-    db.add(preset)
-    try:
-        db.commit()
-    except IntegrityError:
-        db.rollback()
+    row = db.execute(
+        pg_insert(UserPreset)
+        .values(
+            user_id=current_user.id,
+            name=name.strip(),
+            target_type=target_type.strip().lower(),
+            filter_payload=filter_payload,
+            chart_payload=chart_payload,
+        )
+        .on_conflict_do_nothing(index_elements=[UserPreset.user_id, UserPreset.name])
+        .returning(
+            UserPreset.id,
+            UserPreset.name,
+            UserPreset.target_type,
+            UserPreset.filter_payload,
+            UserPreset.chart_payload,
+        )
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Preset name already exists")
-
-    db.refresh(preset)
+    db.commit()
     return {
-        "id": str(preset.id),
-        "name": preset.name,
-        "target_type": preset.target_type,
-        "filter_payload": preset.filter_payload,
-        "chart_payload": preset.chart_payload,
+        "id": str(row.id),
+        "name": row.name,
+        "target_type": row.target_type,
+        "filter_payload": row.filter_payload,
+        "chart_payload": row.chart_payload,
     }
 
 
@@ -1434,7 +1761,7 @@ def me_bargain_alerts(
     trade_type_name: str | None = None,
     monthly_conversion_rate_pct: float | None = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict[str, Any]:
     setting = db.get(UserNotificationSetting, current_user.id)
     resolved_lookback_days = lookback_days or (setting.bargain_lookback_days if setting else 30)
@@ -1457,14 +1784,7 @@ def me_bargain_alerts(
     }
 
 
-@app.get("/me/notification-settings")
-def me_notification_settings(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> dict[str, Any]:
-    setting = _get_or_create_notification_setting(db=db, user=current_user)
-    db.commit()
-    db.refresh(setting)
+def _serialize_notification_setting(setting: Any) -> dict[str, Any]:
     return {
         "email_enabled": setting.email_enabled,
         "email_address": setting.email_address,
@@ -1484,6 +1804,19 @@ def me_notification_settings(
     }
 
 
+@app.get("/me/notification-settings")
+def me_notification_settings(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> dict[str, Any]:
+    setting = db.get(UserNotificationSetting, current_user.id)
+    if setting is None:
+        setting = _get_or_create_notification_setting(db=db, user=current_user)
+        db.commit()
+        db.refresh(setting)
+    return _serialize_notification_setting(setting)
+
+
 @app.put("/me/notification-settings")
 def me_update_notification_settings(
     email_enabled: bool | None = Body(default=None, embed=True),
@@ -1499,70 +1832,73 @@ def me_update_notification_settings(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    setting = _get_or_create_notification_setting(db=db, user=current_user)
+    values: dict[str, Any] = {}
 
     if email_enabled is not None:
-        setting.email_enabled = email_enabled
+        values["email_enabled"] = email_enabled
     if email_address is not None:
-        setting.email_address = email_address.strip() or None
+        values["email_address"] = email_address.strip() or None
     if telegram_enabled is not None:
-        setting.telegram_enabled = telegram_enabled
+        values["telegram_enabled"] = telegram_enabled
     if telegram_chat_id is not None:
-        setting.telegram_chat_id = telegram_chat_id.strip() or None
+        values["telegram_chat_id"] = telegram_chat_id.strip() or None
     if bargain_alert_enabled is not None:
-        setting.bargain_alert_enabled = bargain_alert_enabled
+        values["bargain_alert_enabled"] = bargain_alert_enabled
     if bargain_lookback_days is not None:
         if bargain_lookback_days < 1 or bargain_lookback_days > 180:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid bargain_lookback_days")
-        setting.bargain_lookback_days = bargain_lookback_days
+        values["bargain_lookback_days"] = bargain_lookback_days
     if bargain_discount_threshold is not None:
         if bargain_discount_threshold <= 0 or bargain_discount_threshold >= 1:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid bargain_discount_threshold")
-        setting.bargain_discount_threshold = bargain_discount_threshold
+        values["bargain_discount_threshold"] = bargain_discount_threshold
     if interest_trade_type is not None:
-        setting.interest_trade_type = _normalize_interest_trade_type(interest_trade_type)
+        values["interest_trade_type"] = _normalize_interest_trade_type(interest_trade_type)
     if monthly_rent_conversion_rate_use_default:
-        setting.monthly_rent_conversion_rate_pct = None
+        values["monthly_rent_conversion_rate_pct"] = None
     if monthly_rent_conversion_rate_pct is not None:
         if monthly_rent_conversion_rate_pct < 0.1 or monthly_rent_conversion_rate_pct > 30.0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid monthly_rent_conversion_rate_pct",
             )
-        setting.monthly_rent_conversion_rate_pct = monthly_rent_conversion_rate_pct
+        values["monthly_rent_conversion_rate_pct"] = monthly_rent_conversion_rate_pct
+
+    if not values:
+        return me_notification_settings(current_user=current_user, db=db)
+
+    # UPDATE ... RETURNING hands back the post-update row (including onupdate updated_at) without a refresh.
+    row = db.execute(
+        update(UserNotificationSetting)
+        .where(UserNotificationSetting.user_id == current_user.id)
+        .values(**values)
+        .returning(*UserNotificationSetting.__table__.c)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is not None:
+        db.commit()
+        return _serialize_notification_setting(row)
 
+    setting = _get_or_create_notification_setting(db=db, user=current_user)
+    for key, value in values.items():
+        setattr(setting, key, value)
     db.commit()
     db.refresh(setting)
-    return {
-        "email_enabled": setting.email_enabled,
-        "email_address": setting.email_address,
-        "telegram_enabled": setting.telegram_enabled,
-        "telegram_chat_id": setting.telegram_chat_id,
-        "bargain_alert_enabled": setting.bargain_alert_enabled,
-        "bargain_lookback_days": setting.bargain_lookback_days,
-        "bargain_discount_threshold": setting.bargain_discount_threshold,
-        "interest_trade_type": _normalize_interest_trade_type(setting.interest_trade_type),
-        "monthly_rent_conversion_rate_pct": setting.monthly_rent_conversion_rate_pct,
-        "resolved_monthly_conversion_rate_pct": (
-            setting.monthly_rent_conversion_rate_pct
-            if setting.monthly_rent_conversion_rate_pct is not None
-            else settings.jeonse_monthly_conversion_rate_default
-        ),
-        "updated_at": setting.updated_at.isoformat() if setting.updated_at else None,
-    }
+    return _serialize_notification_setting(setting)
 
 
 @app.post("/me/alerts/bargains/dispatch")
 def me_dispatch_bargain_alerts(
     current_user: User = Depends(get_current_user),
+    request_context: RequestContext = Depends(load_request_context),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     try:
-        enforce_manual_alert_dispatch(db=db, user_id=current_user.id)
+        enforce_manual_alert_dispatch(db=db, user_id=current_user.id, entitlements=request_context.entitlements)
     except BillingError as exc:
         raise _map_billing_error(exc) from exc
 
-    setting = db.get(UserNotificationSetting, current_user.id)
+    setting = request_context.notification_setting
     if setting is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Notification setting not configured")
 
@@ -1573,6 +1909,7 @@ def me_dispatch_bargain_alerts(
         discount_threshold=setting.bargain_discount_threshold,
         requested_trade_type_name=setting.interest_trade_type,
         requested_monthly_conversion_rate_pct=setting.monthly_rent_conversion_rate_pct,
+        context=request_context,
     )
     dispatch_result = dispatch_user_bargain_alerts(
         db=db,
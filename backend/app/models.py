@@ -1,7 +1,23 @@
+import os
+import time
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import BigInteger, Boolean, Date, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -9,10 +25,18 @@ from sqlalchemy.sql import func
 from app.db import Base
 
 
+def uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: a 48-bit millisecond timestamp prefix keeps new primary keys at the right edge of the btree."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -58,7 +82,16 @@ class User(Base):
 
 class UserWatchComplex(Base):
     __tablename__ = "user_watch_complexes"
-    __table_args__ = (UniqueConstraint("user_id", "complex_no", name="uq_user_complex"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "complex_no", name="uq_user_complex"),
+        Index(
+            "ix_user_watch_user_enabled_created",
+            "user_id",
+            "enabled",
+            text("created_at DESC"),
+            postgresql_include=["complex_no", "complex_name"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -75,6 +108,7 @@ class UserWatchComplex(Base):
 
 class CrawlRun(Base):
     __tablename__ = "crawl_runs"
+    __table_args__ = (Index("ix_crawl_runs_complex_status_started", "complex_no", "status", text("started_at DESC")),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     complex_no: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
@@ -89,7 +123,28 @@ class CrawlRun(Base):
 
 class ListingSnapshot(Base):
     __tablename__ = "listing_snapshots"
-    __table_args__ = (UniqueConstraint("crawl_run_id", "article_no", name="uq_run_article"),)
+    __table_args__ = (
+        UniqueConstraint("crawl_run_id", "article_no", name="uq_run_article"),
+        Index(
+            "ix_listing_run_trade",
+            "crawl_run_id",
+            "trade_type_name",
+            postgresql_include=["deal_price_manwon", "rent_price_manwon", "article_no"],
+        ),
+        Index(
+            "ix_listing_deal_price_sale",
+            "complex_no",
+            "observed_at",
+            "deal_price_manwon",
+            postgresql_where=text("trade_type_name = '매매' AND deal_price_manwon IS NOT NULL"),
+        ),
+        Index(
+            "ix_snap_complex_time_cover",
+            "complex_no",
+            text("observed_at DESC"),
+            postgresql_include=["deal_price_manwon", "rent_price_manwon", "trade_type_name"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     crawl_run_id: Mapped[int] = mapped_column(Integer, ForeignKey("crawl_runs.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -115,7 +170,7 @@ class UserPreset(Base):
     __tablename__ = "user_presets"
     __table_args__ = (UniqueConstraint("user_id", "name", name="uq_user_preset_name"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     target_type: Mapped[str] = mapped_column(String(20), nullable=False, default="complex")
@@ -160,7 +215,7 @@ class UserSubscription(Base):
 class BillingCheckoutSession(Base):
     __tablename__ = "billing_checkout_sessions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     provider: Mapped[str] = mapped_column(String(20), nullable=False, default="dummy")
     plan_code: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -186,15 +241,23 @@ class AuthRefreshToken(Base):
     __table_args__ = (
         UniqueConstraint("jti", name="uq_refresh_jti"),
         UniqueConstraint("token_hash", name="uq_refresh_token_hash"),
+        Index(
+            "ix_refresh_tokens_active_user_jti",
+            "user_id",
+            "jti",
+            postgresql_include=["token_hash"],
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    jti: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
-    token_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    jti: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    # Raw SHA-256 digest of the refresh token.
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    replaced_by_jti: Mapped[str | None] = mapped_column(String(64))
+    replaced_by_jti: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user: Mapped["User"] = relationship(back_populates="refresh_tokens")
@@ -218,11 +281,14 @@ class AuthEmailVerificationToken(Base):
 
 class AuthAccessTokenRevocation(Base):
     __tablename__ = "auth_access_token_revocations"
-    __table_args__ = (UniqueConstraint("jti", name="uq_access_jti"),)
+    __table_args__ = (
+        UniqueConstraint("jti", name="uq_access_jti"),
+        Index("ix_access_revocations_user_jti_expires", "user_id", "jti", "expires_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    jti: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    jti: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     revoked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -268,7 +334,8 @@ class AlertDispatchLog(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     channel: Mapped[str] = mapped_column(String(20), nullable=False)
     alert_type: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
-    dedupe_key: Mapped[str] = mapped_column(String(200), nullable=False)
+    # MD5 digest of a readable label such as "bargain:{complex_no}:{article_no}:{deal_price_manwon}".
+    dedupe_key: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
     sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -1,15 +1,27 @@
+import hashlib
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from cachetools import TTLCache
+from sqlalchemy import LargeBinary, Select, any_, desc, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, array_agg
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models import AlertDispatchLog, CrawlRun, ListingSnapshot, User, UserNotificationSetting, UserWatchComplex
-from app.services.analytics import detect_bargains, to_effective_price_manwon
+from app.services.analytics import detect_bargains_bulk, effective_price_manwon_expr
 from app.services.notifier import build_bargain_alert_text, send_email_message, send_telegram_message
 from app.settings import Settings
 
 
+_RUN_STATS_CACHE: TTLCache = TTLCache(maxsize=20_000, ttl=6 * 3600)
+_RUN_STATS_LOCK = threading.Lock()
+
+
 def _normalize_interest_trade_type(raw: str | None) -> str:
     normalized = (raw or "").strip()
     if not normalized or normalized.upper() == "ALL":
@@ -37,38 +49,130 @@ def collect_user_bargains(
     monthly_conversion_rate_pct: float = 5.1,
     only_complex_no: int | None = None,
 ) -> list[dict[str, Any]]:
-    stmt = select(UserWatchComplex).where(UserWatchComplex.user_id == user_id, UserWatchComplex.enabled.is_(True))
+    stmt = select(UserWatchComplex.complex_no, UserWatchComplex.complex_name).where(
+        UserWatchComplex.user_id == user_id,
+        UserWatchComplex.enabled.is_(True),
+    )
     if only_complex_no is not None:
         stmt = stmt.where(UserWatchComplex.complex_no == only_complex_no)
-    watches = db.scalars(stmt).all()
-    if not watches:
+    name_by_no: dict[int, str | None] = dict(db.execute(stmt).all())
+    if not name_by_no:
         return []
 
+    bargains_by_no = detect_bargains_bulk(
+        db=db,
+        complex_nos=list(name_by_no),
+        lookback_days=lookback_days,
+        discount_threshold=discount_threshold,
+        trade_type_name=trade_type_name,
+        monthly_conversion_rate_pct=monthly_conversion_rate_pct,
+    )
     alerts: list[dict[str, Any]] = []
-    for watch in watches:
-        rows = detect_bargains(
-            db=db,
-            complex_no=watch.complex_no,
-            lookback_days=lookback_days,
-            discount_threshold=discount_threshold,
-            trade_type_name=trade_type_name,
-            monthly_conversion_rate_pct=monthly_conversion_rate_pct,
-        )
+    for complex_no, rows in bargains_by_no.items():
+        complex_name = name_by_no[complex_no]
         for row in rows:
-            row["complex_no"] = watch.complex_no
-            row["complex_name"] = watch.complex_name
+            row["complex_no"] = complex_no
+            row["complex_name"] = complex_name
             alerts.append(row)
 
-    alerts.sort(key=lambda row: row["discount_rate"], reverse=True)
+    alerts.sort(key=itemgetter("discount_rate"), reverse=True)
     return alerts
 
 
-def _bargain_dedupe_key(item: dict[str, Any]) -> str:
-    return "bargain:{complex_no}:{article_no}:{deal_price_manwon}".format(
-        complex_no=item.get("complex_no"),
-        article_no=item.get("article_no"),
-        deal_price_manwon=item.get("deal_price_manwon"),
+def load_notification_recipients(
+    db: Session,
+    user_ids: Select | list[UUID],
+) -> list[tuple[User, UserNotificationSetting]]:
+    # Users and their settings come back in one joined query, so dispatch loops never lazy-load per user.
+    stmt = (
+        select(User, UserNotificationSetting)
+        .join(UserNotificationSetting, UserNotificationSetting.user_id == User.id)
+        .where(User.id.in_(user_ids), User.is_active.is_(True))
     )
+    return [(user, setting) for user, setting in db.execute(stmt).all()]
+
+
+def _dedupe_digest(label: str) -> bytes:
+    # 16-byte MD5 so migration 20260316_0015 could convert existing text keys in SQL with md5(); not a security use.
+    return hashlib.md5(label.encode("utf-8"), usedforsecurity=False).digest()
+
+
+def _bargain_dedupe_key(item: dict[str, Any]) -> bytes:
+    return _dedupe_digest(f"bargain:{item.get('complex_no')}:{item.get('article_no')}:{item.get('deal_price_manwon')}")
+
+
+def _query_run_listing_stats(
+    db: Session,
+    run_ids: list[int],
+    trade_type_name: str,
+    conversion_rate: float,
+) -> dict[int, Any]:
+    priced_stmt = select(
+        ListingSnapshot.crawl_run_id,
+        ListingSnapshot.article_no,
+        ListingSnapshot.article_name,
+        ListingSnapshot.deal_price_text,
+        effective_price_manwon_expr(conversion_rate).label("effective_price"),
+    ).where(ListingSnapshot.crawl_run_id.in_(run_ids))
+    if trade_type_name:
+        priced_stmt = priced_stmt.where(ListingSnapshot.trade_type_name == trade_type_name)
+    priced = priced_stmt.subquery()
+
+    # (array_agg(x ORDER BY price))[1] picks the column values of the cheapest/priciest listing per run.
+    cheapest_first = priced.c.effective_price.asc()
+    priciest_first = priced.c.effective_price.desc()
+    stats_stmt = (
+        select(
+            priced.c.crawl_run_id,
+            func.count().label("listing_count"),
+            func.min(priced.c.effective_price).label("min_price"),
+            func.max(priced.c.effective_price).label("max_price"),
+            func.avg(priced.c.effective_price).label("avg_price"),
+            array_agg(aggregate_order_by(priced.c.article_no, cheapest_first))[1].label("min_article_no"),
+            array_agg(aggregate_order_by(priced.c.article_name, cheapest_first))[1].label("min_article_name"),
+            array_agg(aggregate_order_by(priced.c.deal_price_text, cheapest_first))[1].label("min_deal_price_text"),
+            array_agg(aggregate_order_by(priced.c.article_no, priciest_first))[1].label("max_article_no"),
+            array_agg(aggregate_order_by(priced.c.deal_price_text, priciest_first))[1].label("max_deal_price_text"),
+        )
+        .where(priced.c.effective_price.is_not(None))
+        .group_by(priced.c.crawl_run_id)
+    )
+    return {int(row.crawl_run_id): row for row in db.execute(stats_stmt).all()}
+
+
+def _load_run_listing_stats(
+    db: Session,
+    run_ids: list[int],
+    trade_type_name: str,
+    conversion_rate: float,
+) -> dict[int, Any]:
+    # A finished crawl run's listings never change, so stats keyed by run id are shared across every user
+    # watching the complex with the same trade type and rate. Runs without priced listings cache as None.
+    keys = {run_id: (run_id, trade_type_name, conversion_rate) for run_id in run_ids}
+    stats_by_run: dict[int, Any] = {}
+    with _RUN_STATS_LOCK:
+        for run_id, key in keys.items():
+            if key in _RUN_STATS_CACHE:
+                stats_by_run[run_id] = _RUN_STATS_CACHE[key]
+
+    missing_run_ids = [run_id for run_id in run_ids if run_id not in stats_by_run]
+    if missing_run_ids:
+        fetched = _query_run_listing_stats(
+            db=db,
+            run_ids=missing_run_ids,
+            trade_type_name=trade_type_name,
+            conversion_rate=conversion_rate,
+        )
+        with _RUN_STATS_LOCK:
+            for run_id in missing_run_ids:
+                stats_by_run[run_id] = fetched.get(run_id)
+                _RUN_STATS_CACHE[keys[run_id]] = stats_by_run[run_id]
+    return stats_by_run
+
+
+def clear_run_stats_cache() -> None:
+    with _RUN_STATS_LOCK:
+        _RUN_STATS_CACHE.clear()
 
 
 def collect_user_daily_briefing(
@@ -80,8 +184,9 @@ def collect_user_daily_briefing(
     trade_type_name = _normalize_interest_trade_type(notification_setting.interest_trade_type)
     conversion_rate = _resolve_monthly_conversion_rate(settings=settings, notification_setting=notification_setting)
 
-    watches = db.scalars(
-        select(UserWatchComplex)
+    # Only two columns are read per watch, so skip hydrating UserWatchComplex entities.
+    watches = db.execute(
+        select(UserWatchComplex.complex_no, UserWatchComplex.complex_name)
         .where(UserWatchComplex.user_id == user_id, UserWatchComplex.enabled.is_(True))
         .order_by(UserWatchComplex.created_at.asc())
     ).all()
@@ -94,80 +199,69 @@ def collect_user_daily_briefing(
             "bargains": [],
         }
 
-    complex_summaries: list[dict[str, Any]] = []
-    overall_rows: list[dict[str, Any]] = []
-    for watch in watches:
-        latest_run_id = db.scalar(
-            select(CrawlRun.id)
-            .where(CrawlRun.complex_no == watch.complex_no, CrawlRun.status == "SUCCESS")
-            .order_by(desc(CrawlRun.started_at))
-            .limit(1)
+    latest_run_stmt = (
+        select(CrawlRun.id, CrawlRun.complex_no)
+        .where(
+            CrawlRun.complex_no.in_({watch.complex_no for watch in watches}),
+            CrawlRun.status == "SUCCESS",
         )
-        if latest_run_id is None:
-            continue
+        .distinct(CrawlRun.complex_no)
+        .order_by(CrawlRun.complex_no, desc(CrawlRun.started_at))
+    )
+    latest_run_by_complex = {int(row.complex_no): int(row.id) for row in db.execute(latest_run_stmt).all()}
 
-        listing_stmt = select(ListingSnapshot).where(ListingSnapshot.crawl_run_id == latest_run_id)
-        if trade_type_name:
-            listing_stmt = listing_stmt.where(ListingSnapshot.trade_type_name == trade_type_name)
-        listings = db.scalars(listing_stmt).all()
-
-        priced_rows: list[dict[str, Any]] = []
-        for item in listings:
-            effective_price = to_effective_price_manwon(
-                trade_type_name=item.trade_type_name,
-                deal_price_manwon=item.deal_price_manwon,
-                rent_price_manwon=item.rent_price_manwon,
-                monthly_conversion_rate_pct=conversion_rate,
-            )
-            if effective_price is None:
-                continue
-            priced_rows.append(
-                {
-                    "effective_price_manwon": float(effective_price),
-                    "deal_price_text": item.deal_price_text,
-                    "article_no": item.article_no,
-                    "article_name": item.article_name,
-                }
-            )
+    stats_by_run = _load_run_listing_stats(
+        db=db,
+        run_ids=list(latest_run_by_complex.values()),
+        trade_type_name=trade_type_name,
+        conversion_rate=conversion_rate,
+    )
+    stats_by_complex = {
+        complex_no: stats_by_run[run_id]
+        for complex_no, run_id in latest_run_by_complex.items()
+        if stats_by_run.get(run_id) is not None
+    }
 
-        if not priced_rows:
+    complex_summaries: list[dict[str, Any]] = []
+    overall_min: dict[str, Any] | None = None
+    overall_count = 0
+    overall_total = 0.0
+    for watch in watches:
+        stats = stats_by_complex.get(watch.complex_no)
+        if stats is None:
             continue
 
-        priced_rows.sort(key=lambda row: row["effective_price_manwon"])
-        min_row = priced_rows[0]
-        max_row = priced_rows[-1]
-        avg_price = sum(row["effective_price_manwon"] for row in priced_rows) / len(priced_rows)
         summary = {
             "complex_no": watch.complex_no,
             "complex_name": watch.complex_name,
-            "listing_count": len(priced_rows),
-            "min_effective_price_manwon": min_row["effective_price_manwon"],
-            "max_effective_price_manwon": max_row["effective_price_manwon"],
-            "avg_effective_price_manwon": avg_price,
-            "min_article_no": min_row["article_no"],
-            "max_article_no": max_row["article_no"],
-            "min_deal_price_text": min_row["deal_price_text"],
-            "max_deal_price_text": max_row["deal_price_text"],
+            "listing_count": stats.listing_count,
+            "min_effective_price_manwon": float(stats.min_price),
+            "max_effective_price_manwon": float(stats.max_price),
+            "avg_effective_price_manwon": float(stats.avg_price),
+            "min_article_no": stats.min_article_no,
+            "max_article_no": stats.max_article_no,
+            "min_deal_price_text": stats.min_deal_price_text,
+            "max_deal_price_text": stats.max_deal_price_text,
         }
         complex_summaries.append(summary)
 
-        for row in priced_rows:
-            overall_rows.append(
-                {
-                    "complex_no": watch.complex_no,
-                    "complex_name": watch.complex_name,
-                    **row,
-                }
-            )
+        overall_count += stats.listing_count
+        overall_total += float(stats.avg_price) * stats.listing_count
+        if overall_min is None or summary["min_effective_price_manwon"] < overall_min["effective_price_manwon"]:
+            overall_min = {
+                "complex_no": watch.complex_no,
+                "complex_name": watch.complex_name,
+                "effective_price_manwon": summary["min_effective_price_manwon"],
+                "deal_price_text": stats.min_deal_price_text,
+                "article_no": stats.min_article_no,
+                "article_name": stats.min_article_name,
+            }
 
     overall: dict[str, Any] | None = None
-    if overall_rows:
-        overall_rows.sort(key=lambda row: row["effective_price_manwon"])
-        overall_min = overall_rows[0]
-        overall_avg = sum(row["effective_price_manwon"] for row in overall_rows) / len(overall_rows)
+    if overall_min is not None:
         overall = {
-            "listing_count": len(overall_rows),
-            "avg_effective_price_manwon": overall_avg,
+            "listing_count": overall_count,
+            "avg_effective_price_manwon": overall_total / overall_count,
             "min_item": overall_min,
         }
 
@@ -243,16 +337,39 @@ def build_daily_briefing_text(briefing: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _already_sent_daily_briefing(db: Session, user_id: UUID, channel: str, dedupe_key: str) -> bool:
-    existing = db.scalar(
-        select(AlertDispatchLog.id).where(
-            AlertDispatchLog.user_id == user_id,
-            AlertDispatchLog.channel == channel,
-            AlertDispatchLog.alert_type == "daily_briefing",
-            AlertDispatchLog.dedupe_key == dedupe_key,
+def _send_daily_briefing_once(
+    db: Session,
+    user_id: UUID,
+    channel: str,
+    dedupe_key: bytes,
+    payload: dict[str, Any],
+    send: Callable[[], tuple[bool, str]],
+) -> tuple[bool, str]:
+    # The log row is claimed before sending, so a concurrent dispatcher blocks on the unique key and then skips;
+    # a failed send rolls the savepoint back and leaves the briefing eligible for the next tick.
+    savepoint = db.begin_nested()
+    claimed_id = db.execute(
+        pg_insert(AlertDispatchLog)
+        .values(
+            user_id=user_id,
+            channel=channel,
+            alert_type="daily_briefing",
+            dedupe_key=dedupe_key,
+            payload=payload,
         )
-    )
-    return existing is not None
+        .on_conflict_do_nothing(constraint="uq_alert_dispatch_dedupe")
+        .returning(AlertDispatchLog.id)
+    ).scalar_one_or_none()
+    if claimed_id is None:
+        savepoint.rollback()
+        return False, "already sent"
+
+    ok, reason = send()
+    if ok:
+        savepoint.commit()
+    else:
+        savepoint.rollback()
+    return ok, reason
 
 
 def dispatch_user_daily_briefing(
@@ -282,7 +399,7 @@ def dispatch_user_daily_briefing(
 
     result["has_data"] = True
     message = build_daily_briefing_text(briefing)
-    dedupe_key = f"daily_briefing:{briefing_date_key}"
+    dedupe_key = _dedupe_digest(f"daily_briefing:{briefing_date_key}")
     payload = {
         "briefing_date_key": briefing_date_key,
         "trade_type_name": briefing.get("trade_type_name"),
@@ -292,49 +409,37 @@ def dispatch_user_daily_briefing(
     }
 
     if notification_setting.email_enabled and notification_setting.email_address:
-        if _already_sent_daily_briefing(db=db, user_id=user.id, channel="email", dedupe_key=dedupe_key):
-            result["email_reason"] = "already sent"
-        else:
-            ok, reason = send_email_message(
+        ok, result["email_reason"] = _send_daily_briefing_once(
+            db=db,
+            user_id=user.id,
+            channel="email",
+            dedupe_key=dedupe_key,
+            payload=payload,
+            send=lambda: send_email_message(
                 settings=settings,
                 to_email=notification_setting.email_address,
                 subject=f"[Naver Apt Briefing] {briefing_date_key} 데일리 브리핑",
                 body=message,
-            )
-            result["email_reason"] = reason
-            if ok:
-                db.add(
-                    AlertDispatchLog(
-                        user_id=user.id,
-                        channel="email",
-                        alert_type="daily_briefing",
-                        dedupe_key=dedupe_key,
-                        payload=payload,
-                    )
-                )
-                result["email_sent"] = 1
+            ),
+        )
+        if ok:
+            result["email_sent"] = 1
 
     if notification_setting.telegram_enabled and notification_setting.telegram_chat_id:
-        if _already_sent_daily_briefing(db=db, user_id=user.id, channel="telegram", dedupe_key=dedupe_key):
-            result["telegram_reason"] = "already sent"
-        else:
-            ok, reason = send_telegram_message(
+        ok, result["telegram_reason"] = _send_daily_briefing_once(
+            db=db,
+            user_id=user.id,
+            channel="telegram",
+            dedupe_key=dedupe_key,
+            payload=payload,
+            send=lambda: send_telegram_message(
                 settings=settings,
                 chat_id=notification_setting.telegram_chat_id,
                 text=message,
-            )
-            result["telegram_reason"] = reason
-            if ok:
-                db.add(
-                    AlertDispatchLog(
-                        user_id=user.id,
-                        channel="telegram",
-                        alert_type="daily_briefing",
-                        dedupe_key=dedupe_key,
-                        payload=payload,
-                    )
-                )
-                result["telegram_sent"] = 1
+            ),
+        )
+        if ok:
+            result["telegram_sent"] = 1
 
     return result
 
@@ -342,27 +447,66 @@ def dispatch_user_daily_briefing(
 def _filter_unsent_items(
     db: Session,
     user_id: UUID,
-    channel: str,
+    channels: list[str],
     items: list[dict[str, Any]],
-) -> tuple[list[dict[str, Any]], list[str]]:
+) -> dict[str, tuple[list[dict[str, Any]], list[bytes]]]:
     dedupe_pairs = [(_bargain_dedupe_key(item), item) for item in items]
     keys = [key for key, _item in dedupe_pairs]
-    if not keys:
-        return [], []
-
-    existing_keys = set(
-        db.scalars(
-            select(AlertDispatchLog.dedupe_key).where(
-                AlertDispatchLog.user_id == user_id,
-                AlertDispatchLog.channel == channel,
-                AlertDispatchLog.alert_type == "bargain",
-                AlertDispatchLog.dedupe_key.in_(keys),
-            )
-        ).all()
+    if not keys or not channels:
+        return {channel: ([], []) for channel in channels}
+
+    # Every enabled channel is checked in one query; rows are split per channel below.
+    sent_keys: dict[str, set[bytes]] = {channel: set() for channel in channels}
+    rows = db.execute(
+        select(AlertDispatchLog.channel, AlertDispatchLog.dedupe_key).where(
+            AlertDispatchLog.user_id == user_id,
+            AlertDispatchLog.channel.in_(channels),
+            AlertDispatchLog.alert_type == "bargain",
+            # A single array parameter keeps the statement text constant regardless of len(keys).
+            AlertDispatchLog.dedupe_key == any_(literal(keys, ARRAY(LargeBinary))),
+        )
+    ).all()
+    for channel, key in rows:
+        sent_keys[channel].add(key)
+
+    unsent: dict[str, tuple[list[dict[str, Any]], list[bytes]]] = {}
+    for channel in channels:
+        existing_keys = sent_keys[channel]
+        unsent_items: list[dict[str, Any]] = []
+        unsent_keys: list[bytes] = []
+        for key, item in dedupe_pairs:
+            if key not in existing_keys:
+                unsent_items.append(item)
+                unsent_keys.append(key)
+        unsent[channel] = (unsent_items, unsent_keys)
+    return unsent
+
+
+def _record_bargain_dispatches(
+    db: Session,
+    user_id: UUID,
+    channel: str,
+    keys: list[bytes],
+    items: list[dict[str, Any]],
+) -> None:
+    # One multi-row INSERT; rows already logged by a concurrent dispatch are skipped instead of failing the commit.
+    stmt = (
+        pg_insert(AlertDispatchLog)
+        .values(
+            [
+                {
+                    "user_id": user_id,
+                    "channel": channel,
+                    "alert_type": "bargain",
+                    "dedupe_key": key,
+                    "payload": item,
+                }
+                for key, item in zip(keys, items)
+            ]
+        )
+        .on_conflict_do_nothing(constraint="uq_alert_dispatch_dedupe")
     )
-    unsent_items = [item for key, item in dedupe_pairs if key not in existing_keys]
-    unsent_keys = [key for key, _item in dedupe_pairs if key not in existing_keys]
-    return unsent_items, unsent_keys
+    db.execute(stmt)
 
 
 def dispatch_user_bargain_alerts(
@@ -381,53 +525,55 @@ def dispatch_user_bargain_alerts(
     if not items or not notification_setting.bargain_alert_enabled:
         return result
 
+    channels: list[str] = []
     if notification_setting.email_enabled and notification_setting.email_address:
-        email_items, email_keys = _filter_unsent_items(db, user.id, "email", items)
-        if email_items:
-            ok, reason = send_email_message(
-                settings=settings,
-                to_email=notification_setting.email_address,
-                subject="[Naver Apt Briefing] 급매 알림",
-                body=build_bargain_alert_text(email_items),
-            )
-            result["email_reason"] = reason
-            if ok:
-                db.add_all(
-                    [
-                        AlertDispatchLog(
-                            user_id=user.id,
-                            channel="email",
-                            alert_type="bargain",
-                            dedupe_key=key,
-                            payload=item,
-                        )
-                        for key, item in zip(email_keys, email_items)
-                    ]
+        channels.append("email")
+    if notification_setting.telegram_enabled and notification_setting.telegram_chat_id:
+        channels.append("telegram")
+    unsent_by_channel = _filter_unsent_items(db, user.id, channels, items)
+
+    # Both channels usually have the same unsent set; format the message once per distinct set.
+    texts: dict[tuple[bytes, ...], str] = {}
+
+    def _alert_text(keys: list[bytes], channel_items: list[dict[str, Any]]) -> str:
+        text_key = tuple(keys)
+        if text_key not in texts:
+            texts[text_key] = build_bargain_alert_text(channel_items)
+        return texts[text_key]
+
+    # Sends for both channels run concurrently so a user's wall time is max(RTT) rather than the sum;
+    # dispatch logs are still written from this thread because the session is not thread-safe. The pool is
+    # scoped to this dispatch, so no worker threads outlive it.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="alert-notify") as notify_pool:
+        pending: list[tuple[str, list[bytes], list[dict[str, Any]], Future[tuple[bool, str]]]] = []
+        if "email" in unsent_by_channel:
+            email_items, email_keys = unsent_by_channel["email"]
+            if email_items:
+                future = notify_pool.submit(
+                    send_email_message,
+                    settings=settings,
+                    to_email=notification_setting.email_address,
+                    subject="[Naver Apt Briefing] 급매 알림",
+                    body=_alert_text(email_keys, email_items),
+                )
+                pending.append(("email", email_keys, email_items, future))
+
+        if "telegram" in unsent_by_channel:
+            telegram_items, telegram_keys = unsent_by_channel["telegram"]
+            if telegram_items:
+                future = notify_pool.submit(
+                    send_telegram_message,
+                    settings=settings,
+                    chat_id=notification_setting.telegram_chat_id,
+                    text=_alert_text(telegram_keys, telegram_items),
                 )
-                result["email_sent"] = len(email_items)
+                pending.append(("telegram", telegram_keys, telegram_items, future))
 
-    if notification_setting.telegram_enabled and notification_setting.telegram_chat_id:
-        telegram_items, telegram_keys = _filter_unsent_items(db, user.id, "telegram", items)
-        if telegram_items:
-            ok, reason = send_telegram_message(
-                settings=settings,
-                chat_id=notification_setting.telegram_chat_id,
-                text=build_bargain_alert_text(telegram_items),
-            )
-            result["telegram_reason"] = reason
+        for channel, channel_keys, channel_items, future in pending:
+            ok, reason = future.result()
+            result[f"{channel}_reason"] = reason
             if ok:
-                db.add_all(
-                    [
-                        AlertDispatchLog(
-                            user_id=user.id,
-                            channel="telegram",
-                            alert_type="bargain",
-                            dedupe_key=key,
-                            payload=item,
-                        )
-                        for key, item in zip(telegram_keys, telegram_items)
-                    ]
-                )
-                result["telegram_sent"] = len(telegram_items)
+                _record_bargain_dispatches(db, user.id, channel, channel_keys, channel_items)
+                result[f"{channel}_sent"] = len(channel_items)
 
     return result
@@ -1,11 +1,58 @@
-from collections import defaultdict
+import logging
+import threading
 from datetime import datetime, timedelta, timezone
-from statistics import median
-
-from sqlalchemy import Select, desc, func, select
+from operator import itemgetter
+
+from cachetools import TTLCache
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Float,
+    Integer,
+    MetaData,
+    Select,
+    String,
+    Table,
+    case,
+    cast,
+    column,
+    desc,
+    func,
+    null,
+    select,
+    text,
+    values,
+)
 from sqlalchemy.orm import Session
 
 from app.models import CrawlRun, ListingSnapshot
+from app.settings import get_settings
+
+logger = logging.getLogger(__name__)
+_settings = get_settings()
+
+# Listing scans stream through a server-side cursor in batches of this many rows instead of buffering the result.
+_LISTING_SCAN_YIELD_PER = 1000
+
+# A 30-day median barely moves between alert runs, and many users watch the same complexes. Keyed by
+# (complex_no, lookback_days, trade_type, rate, UTC date); None marks complexes without enough listings.
+_BASELINE_MEDIAN_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=900)
+_BASELINE_MEDIAN_LOCK = threading.Lock()
+
+# Materialized view created by migration 20260305_0009; kept off Base.metadata so create_all never
+# turns it into a plain table. Refreshed by the scheduler after each ingest tick.
+PRICE_BASELINE_VIEW_DAYS = 30
+# For these trade types the effective price is the deal price, so the median does not depend on the
+# caller's monthly conversion rate and can be precomputed.
+_BASELINE_VIEW_TRADE_TYPES = frozenset({"매매", "전세"})
+price_baseline_view = Table(
+    "mv_complex_price_baseline",
+    MetaData(),
+    Column("complex_no", Integer),
+    Column("trade_type_name", String(30)),
+    Column("median_price_manwon", Float),
+    Column("listing_count", Integer),
+)
 
 
 def normalize_trade_type_name(trade_type_name: str | None) -> str | None:
@@ -40,6 +87,21 @@ def to_effective_price_manwon(
     return float(deal_price_manwon)
 
 
+def effective_price_manwon_expr(monthly_conversion_rate_pct: float) -> ColumnElement[float]:
+    """SQL counterpart of to_effective_price_manwon over ListingSnapshot columns; NULL where that returns None."""
+    if monthly_conversion_rate_pct <= 0:
+        return null()
+    deal_price = cast(ListingSnapshot.deal_price_manwon, Float)
+    rent_price = cast(ListingSnapshot.rent_price_manwon, Float)
+    return case(
+        (
+            func.btrim(ListingSnapshot.trade_type_name) == "월세",
+            deal_price + rent_price * 12.0 / (monthly_conversion_rate_pct / 100.0),
+        ),
+        else_=deal_price,
+    )
+
+
 def fetch_complex_trend(
     db: Session,
     complex_no: int,
@@ -49,49 +111,40 @@ def fetch_complex_trend(
 ) -> list[dict[str, float | int | str]]:
     since = datetime.now(timezone.utc) - timedelta(days=days)
     normalized_trade_type = normalize_trade_type_name(trade_type_name)
+    effective_price = effective_price_manwon_expr(monthly_conversion_rate_pct)
+    observed_date = func.date(ListingSnapshot.observed_at)
 
     stmt: Select = (
         select(
-            ListingSnapshot.observed_at,
-            ListingSnapshot.trade_type_name,
-            ListingSnapshot.deal_price_manwon,
-            ListingSnapshot.rent_price_manwon,
+            observed_date.label("observed_date"),
+            func.avg(effective_price).label("avg_price"),
+            func.min(effective_price).label("min_price"),
+            func.max(effective_price).label("max_price"),
+            func.count(effective_price).label("listing_count"),
         )
         .where(
             ListingSnapshot.complex_no == complex_no,
             ListingSnapshot.observed_at >= since,
+            ListingSnapshot.deal_price_manwon.is_not(None),
+            effective_price.is_not(None),
         )
+        .group_by(observed_date)
+        .order_by(observed_date)
     )
 
     if normalized_trade_type:
         stmt = stmt.where(ListingSnapshot.trade_type_name == normalized_trade_type)
 
-    rows = db.execute(stmt).all()
-    prices_by_date: dict[str, list[float]] = defaultdict(list)
-    for row in rows:
-        effective_price = to_effective_price_manwon(
-            trade_type_name=row.trade_type_name,
-            deal_price_manwon=row.deal_price_manwon,
-            rent_price_manwon=row.rent_price_manwon,
-            monthly_conversion_rate_pct=monthly_conversion_rate_pct,
-        )
-        if effective_price is None:
-            continue
-        prices_by_date[row.observed_at.date().isoformat()].append(effective_price)
-
-    series: list[dict[str, float | int | str]] = []
-    for date_key in sorted(prices_by_date.keys()):
-        prices = prices_by_date[date_key]
-        series.append(
-            {
-                "date": date_key,
-                "avg_price_manwon": round(sum(prices) / len(prices), 2),
-                "min_price_manwon": round(min(prices), 2),
-                "max_price_manwon": round(max(prices), 2),
-                "listing_count": len(prices),
-            }
-        )
-    return series
+    return [
+        {
+            "date": row.observed_date.isoformat(),
+            "avg_price_manwon": round(float(row.avg_price), 2),
+            "min_price_manwon": round(float(row.min_price), 2),
+            "max_price_manwon": round(float(row.max_price), 2),
+            "listing_count": int(row.listing_count),
+        }
+        for row in db.execute(stmt).all()
+    ]
 
 
 def fetch_compare_trend(
@@ -103,50 +156,38 @@ def fetch_compare_trend(
 ) -> dict[int, list[dict[str, float | int | str]]]:
     since = datetime.now(timezone.utc) - timedelta(days=days)
     normalized_trade_type = normalize_trade_type_name(trade_type_name)
+    effective_price = effective_price_manwon_expr(monthly_conversion_rate_pct)
+    observed_date = func.date(ListingSnapshot.observed_at)
 
     stmt: Select = (
         select(
             ListingSnapshot.complex_no,
-            ListingSnapshot.observed_at,
-            ListingSnapshot.trade_type_name,
-            ListingSnapshot.deal_price_manwon,
-            ListingSnapshot.rent_price_manwon,
+            observed_date.label("observed_date"),
+            func.avg(effective_price).label("avg_price"),
+            func.count(effective_price).label("listing_count"),
         )
         .where(
             ListingSnapshot.complex_no.in_(complex_nos),
             ListingSnapshot.observed_at >= since,
+            ListingSnapshot.deal_price_manwon.is_not(None),
+            effective_price.is_not(None),
         )
+        .group_by(ListingSnapshot.complex_no, observed_date)
+        .order_by(ListingSnapshot.complex_no, observed_date)
     )
 
     if normalized_trade_type:
         stmt = stmt.where(ListingSnapshot.trade_type_name == normalized_trade_type)
 
-    rows = db.execute(stmt).all()
-    grouped: dict[int, dict[str, list[float]]] = {complex_no: defaultdict(list) for complex_no in complex_nos}
-
-    for row in rows:
-        effective_price = to_effective_price_manwon(
-            trade_type_name=row.trade_type_name,
-            deal_price_manwon=row.deal_price_manwon,
-            rent_price_manwon=row.rent_price_manwon,
-            monthly_conversion_rate_pct=monthly_conversion_rate_pct,
-        )
-        if effective_price is None:
-            continue
-        grouped[int(row.complex_no)][row.observed_at.date().isoformat()].append(effective_price)
-
     result: dict[int, list[dict[str, float | int | str]]] = {complex_no: [] for complex_no in complex_nos}
-    for complex_no in complex_nos:
-        for date_key in sorted(grouped[complex_no].keys()):
-            prices = grouped[complex_no][date_key]
-            result[complex_no].append(
-                {
-                    "date": date_key,
-                    "avg_price_manwon": round(sum(prices) / len(prices), 2),
-                    "listing_count": len(prices),
-                }
-            )
-
+    for row in db.execute(stmt).all():
+        result[int(row.complex_no)].append(
+            {
+                "date": row.observed_date.isoformat(),
+                "avg_price_manwon": round(float(row.avg_price), 2),
+                "listing_count": int(row.listing_count),
+            }
+        )
     return result
 
 
@@ -158,83 +199,222 @@ def detect_bargains(
     trade_type_name: str | None = None,
     monthly_conversion_rate_pct: float = 5.1,
 ) -> list[dict[str, float | int | str | None]]:
-    since = datetime.now(timezone.utc) - timedelta(days=lookback_days)
-    normalized_trade_type = normalize_trade_type_name(trade_type_name)
+    results = detect_bargains_bulk(
+        db=db,
+        complex_nos=[complex_no],
+        lookback_days=lookback_days,
+        discount_threshold=discount_threshold,
+        trade_type_name=trade_type_name,
+        monthly_conversion_rate_pct=monthly_conversion_rate_pct,
+    ).get(complex_no, [])
+    results.sort(key=itemgetter("discount_rate"), reverse=True)
+    return results
 
-    baseline_stmt: Select = select(
-        ListingSnapshot.trade_type_name,
-        ListingSnapshot.deal_price_manwon,
-        ListingSnapshot.rent_price_manwon,
-    ).where(
-        ListingSnapshot.complex_no == complex_no,
-        ListingSnapshot.observed_at >= since,
-    )
-    if normalized_trade_type:
-        baseline_stmt = baseline_stmt.where(ListingSnapshot.trade_type_name == normalized_trade_type)
-
-    baseline_prices = [
-        value
-        for value in [
-            to_effective_price_manwon(
-                trade_type_name=row.trade_type_name,
-                deal_price_manwon=row.deal_price_manwon,
-                rent_price_manwon=row.rent_price_manwon,
-                monthly_conversion_rate_pct=monthly_conversion_rate_pct,
-            )
-            for row in db.execute(baseline_stmt).all()
-        ]
-        if value is not None
-    ]
-    if len(baseline_prices) < 5:
-        return []
 
-    baseline_median = float(median(baseline_prices))
+def detect_bargains_bulk(
+    db: Session,
+    complex_nos: list[int],
+    lookback_days: int = 30,
+    discount_threshold: float = 0.08,
+    trade_type_name: str | None = None,
+    monthly_conversion_rate_pct: float = 5.1,
+) -> dict[int, list[dict[str, float | int | str | None]]]:
+    unique_complex_nos = list(dict.fromkeys(complex_nos))
+    if not unique_complex_nos:
+        return {}
 
-    latest_run_stmt: Select = (
-        select(CrawlRun.id)
-        .where(CrawlRun.complex_no == complex_no, CrawlRun.status == "SUCCESS")
-        .order_by(desc(CrawlRun.started_at))
-        .limit(1)
+    normalized_trade_type = normalize_trade_type_name(trade_type_name)
+    baseline_medians = _load_baseline_medians(
+        db=db,
+        complex_nos=unique_complex_nos,
+        lookback_days=lookback_days,
+        trade_type_name=normalized_trade_type,
+        monthly_conversion_rate_pct=monthly_conversion_rate_pct,
     )
-    latest_run_id = db.scalar(latest_run_stmt)
-    if latest_run_id is None:
-        return []
-
-    latest_list_stmt: Select = select(ListingSnapshot).where(
-        ListingSnapshot.crawl_run_id == latest_run_id,
+    if not baseline_medians:
+        return {}
+
+    # Baseline medians (cached or just computed) are shipped as a VALUES list so the latest-run lookup,
+    # candidate scan and discount filter run as one statement; only actual bargains come back.
+    baseline = values(
+        column("complex_no", Integer),
+        column("median_price_manwon", Float),
+        name="baseline",
+    ).data(list(baseline_medians.items()))
+    # Latest successful run per complex (Postgres DISTINCT ON).
+    latest_runs = (
+        select(CrawlRun.id, CrawlRun.complex_no)
+        .where(
+            CrawlRun.complex_no.in_(list(baseline_medians.keys())),
+            CrawlRun.status == "SUCCESS",
+        )
+        .distinct(CrawlRun.complex_no)
+        .order_by(CrawlRun.complex_no, desc(CrawlRun.started_at))
+        .subquery("latest_runs")
+    )
+    effective_price_expr = effective_price_manwon_expr(monthly_conversion_rate_pct)
+    # NULL effective prices yield a NULL discount and drop out of the >= filter.
+    discount_expr = (baseline.c.median_price_manwon - effective_price_expr) / baseline.c.median_price_manwon
+    bargain_stmt: Select = (
+        select(
+            latest_runs.c.complex_no,
+            baseline.c.median_price_manwon,
+            ListingSnapshot.article_no,
+            ListingSnapshot.article_name,
+            ListingSnapshot.trade_type_name,
+            ListingSnapshot.deal_price_text,
+            ListingSnapshot.deal_price_manwon,
+            ListingSnapshot.rent_price_manwon,
+            ListingSnapshot.observed_at,
+            effective_price_expr.label("effective_price_manwon"),
+            discount_expr.label("discount_rate"),
+        )
+        .select_from(ListingSnapshot)
+        .join(latest_runs, ListingSnapshot.crawl_run_id == latest_runs.c.id)
+        .join(baseline, baseline.c.complex_no == latest_runs.c.complex_no)
+        .where(discount_expr >= discount_threshold)
     )
     if normalized_trade_type:
-        latest_list_stmt = latest_list_stmt.where(ListingSnapshot.trade_type_name == normalized_trade_type)
+        bargain_stmt = bargain_stmt.where(ListingSnapshot.trade_type_name == normalized_trade_type)
 
-    candidates = db.scalars(latest_list_stmt).all()
-    results: list[dict[str, float | int | str | None]] = []
+    results: dict[int, list[dict[str, float | int | str | None]]] = {}
+    for item in db.execute(bargain_stmt.execution_options(yield_per=_LISTING_SCAN_YIELD_PER)):
+        results.setdefault(int(item.complex_no), []).append(
+            {
+                "article_no": item.article_no,
+                "article_name": item.article_name,
+                "trade_type_name": item.trade_type_name,
+                "deal_price_text": item.deal_price_text,
+                "deal_price_manwon": item.deal_price_manwon,
+                "rent_price_manwon": item.rent_price_manwon,
+                "effective_price_manwon": round(float(item.effective_price_manwon), 2),
+                "monthly_conversion_rate_pct": monthly_conversion_rate_pct,
+                "baseline_median_manwon": float(item.median_price_manwon),
+                "discount_rate": round(float(item.discount_rate), 4),
+                "observed_at": item.observed_at.isoformat() if item.observed_at else None,
+            }
+        )
+
+    # Rows are left unsorted; callers merging several complexes sort once over the combined list.
+    return results
 
-    for item in candidates:
-        effective_price = to_effective_price_manwon(
-            trade_type_name=item.trade_type_name,
-            deal_price_manwon=item.deal_price_manwon,
-            rent_price_manwon=item.rent_price_manwon,
+
+def _load_baseline_medians(
+    db: Session,
+    complex_nos: list[int],
+    lookback_days: int,
+    trade_type_name: str | None,
+    monthly_conversion_rate_pct: float,
+) -> dict[int, float]:
+    cache_suffix = (
+        lookback_days,
+        trade_type_name,
+        round(monthly_conversion_rate_pct, 2),
+        datetime.now(timezone.utc).date(),
+    )
+    baseline_medians: dict[int, float] = {}
+    missing: list[int] = []
+    with _BASELINE_MEDIAN_LOCK:
+        for complex_no in complex_nos:
+            key = (complex_no, *cache_suffix)
+            if key not in _BASELINE_MEDIAN_CACHE:
+                missing.append(complex_no)
+                continue
+            cached = _BASELINE_MEDIAN_CACHE[key]
+            if cached is not None:
+                baseline_medians[complex_no] = cached
+    if not missing:
+        return baseline_medians
+
+    if (
+        _settings.analytics_baseline_view_enabled
+        and lookback_days == PRICE_BASELINE_VIEW_DAYS
+        and trade_type_name in _BASELINE_VIEW_TRADE_TYPES
+    ):
+        fetched = _fetch_baseline_medians_from_view(
+            db=db,
+            complex_nos=missing,
+            trade_type_name=trade_type_name,
+        )
+    else:
+        fetched = _compute_baseline_medians(
+            db=db,
+            complex_nos=missing,
+            since=datetime.now(timezone.utc) - timedelta(days=lookback_days),
+            trade_type_name=trade_type_name,
             monthly_conversion_rate_pct=monthly_conversion_rate_pct,
         )
-        if effective_price is None:
-            continue
-        discount_rate = (baseline_median - float(effective_price)) / baseline_median
-        if discount_rate >= discount_threshold:
-            results.append(
-                {
-                    "article_no": item.article_no,
-                    "article_name": item.article_name,
-                    "trade_type_name": item.trade_type_name,
-                    "deal_price_text": item.deal_price_text,
-                    "deal_price_manwon": item.deal_price_manwon,
-                    "rent_price_manwon": item.rent_price_manwon,
-                    "effective_price_manwon": round(effective_price, 2),
-                    "monthly_conversion_rate_pct": monthly_conversion_rate_pct,
-                    "baseline_median_manwon": baseline_median,
-                    "discount_rate": round(discount_rate, 4),
-                    "observed_at": item.observed_at.isoformat() if item.observed_at else None,
-                }
-            )
-
-    results.sort(key=lambda row: row["discount_rate"], reverse=True)
-    return results
+
+    with _BASELINE_MEDIAN_LOCK:
+        for complex_no in missing:
+            _BASELINE_MEDIAN_CACHE[(complex_no, *cache_suffix)] = fetched.get(complex_no)
+    baseline_medians.update(fetched)
+    return baseline_medians
+
+
+def clear_baseline_median_cache() -> None:
+    with _BASELINE_MEDIAN_LOCK:
+        _BASELINE_MEDIAN_CACHE.clear()
+
+
+def _fetch_baseline_medians_from_view(
+    db: Session,
+    complex_nos: list[int],
+    trade_type_name: str,
+) -> dict[int, float]:
+    rows = db.execute(
+        select(price_baseline_view.c.complex_no, price_baseline_view.c.median_price_manwon).where(
+            price_baseline_view.c.complex_no.in_(complex_nos),
+            price_baseline_view.c.trade_type_name == trade_type_name,
+            price_baseline_view.c.listing_count >= 5,
+        )
+    ).all()
+    return {int(row.complex_no): float(row.median_price_manwon) for row in rows}
+
+
+def _compute_baseline_medians(
+    db: Session,
+    complex_nos: list[int],
+    since: datetime,
+    trade_type_name: str | None,
+    monthly_conversion_rate_pct: float,
+) -> dict[int, float]:
+    effective_price = effective_price_manwon_expr(monthly_conversion_rate_pct)
+    baseline_stmt: Select = (
+        select(
+            ListingSnapshot.complex_no,
+            func.percentile_cont(0.5).within_group(effective_price).label("median_price_manwon"),
+        )
+        .where(
+            ListingSnapshot.complex_no.in_(complex_nos),
+            ListingSnapshot.observed_at >= since,
+            # Rows without a deal price never yield an effective price; filtering them lets sale scans use
+            # the ix_listing_deal_price_sale partial index.
+            ListingSnapshot.deal_price_manwon.is_not(None),
+        )
+        .group_by(ListingSnapshot.complex_no)
+        # count() over the expression skips NULL effective prices, matching the old "at least 5 priced rows" rule.
+        .having(func.count(effective_price) >= 5)
+    )
+    if trade_type_name:
+        baseline_stmt = baseline_stmt.where(ListingSnapshot.trade_type_name == trade_type_name)
+
+    return {int(row.complex_no): float(row.median_price_manwon) for row in db.execute(baseline_stmt).all()}
+
+
+def refresh_price_baseline_view(db: Session) -> None:
+    db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_complex_price_baseline"))
+    db.commit()
+    # Medians cached from the previous view contents would otherwise outlive the refresh.
+    clear_baseline_median_cache()
+
+
+def refresh_price_baseline_view_after_ingest(db: Session) -> None:
+    """Refresh the view after an on-demand ingest; a failure is logged rather than failing the ingest."""
+    if not _settings.analytics_baseline_view_enabled:
+        return
+    try:
+        refresh_price_baseline_view(db=db)
+    except Exception:
+        db.rollback()
+        logger.exception("Price baseline view refresh after ingest failed.")
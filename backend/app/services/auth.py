@@ -3,14 +3,43 @@ import hashlib
 import hmac
 import secrets
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 import jwt
+import orjson
 from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
 
 password_hasher = PasswordHasher()
 
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+@lru_cache(maxsize=8)
+def _hmac_signing_key(secret_key: str, algorithm: str) -> bytes:
+    # PyJWT's own key preparation, so PEM/SSH/JWK material is rejected exactly as jwt.encode would.
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(secret_key)
+
+
+def _encode_jwt(payload: dict, secret_key: str, algorithm: str) -> str:
+    # HMAC tokens with ASCII claims are signed directly with orjson + hmac, byte-for-byte what jwt.encode
+    # would produce; decoding and claim validation stay with PyJWT. Everything else goes through PyJWT,
+    # whose json.dumps escapes non-ASCII characters where orjson would emit raw UTF-8.
+    digest = _HMAC_DIGESTS.get(algorithm)
+    if digest is None:
+        return jwt.encode(payload=payload, key=secret_key, algorithm=algorithm)
+    key = _hmac_signing_key(secret_key, algorithm)
+    payload_json = orjson.dumps(payload)
+    if not payload_json.isascii():
+        return jwt.encode(payload=payload, key=secret_key, algorithm=algorithm)
+    signing_input = _b64url(orjson.dumps({"alg": algorithm, "typ": "JWT"})) + b"." + _b64url(payload_json)
+    signature = hmac.new(key, signing_input, digest).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
 
 def _b64decode(data: str) -> bytes:
     padded = data + "=" * (-len(data) % 4)
@@ -43,27 +72,26 @@ def verify_password(password: str, encoded_hash: str) -> bool:
         return _verify_legacy_scrypt(password, encoded_hash)
     try:
         return password_hasher.verify(encoded_hash, password)
-    except VerifyMismatchError:
-        return False
     except Exception:
         return False
 
 
-def maybe_rehash_password(password: str, encoded_hash: str) -> str | None:
+def password_needs_rehash(encoded_hash: str) -> bool:
+    """Whether a verified hash is legacy scrypt or uses outdated argon2 parameters."""
     if encoded_hash.startswith("scrypt$"):
-        if _verify_legacy_scrypt(password, encoded_hash):
-            return password_hasher.hash(password)
-        return None
+        return True
     try:
-        if password_hasher.check_needs_rehash(encoded_hash):
-            return password_hasher.hash(password)
+        return password_hasher.check_needs_rehash(encoded_hash)
     except Exception:
-        return None
-    return None
+        return False
+
+
+def hash_token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
 
 def hash_token(token: str) -> str:
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return hash_token_digest(token).hex()
 
 
 def create_access_token(
@@ -83,7 +111,7 @@ def create_access_token(
         "iat": int(now.timestamp()),
         "exp": int(exp_at.timestamp()),
     }
-    token = jwt.encode(payload=payload, key=secret_key, algorithm=algorithm)
+    token = _encode_jwt(payload=payload, secret_key=secret_key, algorithm=algorithm)
     return token, int(exp_at.timestamp())
 
 
@@ -93,20 +121,20 @@ def create_refresh_token(
     algorithm: str,
     issuer: str,
     ttl_days: int,
-) -> tuple[str, str, int]:
+) -> tuple[str, UUID, int]:
     now = datetime.now(UTC)
     exp_at = now + timedelta(days=ttl_days)
-    jti = str(uuid4())
+    jti = uuid4()
     payload = {
         "sub": str(user_id),
         "type": "refresh",
-        "jti": jti,
+        "jti": str(jti),
         "iss": issuer,
         "iat": int(now.timestamp()),
         "exp": int(exp_at.timestamp()),
         "nonce": secrets.token_hex(8),
     }
-    token = jwt.encode(payload=payload, key=secret_key, algorithm=algorithm)
+    token = _encode_jwt(payload=payload, secret_key=secret_key, algorithm=algorithm)
     return token, jti, int(exp_at.timestamp())
 
 
@@ -128,16 +156,14 @@ def decode_access_token(token: str, secret_key: str, algorithm: str, issuer: str
         return None
 
 
-def decode_refresh_token(token: str, secret_key: str, algorithm: str, issuer: str) -> tuple[UUID, str, int] | None:
+def decode_refresh_token(token: str, secret_key: str, algorithm: str, issuer: str) -> tuple[UUID, UUID, int] | None:
     payload = decode_token(token=token, secret_key=secret_key, algorithms=[algorithm], issuer=issuer)
     if payload is None or payload.get("type") != "refresh":
         return None
     try:
         user_id = UUID(str(payload.get("sub")))
-        jti = str(payload.get("jti"))
+        jti = UUID(str(payload.get("jti")))
         exp_ts = int(payload.get("exp"))
     except (ValueError, TypeError):
         return None
-    if not jti:
-        return None
     return user_id, jti, exp_ts
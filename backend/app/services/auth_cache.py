@@ -0,0 +1,85 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from app.settings import get_settings
+
+_settings = get_settings()
+
+# Revocations are permanent until expiry, so positive entries can live longer than negative ones:
+# a "not revoked" answer may be invalidated by a logout handled in another process.
+_REVOKED_JTIS: TTLCache = TTLCache(maxsize=100_000, ttl=_settings.auth_cache_revocation_ttl_seconds)
+_NOT_REVOKED_JTIS: TTLCache = TTLCache(maxsize=100_000, ttl=_settings.auth_cache_negative_ttl_seconds)
+_LOCK = threading.Lock()
+
+
+def is_access_jti_revoked(jti: UUID) -> bool | None:
+    with _LOCK:
+        if jti in _REVOKED_JTIS:
+            return True
+        if jti in _NOT_REVOKED_JTIS:
+            return False
+    return None
+
+
+def remember_access_jti_revoked(jti: UUID, revoked: bool) -> None:
+    with _LOCK:
+        if revoked:
+            _NOT_REVOKED_JTIS.pop(jti, None)
+            _REVOKED_JTIS[jti] = True
+        else:
+            _NOT_REVOKED_JTIS[jti] = True
+
+
+def clear_revocation_cache() -> None:
+    with _LOCK:
+        _REVOKED_JTIS.clear()
+        _NOT_REVOKED_JTIS.clear()
+
+
+@dataclass(slots=True, frozen=True)
+class AccessClaims:
+    user_id: UUID
+    jti: UUID
+    exp_ts: int
+
+
+# Only signature/claim verification is cached; revocation and user lookups stay per-request.
+_ACCESS_CLAIMS: TTLCache = TTLCache(maxsize=10_000, ttl=_settings.auth_jwt_cache_ttl_seconds)
+_ACCESS_CLAIMS_LOCK = threading.Lock()
+
+
+def _access_claims_key(token: str) -> bytes:
+    # Keyed by digest so raw bearer tokens are never kept in memory longer than the request.
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def get_cached_access_claims(token: str) -> AccessClaims | None:
+    if not _settings.auth_jwt_cache_enabled:
+        return None
+    key = _access_claims_key(token)
+    with _ACCESS_CLAIMS_LOCK:
+        claims = _ACCESS_CLAIMS.get(key)
+        if claims is None:
+            return None
+        # Expired entries are rejected on lookup, so a cached token never outlives its own exp claim.
+        if claims.exp_ts <= int(time.time()):
+            _ACCESS_CLAIMS.pop(key, None)
+            return None
+    return claims
+
+
+def remember_access_claims(token: str, claims: AccessClaims) -> None:
+    if not _settings.auth_jwt_cache_enabled:
+        return
+    with _ACCESS_CLAIMS_LOCK:
+        _ACCESS_CLAIMS[_access_claims_key(token)] = claims
+
+
+def clear_access_claims_cache() -> None:
+    with _ACCESS_CLAIMS_LOCK:
+        _ACCESS_CLAIMS.clear()
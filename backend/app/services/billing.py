@@ -1,9 +1,11 @@
 import secrets
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import func, select
+from cachetools import TTLCache
+from sqlalchemy import func, literal, select
 from sqlalchemy.orm import Session
 
 from app.models import BillingCheckoutSession, UserPreset, UserSubscription, UserWatchComplex
@@ -61,17 +63,21 @@ def _normalize_plan_code(plan_code: str | None) -> str:
     return FREE_PLAN.code
 
 
-def ensure_user_subscription(db: Session, user_id: UUID) -> UserSubscription:
-    subscription = db.get(UserSubscription, user_id)
-    if subscription is not None:
-        return subscription
-
-    subscription = UserSubscription(
+def build_free_subscription(user_id: UUID) -> UserSubscription:
+    return UserSubscription(
         user_id=user_id,
         plan_code=FREE_PLAN.code,
         status="ACTIVE",
         provider="dummy",
     )
+
+
+def ensure_user_subscription(db: Session, user_id: UUID) -> UserSubscription:
+    subscription = db.get(UserSubscription, user_id)
+    if subscription is not None:
+        return subscription
+
+    subscription = build_free_subscription(user_id=user_id)
     db.add(subscription)
     db.flush()
     return subscription
@@ -79,6 +85,36 @@ def ensure_user_subscription(db: Session, user_id: UUID) -> UserSubscription:
 
 def get_user_entitlements(db: Session, user_id: UUID) -> dict[str, object]:
     subscription = ensure_user_subscription(db=db, user_id=user_id)
+    return build_entitlements(subscription)
+
+
+# Checkout completion overwrites the entry in the worker that handled it. Other workers may serve the
+# previous plan for up to the 30s TTL, which is accepted for entitlement limits.
+_ENTITLEMENTS_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_ENTITLEMENTS_LOCK = threading.Lock()
+
+
+def get_cached_user_entitlements(db: Session, user_id: UUID) -> dict[str, object]:
+    with _ENTITLEMENTS_LOCK:
+        cached = _ENTITLEMENTS_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+    entitlements = get_user_entitlements(db=db, user_id=user_id)
+    remember_user_entitlements(user_id=user_id, entitlements=entitlements)
+    return entitlements
+
+
+def remember_user_entitlements(user_id: UUID, entitlements: dict[str, object]) -> None:
+    with _ENTITLEMENTS_LOCK:
+        _ENTITLEMENTS_CACHE[user_id] = entitlements
+
+
+def clear_entitlements_cache() -> None:
+    with _ENTITLEMENTS_LOCK:
+        _ENTITLEMENTS_CACHE.clear()
+
+
+def build_entitlements(subscription: UserSubscription) -> dict[str, object]:
     active_plan_code = _normalize_plan_code(subscription.plan_code if subscription.status == "ACTIVE" else FREE_PLAN.code)
     plan = PLAN_CATALOG[active_plan_code]
     return {
@@ -95,22 +131,28 @@ def get_user_entitlements(db: Session, user_id: UUID) -> dict[str, object]:
     }
 
 
-def _count_rows_by_user(db: Session, model: type[UserWatchComplex] | type[UserPreset], user_id: UUID) -> int:
-    return int(
-        db.scalar(
-            select(func.count())
-            .select_from(model)
-            .where(model.user_id == user_id)
-        )
-        or 0
-    )
+def _count_rows_by_user(
+    db: Session,
+    model: type[UserWatchComplex] | type[UserPreset],
+    user_id: UUID,
+    limit: int,
+) -> int:
+    # Counting stops at the plan cap; callers only need to know whether it has been reached.
+    capped = select(literal(1)).select_from(model).where(model.user_id == user_id).limit(limit).subquery()
+    return int(db.scalar(select(func.count()).select_from(capped)) or 0)
 
 
-def enforce_watch_complex_limit(db: Session, user_id: UUID) -> None:
-    entitlements = get_user_entitlements(db=db, user_id=user_id)
+def _resolve_entitlements(db: Session, user_id: UUID, entitlements: dict[str, object] | None) -> dict[str, object]:
+    if entitlements is not None:
+        return entitlements
+    return get_user_entitlements(db=db, user_id=user_id)
+
+
+def enforce_watch_complex_limit(db: Session, user_id: UUID, entitlements: dict[str, object] | None = None) -> None:
+    entitlements = _resolve_entitlements(db=db, user_id=user_id, entitlements=entitlements)
     limit = entitlements["limits"]["watch_complex_limit"]
     if isinstance(limit, int):
-        current_count = _count_rows_by_user(db=db, model=UserWatchComplex, user_id=user_id)
+        current_count = _count_rows_by_user(db=db, model=UserWatchComplex, user_id=user_id, limit=limit)
         if current_count >= limit:
             raise BillingError(
                 detail=f"무료 플랜에서는 관심 단지를 최대 {limit}개까지 등록할 수 있습니다.",
@@ -118,11 +160,11 @@ def enforce_watch_complex_limit(db: Session, user_id: UUID) -> None:
             )
 
 
-def enforce_preset_limit(db: Session, user_id: UUID) -> None:
-    entitlements = get_user_entitlements(db=db, user_id=user_id)
+def enforce_preset_limit(db: Session, user_id: UUID, entitlements: dict[str, object] | None = None) -> None:
+    entitlements = _resolve_entitlements(db=db, user_id=user_id, entitlements=entitlements)
     limit = entitlements["limits"]["preset_limit"]
     if isinstance(limit, int):
-        current_count = _count_rows_by_user(db=db, model=UserPreset, user_id=user_id)
+        current_count = _count_rows_by_user(db=db, model=UserPreset, user_id=user_id, limit=limit)
         if current_count >= limit:
             raise BillingError(
                 detail=f"무료 플랜에서는 프리셋을 최대 {limit}개까지 저장할 수 있습니다.",
@@ -130,8 +172,13 @@ def enforce_preset_limit(db: Session, user_id: UUID) -> None:
             )
 
 
-def enforce_compare_limit(db: Session, user_id: UUID, requested_complex_count: int) -> None:
-    entitlements = get_user_entitlements(db=db, user_id=user_id)
+def enforce_compare_limit(
+    db: Session,
+    user_id: UUID,
+    requested_complex_count: int,
+    entitlements: dict[str, object] | None = None,
+) -> None:
+    entitlements = _resolve_entitlements(db=db, user_id=user_id, entitlements=entitlements)
     limit = entitlements["limits"]["compare_complex_limit"]
     if isinstance(limit, int) and requested_complex_count > limit:
         raise BillingError(
@@ -140,8 +187,8 @@ def enforce_compare_limit(db: Session, user_id: UUID, requested_complex_count: i
         )
 
 
-def enforce_manual_alert_dispatch(db: Session, user_id: UUID) -> None:
-    entitlements = get_user_entitlements(db=db, user_id=user_id)
+def enforce_manual_alert_dispatch(db: Session, user_id: UUID, entitlements: dict[str, object] | None = None) -> None:
+    entitlements = _resolve_entitlements(db=db, user_id=user_id, entitlements=entitlements)
     enabled = bool(entitlements["limits"]["manual_alert_dispatch"])
     if not enabled:
         raise BillingError(
@@ -175,7 +222,7 @@ def complete_dummy_checkout_session(
     db: Session,
     user_id: UUID,
     checkout_token: str,
-) -> tuple[BillingCheckoutSession, UserSubscription, bool]:
+) -> tuple[BillingCheckoutSession, UserSubscription, bool, dict[str, object]]:
     checkout_session = db.scalar(
         select(BillingCheckoutSession)
         .where(
@@ -204,4 +251,4 @@ def complete_dummy_checkout_session(
         subscription.cancel_at_period_end = False
         changed = True
 
-    return checkout_session, subscription, changed
+    return checkout_session, subscription, changed, build_entitlements(subscription)
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from app.crawler.naver_client import NaverLandClient
@@ -9,6 +9,9 @@ from app.models import CrawlRun, ListingSnapshot
 from app.services.parsers import parse_confirmed_date, price_to_manwon
 from app.settings import Settings
 
+# Snapshot rows are written with Core executemany in chunks of this size instead of one ORM object each.
+_LISTING_INSERT_BATCH_SIZE = 1000
+
 
 def _resolve_time_bucket(now: datetime, window_hours: int) -> tuple[datetime, datetime]:
     hour = (now.hour // window_hours) * window_hours
@@ -26,6 +29,7 @@ def ingest_complex_snapshot(
     real_estate_type: str = "APT:ABYG:JGC",
     trade_type: str = "A1:B1:B2",
     reuse_window_hours: int | None = None,
+    client: NaverLandClient | None = None,
 ) -> dict[str, int]:
     if page < 1:
         raise ValueError("page must be >= 1")
@@ -63,7 +67,8 @@ def ingest_complex_snapshot(
                 "reused": 1,
             }
 
-    client = NaverLandClient(settings=settings)
+    if client is None:
+        client = NaverLandClient(settings=settings)
     first_payload = client.fetch_complex_articles(
         complex_no=complex_no,
         page=page,
@@ -78,6 +83,7 @@ def ingest_complex_snapshot(
     listing_count = 0
     pages_fetched = 0
     seen_article_nos: set[int] = set()
+    listing_rows: list[dict[str, Any]] = []
 
     for current_page in range(page, page + max_pages):
         payload = first_payload
@@ -106,24 +112,31 @@ def ingest_complex_snapshot(
                 continue
             seen_article_nos.add(normalized_article_no)
 
-            listing = ListingSnapshot(
-                crawl_run_id=crawl_run.id,
-                complex_no=complex_no,
-                article_no=normalized_article_no,
-                article_name=article.get("articleName"),
-                trade_type_name=article.get("tradeTypeName"),
-                deal_price_text=article.get("dealOrWarrantPrc"),
-                rent_price_text=article.get("rentPrc"),
-                deal_price_manwon=price_to_manwon(article.get("dealOrWarrantPrc")),
-                rent_price_manwon=price_to_manwon(article.get("rentPrc")),
-                area_m2=article.get("area1"),
-                floor_info=article.get("floorInfo"),
-                direction=article.get("direction"),
-                confirmed_date=parse_confirmed_date(article.get("articleConfirmYmd")),
-                listing_meta=article,
+            listing_rows.append(
+                {
+                    "crawl_run_id": crawl_run.id,
+                    "complex_no": complex_no,
+                    "article_no": normalized_article_no,
+                    "article_name": article.get("articleName"),
+                    "trade_type_name": article.get("tradeTypeName"),
+                    "deal_price_text": article.get("dealOrWarrantPrc"),
+                    "rent_price_text": article.get("rentPrc"),
+                    "deal_price_manwon": price_to_manwon(article.get("dealOrWarrantPrc")),
+                    "rent_price_manwon": price_to_manwon(article.get("rentPrc")),
+                    "area_m2": article.get("area1"),
+                    "floor_info": article.get("floorInfo"),
+                    "direction": article.get("direction"),
+                    "confirmed_date": parse_confirmed_date(article.get("articleConfirmYmd")),
+                    "listing_meta": article,
+                }
             )
-            db.add(listing)
             listing_count += 1
+            if len(listing_rows) >= _LISTING_INSERT_BATCH_SIZE:
+                db.execute(insert(ListingSnapshot), listing_rows)
+                listing_rows = []
+
+    if listing_rows:
+        db.execute(insert(ListingSnapshot), listing_rows)
 
     crawl_run.completed_at = datetime.now(timezone.utc)
     db.commit()
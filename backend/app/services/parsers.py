@@ -1,10 +1,25 @@
+import re
 from datetime import date, datetime
+from functools import lru_cache
+
+# Covers the listing price formats ("10억", "10억 5,000", "8,500") in one match; anything else takes the
+# slower split-based path below, which defines the behavior for unusual inputs.
+_PRICE_RE = re.compile(r"\s*(?:(\d+)억)?\s*([\d,]*)\s*")
 
 
 def price_to_manwon(value: str | None) -> int | None:
     if not value:
         return None
 
+    match = _PRICE_RE.fullmatch(value)
+    if match is not None:
+        eok, rest = match.groups()
+        if rest:
+            rest = rest.replace(",", "")
+        if eok is None and not rest:
+            return None
+        return (int(eok) * 10000 if eok else 0) + (int(rest) if rest else 0)
+
     cleaned = value.strip().replace(",", "")
     if not cleaned:
         return None
@@ -19,6 +34,8 @@ def price_to_manwon(value: str | None) -> int | None:
     return int(cleaned) if cleaned.isdigit() else None
 
 
+# Articles in one crawl share a handful of confirm dates; caching skips the strptime/ValueError loop for repeats.
+@lru_cache(maxsize=4096)
 def parse_confirmed_date(raw: str | None) -> date | None:
     if not raw:
         return None
@@ -1,15 +1,23 @@
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from uuid import UUID
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.crawler.naver_client import NaverLandClient
 from app.db import get_session_factory
 from app.models import SchedulerConfig, User, UserNotificationSetting, UserWatchComplex
-from app.services.alerts import collect_user_bargains, dispatch_user_bargain_alerts, dispatch_user_daily_briefing
+from app.services.alerts import (
+    collect_user_bargains,
+    dispatch_user_bargain_alerts,
+    dispatch_user_daily_briefing,
+    load_notification_recipients,
+)
+from app.services.analytics import refresh_price_baseline_view
 from app.services.ingest import ingest_complex_snapshot
 from app.settings import Settings
 
@@ -20,6 +28,10 @@ class CrawlScheduler:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self._executed_keys: set[str] = set()
+        # (monotonic load time, config); the config row and watch list change rarely relative to poll_seconds.
+        self._config_cache: tuple[float, dict[str, object]] | None = None
+        # Shared across ticks and complexes; the client holds no per-request state.
+        self._naver_client = NaverLandClient(settings=settings)
 
     @staticmethod
     def _parse_times(raw: str) -> set[str]:
@@ -65,6 +77,16 @@ class CrawlScheduler:
             "reuse_bucket_hours": max(0, int(reuse_bucket_hours)),
         }
 
+    def _get_runtime_config(self, db: Session) -> dict[str, object]:
+        now_ts = time.monotonic()
+        if self._config_cache is not None:
+            loaded_at, config = self._config_cache
+            if now_ts - loaded_at < self.settings.scheduler_config_cache_seconds:
+                return config
+        config = self._load_runtime_config(db=db)
+        self._config_cache = (now_ts, config)
+        return config
+
     async def run(self) -> None:
         logger.info("Scheduler started.")
         while True:
@@ -73,25 +95,19 @@ class CrawlScheduler:
             await asyncio.sleep(poll_seconds)
 
     def _dispatch_alerts_for_complex(self, db: Session, complex_no: int) -> None:
-        watcher_user_ids = db.scalars(
-            select(UserWatchComplex.user_id).where(
-                UserWatchComplex.complex_no == complex_no,
-                UserWatchComplex.enabled.is_(True),
-            )
-        ).all()
-        for user_id in set(watcher_user_ids):
-            user = db.get(User, user_id)
-            if user is None or not user.is_active:
-                continue
-            setting = db.get(UserNotificationSetting, user_id)
-            if setting is None or not setting.bargain_alert_enabled:
+        watcher_user_ids = select(UserWatchComplex.user_id).where(
+            UserWatchComplex.complex_no == complex_no,
+            UserWatchComplex.enabled.is_(True),
+        )
+        for user, setting in load_notification_recipients(db, watcher_user_ids):
+            if not setting.bargain_alert_enabled:
                 continue
 
             trade_type_name = self._resolve_interest_trade_type(setting)
             monthly_conversion_rate_pct = self._resolve_monthly_conversion_rate(setting)
             items = collect_user_bargains(
                 db=db,
-                user_id=user_id,
+                user_id=user.id,
                 lookback_days=setting.bargain_lookback_days,
                 discount_threshold=setting.bargain_discount_threshold,
                 trade_type_name=trade_type_name,
@@ -110,7 +126,7 @@ class CrawlScheduler:
                 logger.info(
                     "Scheduled bargain alerts sent. complex_no=%s user_id=%s email=%s telegram=%s",
                     complex_no,
-                    user_id,
+                    user.id,
                     dispatch_result["email_sent"],
                     dispatch_result["telegram_sent"],
                 )
@@ -139,37 +155,40 @@ class CrawlScheduler:
         if hhmm != first_time:
             return
 
-        watcher_user_ids = db.scalars(
-            select(UserWatchComplex.user_id).where(UserWatchComplex.enabled.is_(True)).distinct()
-        ).all()
-        if not watcher_user_ids:
+        watcher_user_ids = select(UserWatchComplex.user_id).where(UserWatchComplex.enabled.is_(True))
+        recipients = load_notification_recipients(db, watcher_user_ids)
+        if not recipients:
             return
 
         today_key = datetime.now(timezone).strftime("%Y-%m-%d")
-        for user_id in set(watcher_user_ids):
-            try:
-                self._dispatch_daily_briefing_for_user(
-                    db=db,
-                    user_id=user_id,
-                    briefing_date_key=today_key,
-                )
-            except Exception:
-                db.rollback()
-                logger.exception("Scheduled daily briefing failed for user. user_id=%s", user_id)
+        session_factory = get_session_factory()
+
+        def _dispatch_one(user: User, setting: UserNotificationSetting) -> None:
+            # SMTP/Telegram round trips dominate here; each worker claims and commits through its own session.
+            with session_factory() as task_db:
+                try:
+                    self._dispatch_daily_briefing_for_user(
+                        db=task_db,
+                        user=user,
+                        setting=setting,
+                        briefing_date_key=today_key,
+                    )
+                except Exception:
+                    task_db.rollback()
+                    logger.exception("Scheduled daily briefing failed for user. user_id=%s", user.id)
+
+        max_workers = min(self.settings.alert_dispatch_parallelism, len(recipients))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for user, setting in recipients:
+                executor.submit(_dispatch_one, user, setting)
 
     def _dispatch_daily_briefing_for_user(
         self,
         db: Session,
-        user_id: UUID,
+        user: User,
+        setting: UserNotificationSetting,
         briefing_date_key: str,
     ) -> None:
-        user = db.get(User, user_id)
-        if user is None or not user.is_active:
-            return
-
-        setting = db.get(UserNotificationSetting, user_id)
-        if setting is None:
-            return
         if not (setting.email_enabled or setting.telegram_enabled):
             return
 
@@ -184,7 +203,7 @@ class CrawlScheduler:
             db.commit()
             logger.info(
                 "Scheduled daily briefing sent. user_id=%s email=%s telegram=%s",
-                user_id,
+                user.id,
                 result["email_sent"],
                 result["telegram_sent"],
             )
@@ -192,7 +211,7 @@ class CrawlScheduler:
     def _run_if_due(self) -> int:
         db = get_session_factory()()
         try:
-            config = self._load_runtime_config(db=db)
+            config = self._get_runtime_config(db=db)
             enabled = bool(config["enabled"])
             times = config["times"]
             complex_nos = config["complex_nos"]
@@ -230,6 +249,7 @@ class CrawlScheduler:
                 reuse_bucket_hours,
             )
 
+            ingested_complex_nos: list[int] = []
             for complex_no in complex_nos:
                 try:
                     result = ingest_complex_snapshot(
@@ -239,17 +259,29 @@ class CrawlScheduler:
                         page=1,
                         max_pages=10,
                         reuse_window_hours=reuse_bucket_hours,
+                        client=self._naver_client,
                     )
                     logger.info("Scheduled ingest success: %s", result)
-                    try:
-                        self._dispatch_alerts_for_complex(db=db, complex_no=complex_no)
-                    except Exception:
-                        db.rollback()
-                        logger.exception("Scheduled alert dispatch failed. complex_no=%s", complex_no)
+                    ingested_complex_nos.append(complex_no)
                 except Exception:
                     db.rollback()
                     logger.exception("Scheduled ingest failed. complex_no=%s", complex_no)
 
+            # Bargains are scored against the view's medians, so refresh it with this tick's listings first.
+            if self.settings.analytics_baseline_view_enabled:
+                try:
+                    refresh_price_baseline_view(db=db)
+                except Exception:
+                    db.rollback()
+                    logger.exception("Price baseline view refresh failed.")
+
+            for complex_no in ingested_complex_nos:
+                try:
+                    self._dispatch_alerts_for_complex(db=db, complex_no=complex_no)
+                except Exception:
+                    db.rollback()
+                    logger.exception("Scheduled alert dispatch failed. complex_no=%s", complex_no)
+
             try:
                 self._dispatch_daily_briefings_for_first_time(
                     db=db,
@@ -64,6 +64,58 @@ async function api(path, options = {}) {
   return data;
 }
 
+async function apiNdjson(path, onItem) {
+  const request = async () =>
+    fetch(path, {
+      headers: {
+        Accept: "application/x-ndjson",
+        ...authHeader(),
+      },
+    });
+
+  let response = await request();
+  if (response.status === 401 && state.refreshToken) {
+    const refreshed = await refreshAccessToken();
+    if (refreshed) {
+      response = await request();
+    }
+  }
+
+  if (!response.ok) {
+    const text = await response.text();
+    let detail = text || `HTTP ${response.status}`;
+    try {
+      detail = JSON.parse(text).detail || detail;
+    } catch (_e) {
+      // keep raw text detail
+    }
+    throw new Error(typeof detail === "string" ? detail : JSON.stringify(detail));
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  const flushLines = () => {
+    let newlineIndex = buffer.indexOf("\n");
+    while (newlineIndex >= 0) {
+      const line = buffer.slice(0, newlineIndex).trim();
+      buffer = buffer.slice(newlineIndex + 1);
+      if (line) onItem(JSON.parse(line));
+      newlineIndex = buffer.indexOf("\n");
+    }
+  };
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    flushLines();
+  }
+  buffer += decoder.decode();
+  buffer += "\n";
+  flushLines();
+}
+
 function renderUserBadge(text) {
   qs("#userBadge").textContent = text;
 }
@@ -615,9 +667,13 @@ function onLiveFilterInput() {
 async function loadLiveWatchComplexes() {
   const page = Number(qs("#liveWatchPage").value || "1");
   const maxPerComplex = Number(qs("#liveWatchMax").value || "10");
-  const data = await api(`/me/watch-complexes/live?page=${page}&max_per_complex=${maxPerComplex}`);
-  const groups = Array.isArray(data.items) ? data.items : [];
-  state.liveWatchRows = flattenLiveWatchRows(groups);
+  const groups = [];
+  state.liveWatchRows = [];
+  await apiNdjson(`/me/watch-complexes/live?page=${page}&max_per_complex=${maxPerComplex}`, (group) => {
+    groups.push(group);
+    state.liveWatchRows = flattenLiveWatchRows(groups);
+    renderLiveWatchListings();
+  });
 
   if (!state.liveWatchRows.length) {
     qs("#liveWatchBody").innerHTML = '<tr><td colspan="6" class="muted">실시간 조회 대상 단지가 없습니다.</td></tr>';
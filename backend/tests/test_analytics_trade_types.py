@@ -1,16 +1,26 @@
+import hashlib
 import pathlib
 import sys
+import threading
+from datetime import date
 from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
 from app import main
 from app.models import UserNotificationSetting
-from app.services.analytics import normalize_trade_type_name, to_effective_price_manwon
+from app.services import alerts, analytics
+from app.services.analytics import detect_bargains_bulk, normalize_trade_type_name, to_effective_price_manwon
+
+
+class FakeResult(list):
+    def all(self):
+        return list(self)
 
 
 class FakeDB:
@@ -105,3 +115,462 @@ def test_update_notification_setting_rejects_invalid_interest_trade_type() -> No
     with pytest.raises(HTTPException) as exc_info:
         main._normalize_interest_trade_type("투자")
     assert exc_info.value.status_code == 400
+
+
+def test_detect_bargains_bulk_uses_constant_queries_for_many_complexes(monkeypatch: pytest.MonkeyPatch) -> None:
+    analytics.clear_baseline_median_cache()
+    monkeypatch.setattr(analytics._settings, "analytics_baseline_view_enabled", False)
+    baseline_rows = [SimpleNamespace(complex_no=complex_no, median_price_manwon=100000.0) for complex_no in (1, 2)]
+    bargains = [
+        SimpleNamespace(
+            complex_no=complex_no,
+            median_price_manwon=100000.0,
+            article_no=complex_no,
+            article_name="A",
+            trade_type_name="매매",
+            deal_price_text="8억",
+            deal_price_manwon=80000,
+            rent_price_manwon=None,
+            observed_at=None,
+            effective_price_manwon=80000.0,
+            discount_rate=0.2,
+        )
+        for complex_no in (1, 2)
+    ]
+
+    class CountingDB:
+        def __init__(self) -> None:
+            self.queries = 0
+            self.yield_per: list[int | None] = []
+            self.statements: list[str] = []
+            self._execute_results = [baseline_rows, bargains]
+
+        def execute(self, stmt):
+            self.queries += 1
+            self.yield_per.append(stmt.get_execution_options().get("yield_per"))
+            self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+            return FakeResult(self._execute_results.pop(0))
+
+    db = CountingDB()
+    result = detect_bargains_bulk(db=db, complex_nos=[1, 2], trade_type_name="매매")
+
+    assert db.queries == 2
+    assert db.yield_per == [None, 1000]
+    assert "DISTINCT ON (crawl_runs.complex_no)" in db.statements[1]
+    assert "AS baseline (complex_no, median_price_manwon)" in db.statements[1]
+    assert sorted(result) == [1, 2]
+    assert result[1][0]["discount_rate"] == pytest.approx(0.2)
+
+
+def test_detect_bargains_bulk_reads_sale_baseline_from_view(monkeypatch: pytest.MonkeyPatch) -> None:
+    analytics.clear_baseline_median_cache()
+    monkeypatch.setattr(analytics._settings, "analytics_baseline_view_enabled", True)
+    view_rows = [SimpleNamespace(complex_no=1, median_price_manwon=100000.0)]
+    bargains = [
+        SimpleNamespace(
+            complex_no=1,
+            median_price_manwon=100000.0,
+            article_no=1,
+            article_name="A",
+            trade_type_name="매매",
+            deal_price_text="9억",
+            deal_price_manwon=90000,
+            rent_price_manwon=None,
+            observed_at=None,
+            effective_price_manwon=90000.0,
+            discount_rate=0.1,
+        )
+    ]
+    statements: list[str] = []
+
+    class RecordingDB:
+        def __init__(self) -> None:
+            self._execute_results = [view_rows, bargains]
+
+        def execute(self, stmt):
+            statements.append(str(stmt))
+            return FakeResult(self._execute_results.pop(0))
+
+    result = detect_bargains_bulk(db=RecordingDB(), complex_nos=[1], trade_type_name="매매")
+
+    assert "mv_complex_price_baseline" in statements[0]
+    assert result[1][0]["baseline_median_manwon"] == 100000.0
+    assert result[1][0]["discount_rate"] == pytest.approx(0.1)
+
+
+def test_detect_bargains_bulk_reuses_cached_baseline_medians(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(analytics._settings, "analytics_baseline_view_enabled", False)
+    analytics.clear_baseline_median_cache()
+    baseline_calls: list[list[int]] = []
+
+    def fake_compute_baseline_medians(*, db, complex_nos, **_kwargs):
+        baseline_calls.append(list(complex_nos))
+        return {1: 100000.0}
+
+    monkeypatch.setattr(analytics, "_compute_baseline_medians", fake_compute_baseline_medians)
+
+    class EmptyRunsDB:
+        def execute(self, _stmt):
+            return FakeResult([])
+
+    detect_bargains_bulk(db=EmptyRunsDB(), complex_nos=[1, 2], trade_type_name="매매")
+    detect_bargains_bulk(db=EmptyRunsDB(), complex_nos=[2, 1], trade_type_name="매매")
+    detect_bargains_bulk(db=EmptyRunsDB(), complex_nos=[1, 3], trade_type_name="매매")
+    analytics.clear_baseline_median_cache()
+
+    # Complex 2 has no baseline; that miss is cached too, so only the new complex 3 is queried again.
+    assert baseline_calls == [[1, 2], [3]]
+
+
+def test_collect_user_bargains_detects_all_watches_in_one_bulk_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[int]] = []
+
+    def fake_detect_bargains_bulk(*, db, complex_nos, **_kwargs):
+        calls.append(complex_nos)
+        return {1: [{"article_no": 10, "discount_rate": 0.1}], 2: [{"article_no": 20, "discount_rate": 0.3}]}
+
+    class FakeDB:
+        def execute(self, _stmt):
+            return SimpleNamespace(all=lambda: [(1, "A"), (2, "B")])
+
+    monkeypatch.setattr(alerts, "detect_bargains_bulk", fake_detect_bargains_bulk)
+
+    rows = alerts.collect_user_bargains(db=FakeDB(), user_id=uuid4(), lookback_days=30, discount_threshold=0.08)
+
+    assert calls == [[1, 2]]
+    assert [(row["complex_no"], row["complex_name"]) for row in rows] == [(2, "B"), (1, "A")]
+
+
+def test_collect_user_daily_briefing_aggregates_latest_listings_in_sql(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(alerts, "collect_user_bargains", lambda **_kwargs: [])
+    alerts.clear_run_stats_cache()
+    watches = [
+        SimpleNamespace(complex_no=1, complex_name="A"),
+        SimpleNamespace(complex_no=2, complex_name="B"),
+        SimpleNamespace(complex_no=3, complex_name="C"),
+    ]
+    latest_runs = [SimpleNamespace(id=11, complex_no=1), SimpleNamespace(id=22, complex_no=2)]
+    stats = [
+        SimpleNamespace(
+            crawl_run_id=complex_no * 11,
+            listing_count=count,
+            min_price=min_price,
+            max_price=max_price,
+            avg_price=avg_price,
+            min_article_no=f"{complex_no}-min",
+            min_article_name="",
+            min_deal_price_text=str(min_price),
+            max_article_no=f"{complex_no}-max",
+            max_deal_price_text=str(max_price),
+        )
+        for complex_no, count, min_price, max_price, avg_price in [(1, 2, 90000.0, 100000.0, 95000.0), (2, 1, 50000.0, 50000.0, 50000.0)]
+    ]
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.execute_results = [watches, latest_runs, stats]
+
+        def execute(self, _stmt):
+            return SimpleNamespace(all=lambda result=self.execute_results.pop(0): result)
+
+    db = FakeDB()
+    briefing = alerts.collect_user_daily_briefing(
+        db=db,
+        settings=SimpleNamespace(jeonse_monthly_conversion_rate_default=5.1),
+        user_id=uuid4(),
+        notification_setting=SimpleNamespace(
+            interest_trade_type="매매",
+            monthly_rent_conversion_rate_pct=None,
+            bargain_lookback_days=30,
+            bargain_discount_threshold=0.08,
+        ),
+    )
+
+    assert db.execute_results == []
+    assert [(row["complex_no"], row["listing_count"]) for row in briefing["complex_summaries"]] == [(1, 2), (2, 1)]
+    assert briefing["overall"]["listing_count"] == 3
+    assert briefing["overall"]["avg_effective_price_manwon"] == pytest.approx(80000.0)
+    assert briefing["overall"]["min_item"]["article_no"] == "2-min"
+
+
+def test_run_listing_stats_are_cached_per_run_trade_type_and_rate() -> None:
+    alerts.clear_run_stats_cache()
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.stats_queries = 0
+
+        def execute(self, _stmt):
+            self.stats_queries += 1
+            return SimpleNamespace(all=lambda: [SimpleNamespace(crawl_run_id=11, listing_count=3)])
+
+    db = FakeDB()
+    first = alerts._load_run_listing_stats(db=db, run_ids=[11, 22], trade_type_name="매매", conversion_rate=5.1)
+    second = alerts._load_run_listing_stats(db=db, run_ids=[22, 11], trade_type_name="매매", conversion_rate=5.1)
+    alerts._load_run_listing_stats(db=db, run_ids=[11], trade_type_name="전세", conversion_rate=5.1)
+    alerts.clear_run_stats_cache()
+
+    assert first == second
+    assert first[22] is None
+    assert db.stats_queries == 2
+
+
+def test_effective_price_manwon_expr_matches_python_conversion() -> None:
+    compiled = analytics.effective_price_manwon_expr(5.0).compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+
+    assert "WHEN (btrim(listing_snapshots.trade_type_name) = '월세')" in str(compiled)
+    assert "* 12.0) / CAST(0.05 AS FLOAT)" in str(compiled)
+    assert str(analytics.effective_price_manwon_expr(0.0).compile(dialect=postgresql.dialect())) == "NULL"
+
+
+def test_filter_unsent_items_checks_all_channels_in_one_query() -> None:
+    items = [{"complex_no": 1, "article_no": 10}, {"complex_no": 1, "article_no": 11}]
+    sent_key = alerts._bargain_dedupe_key(items[0])
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.statements = []
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            return SimpleNamespace(all=lambda: [("email", sent_key)])
+
+    db = FakeDB()
+    unsent = alerts._filter_unsent_items(db, uuid4(), ["email", "telegram"], items)
+
+    compiled = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert len(db.statements) == 1
+    assert "= ANY (" in compiled
+    assert sent_key == hashlib.md5(b"bargain:1:10:None").digest()
+    assert unsent["email"] == ([items[1]], [alerts._bargain_dedupe_key(items[1])])
+    assert unsent["telegram"][0] == items
+
+
+def test_dispatch_user_bargain_alerts_records_sent_items_with_one_upsert(monkeypatch: pytest.MonkeyPatch) -> None:
+    items = [{"complex_no": 1, "article_no": 10}, {"complex_no": 1, "article_no": 11}]
+    monkeypatch.setattr(alerts, "send_email_message", lambda **_kwargs: (True, "sent"))
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.statements = []
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            return SimpleNamespace(all=lambda: [])
+
+    db = FakeDB()
+    result = alerts.dispatch_user_bargain_alerts(
+        db=db,
+        settings=SimpleNamespace(),
+        user=SimpleNamespace(id=uuid4()),
+        notification_setting=SimpleNamespace(
+            bargain_alert_enabled=True,
+            email_enabled=True,
+            email_address="user@example.com",
+            telegram_enabled=False,
+            telegram_chat_id=None,
+        ),
+        items=items,
+    )
+
+    insert_sql = str(db.statements[1].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT ON CONSTRAINT uq_alert_dispatch_dedupe DO NOTHING" in insert_sql
+    assert "RETURNING" not in insert_sql
+    assert result["email_sent"] == 2
+
+
+def test_dispatch_user_bargain_alerts_formats_shared_text_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    items = [{"complex_no": 1, "article_no": 10}]
+    built: list[int] = []
+    monkeypatch.setattr(alerts, "build_bargain_alert_text", lambda channel_items: built.append(len(channel_items)) or "text")
+    monkeypatch.setattr(alerts, "send_email_message", lambda **_kwargs: (False, "smtp down"))
+    monkeypatch.setattr(alerts, "send_telegram_message", lambda **_kwargs: (False, "telegram down"))
+
+    class FakeDB:
+        def execute(self, _stmt):
+            return SimpleNamespace(all=lambda: [])
+
+    result = alerts.dispatch_user_bargain_alerts(
+        db=FakeDB(),
+        settings=SimpleNamespace(),
+        user=SimpleNamespace(id=uuid4()),
+        notification_setting=SimpleNamespace(
+            bargain_alert_enabled=True,
+            email_enabled=True,
+            email_address="user@example.com",
+            telegram_enabled=True,
+            telegram_chat_id="chat-1",
+        ),
+        items=items,
+    )
+
+    assert built == [1]
+    assert (result["email_reason"], result["telegram_reason"]) == ("smtp down", "telegram down")
+
+
+def test_dispatch_user_bargain_alerts_sends_channels_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Each send waits for the other; a sequential dispatch would break the barrier instead.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_send(**_kwargs):
+        barrier.wait()
+        return False, "down"
+
+    monkeypatch.setattr(alerts, "send_email_message", fake_send)
+    monkeypatch.setattr(alerts, "send_telegram_message", fake_send)
+
+    class FakeDB:
+        def execute(self, _stmt):
+            return SimpleNamespace(all=lambda: [])
+
+    result = alerts.dispatch_user_bargain_alerts(
+        db=FakeDB(),
+        settings=SimpleNamespace(),
+        user=SimpleNamespace(id=uuid4()),
+        notification_setting=SimpleNamespace(
+            bargain_alert_enabled=True,
+            email_enabled=True,
+            email_address="user@example.com",
+            telegram_enabled=True,
+            telegram_chat_id="chat-1",
+        ),
+        items=[{"complex_no": 1, "article_no": 10}],
+    )
+
+    assert (result["email_reason"], result["telegram_reason"]) == ("down", "down")
+
+
+def test_load_notification_recipients_joins_settings_for_active_users() -> None:
+    user = SimpleNamespace(id=uuid4())
+    setting = SimpleNamespace(user_id=user.id)
+
+    class FakeDB:
+        statement = None
+
+        def execute(self, stmt):
+            self.statement = stmt
+            return SimpleNamespace(all=lambda: [(user, setting)])
+
+    db = FakeDB()
+    recipients = alerts.load_notification_recipients(db, [user.id])
+
+    sql = str(db.statement.compile(dialect=postgresql.dialect()))
+    assert "JOIN user_notification_settings ON user_notification_settings.user_id = users.id" in sql
+    assert "users.is_active IS true" in sql
+    assert recipients == [(user, setting)]
+
+
+def test_dispatch_user_daily_briefing_claims_log_row_before_sending(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(alerts, "collect_user_daily_briefing", lambda **_kwargs: {"complex_summaries": [{}]})
+    monkeypatch.setattr(alerts, "build_daily_briefing_text", lambda _briefing: "briefing")
+    monkeypatch.setattr(alerts, "send_email_message", lambda **_kwargs: (False, "smtp down"))
+    telegram_calls = []
+    monkeypatch.setattr(
+        alerts,
+        "send_telegram_message",
+        lambda **kwargs: telegram_calls.append(kwargs["chat_id"]) or (True, "sent"),
+    )
+
+    class FakeSavepoint:
+        def __init__(self, outcomes: list[str]) -> None:
+            self.outcomes = outcomes
+
+        def commit(self) -> None:
+            self.outcomes.append("commit")
+
+        def rollback(self) -> None:
+            self.outcomes.append("rollback")
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.outcomes: list[str] = []
+
+        def begin_nested(self):
+            return FakeSavepoint(self.outcomes)
+
+        def execute(self, _stmt):
+            return SimpleNamespace(scalar_one_or_none=lambda: 1)
+
+    db = FakeDB()
+    result = alerts.dispatch_user_daily_briefing(
+        db=db,
+        settings=SimpleNamespace(),
+        user=SimpleNamespace(id=uuid4()),
+        notification_setting=SimpleNamespace(
+            email_enabled=True,
+            email_address="user@example.com",
+            telegram_enabled=True,
+            telegram_chat_id="chat-1",
+        ),
+        briefing_date_key="2026-03-01",
+    )
+
+    assert db.outcomes == ["rollback", "commit"]
+    assert (result["email_sent"], result["email_reason"]) == (0, "smtp down")
+    assert (result["telegram_sent"], telegram_calls) == (1, ["chat-1"])
+
+
+def test_dispatch_user_daily_briefing_skips_send_when_already_logged(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(alerts, "collect_user_daily_briefing", lambda **_kwargs: {"complex_summaries": [{}]})
+    monkeypatch.setattr(alerts, "build_daily_briefing_text", lambda _briefing: "briefing")
+
+    def fail_send(**_kwargs):
+        raise AssertionError("already-logged briefings must not be re-sent")
+
+    monkeypatch.setattr(alerts, "send_email_message", fail_send)
+
+    class FakeDB:
+        def begin_nested(self):
+            return SimpleNamespace(rollback=lambda: None, commit=lambda: None)
+
+        def execute(self, _stmt):
+            return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+    result = alerts.dispatch_user_daily_briefing(
+        db=FakeDB(),
+        settings=SimpleNamespace(),
+        user=SimpleNamespace(id=uuid4()),
+        notification_setting=SimpleNamespace(
+            email_enabled=True,
+            email_address="user@example.com",
+            telegram_enabled=False,
+            telegram_chat_id=None,
+        ),
+        briefing_date_key="2026-03-01",
+    )
+
+    assert (result["email_sent"], result["email_reason"]) == (0, "already sent")
+
+
+def test_fetch_complex_trend_aggregates_by_day_in_sql() -> None:
+    captured: list[str] = []
+
+    class FakeDB:
+        def execute(self, stmt):
+            captured.append(str(stmt.compile(dialect=postgresql.dialect())))
+            return FakeResult(
+                [
+                    SimpleNamespace(
+                        observed_date=date(2026, 3, 1),
+                        avg_price=95000.456,
+                        min_price=90000.0,
+                        max_price=100000.0,
+                        listing_count=3,
+                    )
+                ]
+            )
+
+    points = analytics.fetch_complex_trend(db=FakeDB(), complex_no=1, trade_type_name="매매")
+
+    assert "GROUP BY date(listing_snapshots.observed_at)" in captured[0]
+    assert points == [
+        {
+            "date": "2026-03-01",
+            "avg_price_manwon": 95000.46,
+            "min_price_manwon": 90000.0,
+            "max_price_manwon": 100000.0,
+            "listing_count": 3,
+        }
+    ]
@@ -1,3 +1,5 @@
+import base64
+import hashlib
 import pathlib
 import sys
 from uuid import uuid4
@@ -9,13 +11,18 @@ sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 pytest.importorskip("jwt")
 pytest.importorskip("argon2")
 
+import jwt
+
 from app.services.auth import (
+    _encode_jwt,
     create_access_token,
     create_refresh_token,
     decode_access_token,
     decode_refresh_token,
     hash_password,
     hash_token,
+    hash_token_digest,
+    password_needs_rehash,
     verify_password,
 )
 
@@ -81,3 +88,37 @@ def test_refresh_token_roundtrip_and_hash() -> None:
     )
     assert decoded == (user_id, jti, exp_ts)
     assert len(hash_token(token)) == 64
+    assert hash_token_digest(token).hex() == hash_token(token)
+
+
+def test_hmac_token_encoding_matches_pyjwt() -> None:
+    payload = {"sub": str(uuid4()), "type": "access", "jti": str(uuid4()), "iss": "test-issuer", "iat": 1, "exp": 2}
+    for algorithm in ("HS256", "HS384", "HS512"):
+        assert _encode_jwt(payload=payload, secret_key="test-secret", algorithm=algorithm) == jwt.encode(
+            payload=payload, key="test-secret", algorithm=algorithm
+        )
+
+
+def test_hmac_token_encoding_round_trips_non_ascii_claims() -> None:
+    payload = {"sub": str(uuid4()), "type": "access", "name": "홍길동", "iat": 1, "exp": 4_102_444_800}
+    token = _encode_jwt(payload=payload, secret_key="test-secret", algorithm="HS256")
+
+    assert token == jwt.encode(payload=payload, key="test-secret", algorithm="HS256")
+    assert jwt.decode(token, key="test-secret", algorithms=["HS256"]) == payload
+
+
+def test_hmac_token_encoding_rejects_asymmetric_keys() -> None:
+    pem_key = "-----BEGIN PUBLIC KEY-----\nMFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE\n-----END PUBLIC KEY-----"
+    with pytest.raises(jwt.InvalidKeyError):
+        _encode_jwt(payload={"sub": "1"}, secret_key=pem_key, algorithm="HS256")
+
+
+def test_legacy_scrypt_verifies_and_needs_rehash() -> None:
+    salt = b"0123456789abcdef"
+    digest = hashlib.scrypt(b"legacy-password", salt=salt, n=16384, r=8, p=1, dklen=64)
+    legacy_hash = "scrypt$" + base64.urlsafe_b64encode(salt).decode() + "$" + base64.urlsafe_b64encode(digest).decode()
+
+    assert verify_password("legacy-password", legacy_hash) is True
+    assert verify_password("wrong-password", legacy_hash) is False
+    assert password_needs_rehash(legacy_hash) is True
+    assert password_needs_rehash(hash_password("legacy-password")) is False
\ No newline at end of file
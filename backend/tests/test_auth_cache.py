@@ -0,0 +1,23 @@
+import pathlib
+import sys
+from uuid import uuid4
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services import auth_cache
+
+
+def test_revocation_cache_tracks_positive_and_negative_results() -> None:
+    auth_cache.clear_revocation_cache()
+    jti = uuid4()
+
+    assert auth_cache.is_access_jti_revoked(jti) is None
+
+    auth_cache.remember_access_jti_revoked(jti, revoked=False)
+    assert auth_cache.is_access_jti_revoked(jti) is False
+
+    auth_cache.remember_access_jti_revoked(jti, revoked=True)
+    assert auth_cache.is_access_jti_revoked(jti) is True
+
+    auth_cache.clear_revocation_cache()
+
@@ -12,8 +12,11 @@ from app import main
 from app.models import BillingCheckoutSession, UserSubscription
 from app.services.billing import (
     BillingError,
+    clear_entitlements_cache,
     complete_dummy_checkout_session,
     create_dummy_checkout_session,
+    enforce_watch_complex_limit,
+    get_cached_user_entitlements,
     get_user_entitlements,
 )
 
@@ -47,6 +50,23 @@ def test_get_user_entitlements_creates_default_free_subscription() -> None:
     assert entitlements["limits"]["watch_complex_limit"] == 3
 
 
+def test_enforce_watch_complex_limit_counts_only_up_to_plan_cap() -> None:
+    db = FakeBillingDB()
+    statements = []
+
+    def capture_scalar(stmt):
+        statements.append(str(stmt.compile(compile_kwargs={"literal_binds": True})))
+        return 3
+
+    db.scalar = capture_scalar
+
+    with pytest.raises(BillingError) as exc_info:
+        enforce_watch_complex_limit(db=db, user_id=uuid4(), entitlements={"limits": {"watch_complex_limit": 3}})
+
+    assert exc_info.value.status_code == 403
+    assert "LIMIT 3" in statements[0]
+
+
 def test_create_dummy_checkout_session_rejects_non_paid_plan() -> None:
     db = FakeBillingDB()
 
@@ -56,6 +76,23 @@ def test_create_dummy_checkout_session_rejects_non_paid_plan() -> None:
     assert exc_info.value.status_code == 400
 
 
+def test_get_cached_user_entitlements_reuses_result_across_calls() -> None:
+    clear_entitlements_cache()
+    user_id = uuid4()
+    first_db = FakeBillingDB()
+    first = get_cached_user_entitlements(db=first_db, user_id=user_id)
+
+    class FailingDB:
+        def get(self, _model, _key):
+            raise AssertionError("cached entitlements should not hit the database")
+
+    second = get_cached_user_entitlements(db=FailingDB(), user_id=user_id)
+    clear_entitlements_cache()
+
+    assert first is second
+    assert first["plan_code"] == "FREE"
+
+
 def test_complete_dummy_checkout_session_promotes_user_to_pro() -> None:
     db = FakeBillingDB()
     user_id = uuid4()
@@ -71,7 +108,7 @@ def test_complete_dummy_checkout_session_promotes_user_to_pro() -> None:
     )
     db.scalar_result = checkout
 
-    completed_session, subscription, changed = complete_dummy_checkout_session(
+    completed_session, subscription, changed, entitlements = complete_dummy_checkout_session(
         db=db,
         user_id=user_id,
         checkout_token="dummy-token",
@@ -81,10 +118,39 @@ def test_complete_dummy_checkout_session_promotes_user_to_pro() -> None:
     assert completed_session.status == "COMPLETED"
     assert subscription.plan_code == "PRO"
     assert subscription.status == "ACTIVE"
+    assert entitlements["plan_code"] == "PRO"
+
+
+def test_billing_complete_checkout_session_replaces_cached_entitlements() -> None:
+    clear_entitlements_cache()
+    user_id = uuid4()
+    db = FakeBillingDB()
+    db.commit = lambda: None
+    assert get_cached_user_entitlements(db=db, user_id=user_id)["plan_code"] == "FREE"
+    db.scalar_result = BillingCheckoutSession(
+        user_id=user_id,
+        provider="dummy",
+        plan_code="PRO",
+        status="PENDING",
+        checkout_token="dummy-token",
+        amount_krw=9900,
+        currency="KRW",
+        checkout_payload={"flow": "dummy"},
+    )
+
+    main.billing_complete_checkout_session(
+        checkout_token="dummy-token",
+        current_user=SimpleNamespace(id=user_id),
+        db=db,
+    )
+    cached = get_cached_user_entitlements(db=db, user_id=user_id)
+    clear_entitlements_cache()
+
+    assert cached["plan_code"] == "PRO"
 
 
 def test_me_add_watch_complex_maps_billing_error_to_403(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_enforce_watch_complex_limit(*, db, user_id):
+    def fake_enforce_watch_complex_limit(*, db, user_id, **_kwargs):
         raise BillingError("무료 플랜 제한", status_code=403)
 
     monkeypatch.setattr(main, "enforce_watch_complex_limit", fake_enforce_watch_complex_limit)
@@ -97,14 +163,44 @@ def test_me_add_watch_complex_maps_billing_error_to_403(monkeypatch: pytest.Monk
             gugun_name=None,
             dong_name=None,
             current_user=SimpleNamespace(id=uuid4()),
+            entitlements={},
             db=SimpleNamespace(),
         )
 
     assert exc_info.value.status_code == 403
 
 
+def test_me_add_watch_complex_returns_409_when_insert_conflicts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main, "enforce_watch_complex_limit", lambda *, db, user_id, **_kwargs: None)
+
+    class FakeDB:
+        committed = False
+
+        def execute(self, _stmt):
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(first=lambda: None))
+
+        def commit(self) -> None:
+            self.committed = True
+
+    db = FakeDB()
+    with pytest.raises(HTTPException) as exc_info:
+        main.me_add_watch_complex(
+            complex_no=2977,
+            complex_name="테스트",
+            sido_name=None,
+            gugun_name=None,
+            dong_name=None,
+            current_user=SimpleNamespace(id=uuid4()),
+            entitlements={},
+            db=db,
+        )
+
+    assert exc_info.value.status_code == 409
+    assert db.committed is False
+
+
 def test_analytics_compare_maps_billing_error_to_403(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_enforce_compare_limit(*, db, user_id, requested_complex_count):
+    def fake_enforce_compare_limit(*, db, user_id, requested_complex_count, **_kwargs):
         raise BillingError("무료 플랜 비교 제한", status_code=403)
 
     monkeypatch.setattr(main, "enforce_compare_limit", fake_enforce_compare_limit)
@@ -115,6 +211,7 @@ def test_analytics_compare_maps_billing_error_to_403(monkeypatch: pytest.MonkeyP
             days=30,
             trade_type_name=None,
             current_user=SimpleNamespace(id=uuid4()),
+            request_context=main.RequestContext(notification_setting=None, entitlements={}),
             db=SimpleNamespace(),
         )
 
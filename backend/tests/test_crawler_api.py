@@ -1,5 +1,14 @@
+import asyncio
+import json
+import os
 import pathlib
 import sys
+import time
+from collections import namedtuple
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
@@ -7,6 +16,21 @@ from fastapi import HTTPException
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
 from app import main
+from app.services import auth_cache
+
+
+class RowMappingLike(Mapping):
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 def test_crawler_ingest_maps_rate_limit_error_to_503(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -35,7 +59,7 @@ def test_crawler_ingest_maps_upstream_error_to_502(monkeypatch: pytest.MonkeyPat
     assert "네이버 부동산 응답 오류" in str(exc_info.value.detail)
 
 
-def test_crawler_search_complexes_returns_items(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_crawler_search_complexes_returns_items() -> None:
     class FakeClient:
         def __init__(self, settings):
             self.settings = settings
@@ -51,16 +75,14 @@ def test_crawler_search_complexes_returns_items(monkeypatch: pytest.MonkeyPatch)
                 }
             ]
 
-    monkeypatch.setattr(main, "NaverLandClient", FakeClient)
-
-    result = main.crawler_search_complexes(keyword="래미안", limit=5)
+    result = main.crawler_search_complexes(keyword="래미안", limit=5, client=FakeClient(settings=None))
 
     assert result["keyword"] == "래미안"
     assert result["count"] == 1
     assert result["items"][0]["complex_no"] == 2977
 
 
-def test_crawler_search_complexes_maps_rate_limit_error_to_503(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_crawler_search_complexes_maps_rate_limit_error_to_503() -> None:
     class FakeClient:
         def __init__(self, settings):
             self.settings = settings
@@ -68,15 +90,55 @@ def test_crawler_search_complexes_maps_rate_limit_error_to_503(monkeypatch: pyte
         def search_complexes(self, keyword: str, limit: int):
             raise RuntimeError("Naver API HTTP error: 429 Too Many Requests")
 
-    monkeypatch.setattr(main, "NaverLandClient", FakeClient)
-
     with pytest.raises(HTTPException) as exc_info:
-        main.crawler_search_complexes(keyword="래미안", limit=10)
+        main.crawler_search_complexes(keyword="래미안", limit=10, client=FakeClient(settings=None))
 
     assert exc_info.value.status_code == 503
     assert "잠시 후" in str(exc_info.value.detail)
 
 
+def test_watch_complexes_live_streams_ndjson_per_complex() -> None:
+    class FakeClient:
+        def __init__(self, settings):
+            self.settings = settings
+
+        def fetch_complex_articles_cached(self, complex_no: int, page: int):
+            return {"complex_no": complex_no, "page": page}
+
+        @staticmethod
+        def summarize_articles(payload, limit=None):
+            return [{"article_no": payload["complex_no"] * 10 + idx} for idx in range(3)][:limit]
+
+    class FakeDB:
+        closed = False
+
+        def execute(self, _stmt):
+            return SimpleNamespace(all=lambda: [(2977, "래미안"), (1147, "은마")])
+
+        def close(self) -> None:
+            self.closed = True
+
+    db = FakeDB()
+    response = main.me_watch_complexes_live(
+        page=1,
+        max_per_complex=2,
+        current_user=SimpleNamespace(id=1),
+        db=db,
+        client=FakeClient(settings=None),
+    )
+    assert db.closed is True
+
+    async def consume() -> list[bytes]:
+        return [chunk async for chunk in response.body_iterator]
+
+    chunks = asyncio.run(consume())
+    items = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+
+    assert response.media_type == "application/x-ndjson"
+    assert sorted(item["complex_no"] for item in items) == [1147, 2977]
+    assert all(item["article_count"] == 2 for item in items)
+
+
 def test_registration_rate_limit_blocks_excessive_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(main.settings, "auth_register_rate_limit_per_window", 2)
     monkeypatch.setattr(main.settings, "auth_register_rate_limit_window_minutes", 60)
@@ -92,6 +154,447 @@ def test_registration_rate_limit_blocks_excessive_attempts(monkeypatch: pytest.M
     assert "회원가입 요청이 너무 많습니다" in str(exc_info.value.detail)
 
 
+def test_auth_register_assigns_uuid7_user_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main, "_EXPECTED_INVITE_CODE", None)
+    monkeypatch.setattr(main.settings, "auth_email_verification_required", False)
+    main.REGISTER_ATTEMPTS.clear()
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.added: list[object] = []
+            self.committed = False
+
+        def scalar(self, _stmt):
+            return None
+
+        def add_all(self, objs) -> None:
+            self.added.extend(objs)
+
+        def commit(self) -> None:
+            self.committed = True
+
+    db = FakeDB()
+    payload = asyncio.run(
+        main.auth_register(
+            request=SimpleNamespace(client=SimpleNamespace(host="127.0.0.1"), headers={}),
+            email="New@Example.com",
+            password="long-enough-password",
+            invite_code=None,
+            x_forwarded_for=None,
+            db=db,
+        )
+    )
+    main.REGISTER_ATTEMPTS.clear()
+
+    user = next(obj for obj in db.added if isinstance(obj, main.User))
+    assert user.id.version == 7
+    assert payload["user_id"] == str(user.id)
+    assert db.committed is True
+
+
 def test_parse_scheduler_times_normalizes_values() -> None:
     parsed = main._parse_scheduler_times("18:00, 09:00,wrong,25:00,09:00")
     assert parsed == ["09:00", "18:00"]
+
+
+def test_me_watch_complexes_serializes_row_mappings() -> None:
+    created_at = datetime(2026, 2, 14, 9, 30, tzinfo=UTC)
+
+    class FakeResult:
+        def mappings(self):
+            return SimpleNamespace(
+                all=lambda: [
+                    RowMappingLike(
+                        {
+                            "id": 1,
+                            "complex_no": 2977,
+                            "complex_name": "래미안",
+                            "sido_name": None,
+                            "gugun_name": None,
+                            "dong_name": None,
+                            "enabled": True,
+                            "created_at": created_at,
+                        }
+                    )
+                ]
+            )
+
+    class FakeDB:
+        def execute(self, _stmt):
+            return FakeResult()
+
+    response = main.me_watch_complexes(current_user=SimpleNamespace(id=1), db=FakeDB())
+    payload = json.loads(response.body)
+
+    assert payload["items"][0]["complex_no"] == 2977
+    assert payload["items"][0]["created_at"] == created_at.isoformat()
+
+
+def test_decode_access_token_claims_caches_verified_claims(monkeypatch: pytest.MonkeyPatch) -> None:
+    user_id = uuid4()
+    jti = uuid4()
+    calls = {"count": 0}
+
+    def fake_decode_token(**_kwargs):
+        calls["count"] += 1
+        return {"type": "access", "sub": str(user_id), "jti": str(jti), "exp": int(time.time()) + 600}
+
+    monkeypatch.setattr(main, "decode_token", fake_decode_token)
+    auth_cache.clear_access_claims_cache()
+
+    first = main._decode_access_token_claims("token-a")
+    second = main._decode_access_token_claims("token-a")
+    auth_cache.clear_access_claims_cache()
+
+    assert first is second
+    assert (first.user_id, first.jti) == (user_id, jti)
+    assert calls["count"] == 1
+
+
+def test_get_current_user_reports_inactive_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    claims = auth_cache.AccessClaims(user_id=uuid4(), jti=uuid4(), exp_ts=int(time.time()) + 600)
+    user = SimpleNamespace(id=claims.user_id, is_active=False)
+
+    class FakeResult:
+        def one_or_none(self):
+            return (user, False)
+
+    class FakeDB:
+        def execute(self, _stmt):
+            return FakeResult()
+
+    monkeypatch.setattr(main, "_decode_access_token_claims", lambda _token: claims)
+    auth_cache.clear_revocation_cache()
+
+    with pytest.raises(HTTPException) as exc_info:
+        main.get_current_user(authorization="Bearer token-a", db=FakeDB())
+    auth_cache.clear_revocation_cache()
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "User not found or inactive"
+
+
+def test_get_current_user_caches_not_revoked_jti(monkeypatch: pytest.MonkeyPatch) -> None:
+    claims = auth_cache.AccessClaims(user_id=uuid4(), jti=uuid4(), exp_ts=int(time.time()) + 600)
+    user = SimpleNamespace(id=claims.user_id, is_active=True)
+    calls = {"execute": 0, "get": 0}
+
+    class FakeResult:
+        def one_or_none(self):
+            return (user, False)
+
+    class FakeDB:
+        def execute(self, _stmt):
+            calls["execute"] += 1
+            return FakeResult()
+
+        def get(self, _model, user_id):
+            calls["get"] += 1
+            assert user_id == claims.user_id
+            return user
+
+    monkeypatch.setattr(main, "_decode_access_token_claims", lambda _token: claims)
+    auth_cache.clear_revocation_cache()
+
+    first = main.get_current_user(authorization="Bearer token-a", db=FakeDB())
+    second = main.get_current_user(authorization="Bearer token-a", db=FakeDB())
+    auth_cache.clear_revocation_cache()
+
+    assert first is user
+    assert second is user
+    assert calls == {"execute": 1, "get": 1}
+
+
+def test_registration_rate_limit_evicts_stale_keys_when_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(main.settings, "auth_register_rate_limit_window_minutes", 1)
+    monkeypatch.setattr(main, "REGISTER_ATTEMPTS_MAX_KEYS", 2)
+    main.REGISTER_ATTEMPTS.clear()
+    main.REGISTER_ATTEMPTS["stale-ip"] = main.deque([time.time() - 3600])
+    main.REGISTER_ATTEMPTS["active-ip"] = main.deque([time.time()])
+
+    main._enforce_registration_rate_limit("new-ip")
+
+    assert set(main.REGISTER_ATTEMPTS) == {"active-ip", "new-ip"}
+    main.REGISTER_ATTEMPTS.clear()
+
+
+def test_home_returns_304_when_etag_matches() -> None:
+    first = asyncio.run(main.home(request=SimpleNamespace(headers={})))
+    etag = first.headers["etag"]
+
+    second = asyncio.run(main.home(request=SimpleNamespace(headers={"if-none-match": etag})))
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+
+
+def test_home_revalidates_and_reloads_on_change_in_dev(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    index_path = tmp_path / "index.html"
+    index_path.write_bytes(b"<p>v1</p>")
+    monkeypatch.setattr(main, "web_dir", tmp_path)
+    monkeypatch.setattr(main.settings, "app_env", "dev")
+    for attr in ("index_html", "index_etag", "index_mtime_ns"):
+        monkeypatch.delattr(main.app.state, attr, raising=False)
+
+    first = asyncio.run(main.home(request=SimpleNamespace(headers={})))
+    index_path.write_bytes(b"<p>v2</p>")
+    os.utime(index_path, ns=(0, index_path.stat().st_mtime_ns + 1_000_000))
+    second = asyncio.run(main.home(request=SimpleNamespace(headers={"if-none-match": first.headers["etag"]})))
+    monkeypatch.delattr(main.app.state, "index_mtime_ns")
+
+    assert first.headers["cache-control"] == "no-cache"
+    assert first.body == b"<p>v1</p>"
+    assert second.status_code == 200
+    assert second.body == b"<p>v2</p>"
+
+
+def test_health_is_never_cached() -> None:
+    response = main.Response()
+    payload = asyncio.run(main.health(response=response))
+
+    assert payload["status"] == "ok"
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_auth_login_offloads_password_check_and_rejects_wrong_password() -> None:
+    user = SimpleNamespace(
+        id=uuid4(),
+        password_hash=main.hash_password("correct-password"),
+        is_active=True,
+        email_verified=True,
+    )
+
+    class FakeDB:
+        def scalar(self, _stmt):
+            return user
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(main.auth_login(email="User@Example.com", password="wrong-password", db=FakeDB()))
+
+    assert exc_info.value.status_code == 401
+
+
+def test_auth_login_skips_rehash_for_inactive_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = SimpleNamespace(id=uuid4(), password_hash="stored-hash", is_active=False, email_verified=True)
+    hashed: list[str] = []
+
+    class FakeDB:
+        def scalar(self, _stmt):
+            return user
+
+    monkeypatch.setattr(main, "verify_password", lambda _password, _encoded_hash: True)
+    monkeypatch.setattr(main, "password_needs_rehash", lambda _encoded_hash: True)
+    monkeypatch.setattr(main, "hash_password", lambda password: hashed.append(password) or "new-hash")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(main.auth_login(email="user@example.com", password="correct-password", db=FakeDB()))
+
+    assert exc_info.value.status_code == 403
+    assert hashed == []
+    assert user.password_hash == "stored-hash"
+
+
+def test_me_ingest_watch_complexes_uses_session_per_task(monkeypatch: pytest.MonkeyPatch) -> None:
+    task_sessions: list[object] = []
+
+    class FakeTaskSession:
+        def __enter__(self):
+            task_sessions.append(self)
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+    def fake_ingest(db, complex_no, **_kwargs):
+        assert isinstance(db, FakeTaskSession)
+        if complex_no == 2:
+            raise RuntimeError("Naver API HTTP error: 403 Forbidden")
+        return {"complex_no": complex_no, "listing_count": 3, "reused": 0}
+
+    class FakeDB:
+        def execute(self, _stmt):
+            watches = [(no, f"c{no}") for no in (3, 1, 2)]
+            return SimpleNamespace(all=lambda: watches)
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(main, "ingest_complex_snapshot", fake_ingest)
+    monkeypatch.setattr(main, "get_session_factory", lambda: FakeTaskSession)
+
+    payload = main.me_ingest_watch_complexes(
+        page=1, max_pages=1, force=False, current_user=SimpleNamespace(id=1), db=FakeDB()
+    )
+
+    assert len(task_sessions) == 3
+    assert [item["complex_no"] for item in payload["results"]] == [1, 2, 3]
+    assert payload["success_count"] == 2
+    assert payload["failure_count"] == 1
+    assert payload["total_listing_count"] == 6
+
+
+def test_me_presets_serializes_row_mappings() -> None:
+    preset_id = uuid4()
+    created_at = datetime(2026, 2, 14, 9, 30, tzinfo=UTC)
+
+    class FakeDB:
+        def execute(self, _stmt):
+            row = RowMappingLike(
+                {
+                    "id": preset_id,
+                    "name": "강남",
+                    "target_type": "complex",
+                    "filter_payload": {"complex_nos": [2977]},
+                    "chart_payload": {},
+                    "created_at": created_at,
+                    "updated_at": None,
+                }
+            )
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(all=lambda: [row]))
+
+    response = main.me_presets(current_user=SimpleNamespace(id=1), db=FakeDB())
+    payload = json.loads(response.body)
+
+    assert payload["items"][0]["id"] == str(preset_id)
+    assert payload["items"][0]["created_at"] == created_at.isoformat()
+    assert payload["items"][0]["updated_at"] is None
+
+
+def test_load_scheduler_snapshot_is_cached_until_cleared() -> None:
+    class FakeDB:
+        def __init__(self) -> None:
+            self.get_calls = 0
+
+        def get(self, _model, _pk):
+            self.get_calls += 1
+            return SimpleNamespace(
+                enabled=True,
+                timezone="Asia/Seoul",
+                times_csv="18:00,09:00",
+                poll_seconds=20,
+                reuse_bucket_hours=12,
+            )
+
+    db = FakeDB()
+    main._clear_scheduler_snapshot_cache()
+    try:
+        first = main._load_scheduler_snapshot(db=db)
+        second = main._load_scheduler_snapshot(db=db)
+        assert first is second
+        assert first.times == ("09:00", "18:00")
+        assert db.get_calls == 1
+
+        main._clear_scheduler_snapshot_cache()
+        main._load_scheduler_snapshot(db=db)
+        assert db.get_calls == 2
+    finally:
+        main._clear_scheduler_snapshot_cache()
+
+
+def test_me_update_notification_settings_uses_update_returning() -> None:
+    updated_at = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.commits = 0
+
+        def execute(self, _stmt):
+            row = SimpleNamespace(
+                email_enabled=False,
+                email_address="a@example.com",
+                telegram_enabled=False,
+                telegram_chat_id=None,
+                bargain_alert_enabled=True,
+                bargain_lookback_days=45,
+                bargain_discount_threshold=0.08,
+                interest_trade_type="ALL",
+                monthly_rent_conversion_rate_pct=None,
+                updated_at=updated_at,
+            )
+            return SimpleNamespace(first=lambda: row)
+
+        def commit(self) -> None:
+            self.commits += 1
+
+        def refresh(self, _obj) -> None:
+            raise AssertionError("refresh should not be needed after UPDATE ... RETURNING")
+
+    db = FakeDB()
+    payload = main.me_update_notification_settings(
+        email_enabled=None,
+        email_address=None,
+        telegram_enabled=None,
+        telegram_chat_id=None,
+        bargain_alert_enabled=None,
+        bargain_lookback_days=45,
+        bargain_discount_threshold=None,
+        interest_trade_type=None,
+        monthly_rent_conversion_rate_pct=None,
+        monthly_rent_conversion_rate_use_default=None,
+        current_user=SimpleNamespace(id=uuid4(), email="a@example.com"),
+        db=db,
+    )
+
+    assert db.commits == 1
+    assert payload["bargain_lookback_days"] == 45
+    assert payload["updated_at"] == updated_at.isoformat()
+
+
+def test_auth_refresh_checks_stored_expiry_and_token_hash(monkeypatch: pytest.MonkeyPatch) -> None:
+    user_id = uuid4()
+    jti = uuid4()
+    token_row = SimpleNamespace(token_hash=b"\x00" * 32, revoked_at=None)
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.statements = []
+
+        def scalar(self, stmt):
+            self.statements.append(stmt)
+            return token_row
+
+    monkeypatch.setattr(main, "decode_refresh_token", lambda **_kwargs: (user_id, jti, int(time.time()) + 600))
+    db = FakeDB()
+
+    with pytest.raises(HTTPException) as exc_info:
+        main.auth_refresh(refresh_token="refresh-a", db=db)
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Invalid refresh token"
+    assert token_row.revoked_at is None
+    assert len(db.statements) == 1
+    assert "auth_refresh_tokens.expires_at >" in str(db.statements[0])
+
+
+def test_collection_status_fills_missing_run_fields_with_none(monkeypatch: pytest.MonkeyPatch) -> None:
+    collected_at = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+    snapshot = main.SchedulerSnapshot(
+        enabled=False, timezone="Asia/Seoul", times=("09:00",), poll_seconds=20, reuse_bucket_hours=12
+    )
+    monkeypatch.setattr(main, "_load_scheduler_snapshot", lambda db: snapshot)
+    monkeypatch.setattr(
+        main,
+        "_fetch_collection_status_rows",
+        lambda db, complex_nos: {2977: (collected_at, "SUCCESS", None, collected_at, 7, 42)},
+    )
+
+    class FakeDB:
+        def scalar(self, _stmt):
+            return 2
+
+        def execute(self, _stmt):
+            watch_row = namedtuple("WatchRow", "id complex_no complex_name enabled created_at")
+            rows = [watch_row(1, 2977, "래미안", True, collected_at), watch_row(2, 1147, "은마", True, None)]
+            return SimpleNamespace(all=lambda: rows)
+
+    response = main.me_watch_complexes_collection_status(current_user=SimpleNamespace(id=1), db=FakeDB())
+    payload = json.loads(response.body)
+    by_complex = {item["complex_no"]: item for item in payload["items"]}
+
+    assert payload["auto_collect"]["configured_complex_count"] == 2
+    assert by_complex[2977]["latest_collected_at"] == collected_at.isoformat()
+    assert by_complex[2977]["latest_listing_count"] == 42
+    assert by_complex[1147]["last_run_status"] is None
+    assert by_complex[1147]["created_at"] is None
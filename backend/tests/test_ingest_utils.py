@@ -1,9 +1,11 @@
 import pathlib
 import sys
 from datetime import datetime
+from types import SimpleNamespace
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
+from app.services import ingest
 from app.services.ingest import _resolve_time_bucket
 from app.services.parsers import parse_confirmed_date, price_to_manwon
 
@@ -13,6 +15,9 @@ def test_price_to_manwon_handles_eok_unit() -> None:
     assert price_to_manwon("10억 5,000") == 105000
     assert price_to_manwon("8500") == 8500
     assert price_to_manwon("invalid") is None
+    assert price_to_manwon(" 8,500 ") == 8500
+    assert price_to_manwon(",") is None
+    assert price_to_manwon("10억 abc") == 100000
 
 
 def test_parse_confirmed_date_multiple_formats() -> None:
@@ -28,3 +33,51 @@ def test_resolve_time_bucket_uses_hour_bucket_boundaries() -> None:
 
     assert bucket_start.isoformat() == "2026-02-14T12:00:00"
     assert bucket_end.isoformat() == "2026-02-14T18:00:00"
+
+
+def test_ingest_complex_snapshot_inserts_listings_in_one_batch(monkeypatch) -> None:
+    pages = {
+        1: {"articleList": [{"articleNo": "1", "dealOrWarrantPrc": "10억"}, {"articleNo": "2"}]},
+        2: {"articleList": [{"articleNo": "2"}, {"articleNo": "bad"}, {"articleNo": "3"}]},
+    }
+
+    class FakeClient:
+        def __init__(self, settings) -> None:
+            pass
+
+        def fetch_complex_articles(self, complex_no, page, real_estate_type, trade_type):
+            return pages.get(page, {"articleList": []})
+
+    class FakeDB:
+        def __init__(self) -> None:
+            self.inserts: list[list[dict]] = []
+            self.committed = False
+
+        def add(self, obj) -> None:
+            self.crawl_run = obj
+
+        def flush(self) -> None:
+            self.crawl_run.id = 7
+
+        def execute(self, _stmt, rows):
+            self.inserts.append(list(rows))
+
+        def commit(self) -> None:
+            self.committed = True
+
+    monkeypatch.setattr(ingest, "NaverLandClient", FakeClient)
+    db = FakeDB()
+    result = ingest.ingest_complex_snapshot(
+        db=db,
+        settings=SimpleNamespace(crawler_reuse_window_hours=0),
+        complex_no=2977,
+        max_pages=3,
+    )
+
+    assert len(db.inserts) == 1
+    assert [row["article_no"] for row in db.inserts[0]] == [1, 2, 3]
+    assert db.inserts[0][0]["crawl_run_id"] == 7
+    assert db.inserts[0][0]["deal_price_manwon"] == 100000
+    assert db.committed is True
+    assert result["listing_count"] == 3
+    assert result["pages_fetched"] == 2
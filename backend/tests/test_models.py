@@ -1,11 +1,14 @@
 import pathlib
 import sys
+import time
 
 from sqlalchemy import BigInteger, Boolean, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
-from app.models import BillingCheckoutSession, ListingSnapshot, UserSubscription
+from app.models import BillingCheckoutSession, ListingSnapshot, User, UserPreset, UserSubscription, uuid7
 
 
 def test_listing_snapshot_article_no_uses_bigint() -> None:
@@ -26,3 +29,29 @@ def test_billing_checkout_session_schema_has_dummy_flow_fields() -> None:
     assert isinstance(table.status.type, String)
     assert isinstance(table.provider.type, String)
     assert table.checkout_token.unique is True
+
+
+def test_uuid7_is_rfc_v7_and_time_ordered() -> None:
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == "specified in RFC 4122"
+    assert first.int >> 80 <= time.time_ns() // 1_000_000
+    assert first < second
+
+
+def test_user_and_preset_ids_default_to_uuid7() -> None:
+    for model in (User, UserPreset):
+        default = model.__table__.c.id.default
+        assert default.is_callable
+        assert default.arg(None).version == 7
+
+
+def test_listing_snapshot_has_covering_complex_time_index() -> None:
+    index = next(index for index in ListingSnapshot.__table__.indexes if index.name == "ix_snap_complex_time_cover")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "(complex_no, observed_at DESC)" in ddl
+    assert "INCLUDE (deal_price_manwon, rent_price_manwon, trade_type_name)" in ddl
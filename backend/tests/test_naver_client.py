@@ -64,6 +64,45 @@ def test_fetch_complex_articles_raises_when_api_returns_failure(monkeypatch: pyt
         client.fetch_complex_articles(complex_no=2977, page=1)
 
 
+def test_fetch_complex_articles_cached_reuses_upstream_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings(crawler_max_retry=1, crawler_timeout_seconds=1.0)
+    client = naver_client.NaverLandClient(settings=settings)
+    naver_client.clear_articles_cache()
+
+    calls = {"count": 0}
+
+    def fake_urlopen(_request, timeout):
+        calls["count"] += 1
+        return _FakeResponse(b'{"success":true,"articleList":[{"articleNo":"1"}]}')
+
+    monkeypatch.setattr(naver_client, "urlopen", fake_urlopen)
+
+    first = client.fetch_complex_articles_cached(complex_no=1, page=1)
+    second = client.fetch_complex_articles_cached(complex_no=1, page=1)
+    client.fetch_complex_articles_cached(complex_no=1, page=2)
+    naver_client.clear_articles_cache()
+
+    assert first is second
+    assert calls["count"] == 2
+
+
+def test_fetch_complex_articles_cached_releases_key_lock_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings(crawler_max_retry=1, crawler_timeout_seconds=1.0)
+    client = naver_client.NaverLandClient(settings=settings)
+    naver_client.clear_articles_cache()
+
+    def fake_urlopen(_request, timeout):
+        return _FakeResponse(b'{"success":false,"code":"TOO_MANY_REQUESTS","message":"Rate limit exceeded"}')
+
+    monkeypatch.setattr(naver_client, "urlopen", fake_urlopen)
+
+    with pytest.raises(RuntimeError):
+        client.fetch_complex_articles_cached(complex_no=1, page=1)
+
+    assert naver_client._ARTICLES_KEY_LOCKS == {}
+    assert (1, 1) not in naver_client._ARTICLES_CACHE
+
+
 def test_search_complexes_retries_on_429_and_returns_normalized_items(monkeypatch: pytest.MonkeyPatch) -> None:
     settings = Settings(crawler_max_retry=2, crawler_timeout_seconds=1.0)
     client = naver_client.NaverLandClient(settings=settings)
@@ -117,6 +156,15 @@ def test_summarize_search_complexes_handles_nested_payload_shape() -> None:
     assert items[1]["complex_name"] == "래미안 원베일리"
 
 
+def test_summarize_articles_stops_at_limit() -> None:
+    payload = {"articleList": [{"articleNo": str(idx), "tradeTypeName": "매매"} for idx in range(20)]}
+
+    items = naver_client.NaverLandClient.summarize_articles(payload, limit=3)
+
+    assert [item["article_no"] for item in items] == ["0", "1", "2"]
+    assert len(naver_client.NaverLandClient.summarize_articles(payload)) == 20
+
+
 def test_default_headers_include_cookie_when_configured() -> None:
     settings = Settings(naver_land_cookie="NID_SES=abc123; NID_AUT=def456")
     client = naver_client.NaverLandClient(settings=settings)
@@ -20,24 +20,17 @@ class FakeScalarResult:
 
 
 class FakeDB:
-    def __init__(self, watcher_user_ids=None):
-        self.watcher_user_ids = watcher_user_ids or []
-        self.users = {}
-        self.notification_settings = {}
+    def __init__(self, recipients=None):
+        # (user, notification_setting) pairs, as returned by the joined recipients query.
+        self.recipients = recipients or []
         self.commits = 0
         self.rollbacks = 0
         self.closed = False
 
-    def scalars(self, _stmt):
-        return FakeScalarResult(self.watcher_user_ids)
+    def execute(self, _stmt):
+        return FakeScalarResult(self.recipients)
 
     def get(self, model, key):
-        if model is scheduler_module.User:
-            return self.users.get(key)
-        if model is scheduler_module.UserNotificationSetting:
-            return self.notification_settings.get(key)
-        if model is scheduler_module.SchedulerConfig:
-            return None
         return None
 
     def commit(self):
@@ -49,6 +42,12 @@ class FakeDB:
     def close(self):
         self.closed = True
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return None
+
 
 def _build_settings():
     return SimpleNamespace(
@@ -57,8 +56,11 @@ def _build_settings():
         scheduler_times_csv="09:00,18:00",
         scheduler_poll_seconds=20,
         scheduler_complex_nos_csv="2977",
+        scheduler_config_cache_seconds=60,
         crawler_reuse_window_hours=12,
         jeonse_monthly_conversion_rate_default=5.1,
+        analytics_baseline_view_enabled=False,
+        alert_dispatch_parallelism=4,
     )
 
 
@@ -68,22 +70,23 @@ def test_dispatch_daily_briefing_only_first_time(monkeypatch) -> None:
     timezone = ZoneInfo("Asia/Seoul")
 
     active_user_id = uuid4()
-    inactive_user_id = uuid4()
-    db = FakeDB(watcher_user_ids=[active_user_id, inactive_user_id])
-    db.users[active_user_id] = SimpleNamespace(id=active_user_id, is_active=True)
-    db.users[inactive_user_id] = SimpleNamespace(id=inactive_user_id, is_active=False)
-    db.notification_settings[active_user_id] = SimpleNamespace(
-        email_enabled=True,
-        telegram_enabled=False,
+    muted_user_id = uuid4()
+    db = FakeDB(
+        recipients=[
+            (SimpleNamespace(id=active_user_id), SimpleNamespace(email_enabled=True, telegram_enabled=False)),
+            (SimpleNamespace(id=muted_user_id), SimpleNamespace(email_enabled=False, telegram_enabled=False)),
+        ]
     )
 
+    task_db = FakeDB()
     calls = []
 
     def fake_dispatch_user_daily_briefing(**kwargs):
-        calls.append(kwargs["user"].id)
+        calls.append((kwargs["user"].id, kwargs["db"]))
         return {"email_sent": 1, "telegram_sent": 0}
 
     monkeypatch.setattr(scheduler_module, "dispatch_user_daily_briefing", fake_dispatch_user_daily_briefing)
+    monkeypatch.setattr(scheduler_module, "get_session_factory", lambda: lambda: task_db)
 
     scheduler._dispatch_daily_briefings_for_first_time(
         db=db,
@@ -92,8 +95,8 @@ def test_dispatch_daily_briefing_only_first_time(monkeypatch) -> None:
         times={"09:00", "18:00"},
     )
 
-    assert calls == [active_user_id]
-    assert db.commits == 1
+    assert calls == [(active_user_id, task_db)]
+    assert (db.commits, task_db.commits) == (0, 1)
 
 
 def test_dispatch_daily_briefing_skips_non_first_time(monkeypatch) -> None:
@@ -101,11 +104,8 @@ def test_dispatch_daily_briefing_skips_non_first_time(monkeypatch) -> None:
     scheduler = scheduler_module.CrawlScheduler(settings=settings)
     timezone = ZoneInfo("Asia/Seoul")
     user_id = uuid4()
-    db = FakeDB(watcher_user_ids=[user_id])
-    db.users[user_id] = SimpleNamespace(id=user_id, is_active=True)
-    db.notification_settings[user_id] = SimpleNamespace(
-        email_enabled=True,
-        telegram_enabled=False,
+    db = FakeDB(
+        recipients=[(SimpleNamespace(id=user_id), SimpleNamespace(email_enabled=True, telegram_enabled=False))]
     )
 
     calls = []
@@ -180,6 +180,56 @@ def test_run_if_due_calls_daily_briefing_dispatch(monkeypatch) -> None:
     assert db.closed is True
 
 
+
+def test_run_if_due_refreshes_baseline_view_before_dispatching_alerts(monkeypatch) -> None:
+    settings = _build_settings()
+    settings.analytics_baseline_view_enabled = True
+    scheduler = scheduler_module.CrawlScheduler(settings=settings)
+    db = FakeDB()
+    events: list[tuple[str, int | None]] = []
+
+    class FixedDateTime:
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 2, 14, 18, 0, tzinfo=tz)
+
+    monkeypatch.setattr(scheduler_module, "datetime", FixedDateTime)
+    monkeypatch.setattr(scheduler_module, "get_session_factory", lambda: lambda: db)
+    monkeypatch.setattr(
+        scheduler,
+        "_load_runtime_config",
+        lambda db: {
+            "enabled": True,
+            "timezone": "Asia/Seoul",
+            "times": {"09:00", "18:00"},
+            "poll_seconds": 20,
+            "complex_nos": [2977, 1147],
+            "reuse_bucket_hours": 12,
+        },
+    )
+    monkeypatch.setattr(
+        scheduler_module,
+        "ingest_complex_snapshot",
+        lambda **kwargs: events.append(("ingest", kwargs["complex_no"])) or {"crawl_run_id": 1},
+    )
+    monkeypatch.setattr(scheduler_module, "refresh_price_baseline_view", lambda db: events.append(("refresh", None)))
+    monkeypatch.setattr(
+        scheduler,
+        "_dispatch_alerts_for_complex",
+        lambda db, complex_no: events.append(("dispatch", complex_no)),
+    )
+    monkeypatch.setattr(scheduler, "_dispatch_daily_briefings_for_first_time", lambda **_kwargs: None)
+
+    scheduler._run_if_due()
+
+    assert events == [
+        ("ingest", 2977),
+        ("ingest", 1147),
+        ("refresh", None),
+        ("dispatch", 2977),
+        ("dispatch", 1147),
+    ]
+
 def test_build_daily_briefing_text_contains_summary_sections() -> None:
     text = build_daily_briefing_text(
         {
@@ -224,3 +274,20 @@ def test_build_daily_briefing_text_contains_summary_sections() -> None:
     assert "2) 전체 관심단지 요약" in text
     assert "3) 급매 후보 요약" in text
     assert "래미안 대치팰리스" in text
+
+
+def test_runtime_config_is_reused_within_cache_window(monkeypatch) -> None:
+    scheduler = scheduler_module.CrawlScheduler(settings=_build_settings())
+    loads = []
+    monkeypatch.setattr(scheduler, "_load_runtime_config", lambda db: loads.append(db) or {"poll_seconds": 20})
+    clock = [100.0]
+    monkeypatch.setattr(scheduler_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    first = scheduler._get_runtime_config(db=FakeDB())
+    clock[0] = 159.0
+    second = scheduler._get_runtime_config(db=FakeDB())
+    clock[0] = 160.0
+    scheduler._get_runtime_config(db=FakeDB())
+
+    assert first is second
+    assert len(loads) == 2